@@ -0,0 +1,75 @@
+"""
+Стоимость одного dxf файла детали: новый документ, прототип, native.
+
+Запуск: python benchmarks/ezdxf_document.py [количество] [шаблон.dxf]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ezdxf.document import Drawing  # noqa: E402
+from ezdxf.layouts import Modelspace  # noqa: E402
+
+from services.frames.ezdxf import EzDxfPrototype, EzDxfService  # noqa: E402
+from services.frames.native_dxf import NativeDxfDocument  # noqa: E402
+
+
+def draw_part(
+    document: Drawing | NativeDxfDocument,
+    model_space: Modelspace | NativeDxfDocument,
+    n: int,
+) -> None:
+    """Чертит деталь, как стойку: контур, отверстия, сохранение."""
+    width = 100 + n % 50
+    model_space.add_polyline2d(
+        points=[(0, 0), (0, 2000), (width, 2000), (width, 0)], close=True
+    )
+    for y in (100, 1000, 1900):
+        model_space.add_circle(center=(20, y), radius=3)
+    model_space.add_polyline2d(
+        points=[(40, 1200), (40, 1300), (60, 1300), (60, 1200)], close=True
+    )
+    EzDxfService.get_document_data(document)
+
+
+def run(count: int, template: str | None) -> None:
+    """Выводит среднее время файла детали, мс."""
+    start = perf_counter()
+    for n in range(count):
+        draw_part(*EzDxfService.get_new_document_and_model_space(), n)
+    new_time = (perf_counter() - start) / count * 1000
+
+    prototype = EzDxfPrototype(template)
+    start = perf_counter()
+    for n in range(count):
+        draw_part(*prototype.get_document_and_model_space(), n)
+    prototype_time = (perf_counter() - start) / count * 1000
+
+    native_template = prototype.get_native_template()
+    start = perf_counter()
+    for n in range(count):
+        document = native_template.new_document()
+        draw_part(document, document.modelspace(), n)
+    native_time = (perf_counter() - start) / count * 1000
+
+    sys.stdout.write(f"Файлов: {count}" + "\n")
+    sys.stdout.write(
+        f"Новый документ (ezdxf.new): {new_time:.2f} мс/файл" + "\n"
+    )
+    sys.stdout.write(f"Прототип: {prototype_time:.2f} мс/файл" + "\n")
+    sys.stdout.write(f"Native: {native_time:.2f} мс/файл" + "\n")
+    sys.stdout.write(
+        f"Ускорение: прототип {new_time / prototype_time:.2f}x, "
+        f"native {new_time / native_time:.2f}x" + "\n"
+    )
+
+
+if __name__ == "__main__":
+    run(
+        count=int(sys.argv[1]) if len(sys.argv) > 1 else 300,
+        template=sys.argv[2] if len(sys.argv) > 2 else None,
+    )
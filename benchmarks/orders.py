@@ -0,0 +1,131 @@
+"""
+Синтетические заказы для бенчмарков: строки замеров в памяти и xlsx.
+
+Запуск: python benchmarks/orders.py файл.xlsx [проёмов] [папка заказа]
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from services.frames.schemas.frames_common.input import (  # noqa: E402
+    FramesBaseInputSchema,
+)
+from services.frames.schemas.frames_one_fold.input import (  # noqa: E402
+    FramesOneFoldInputSchema,
+    HolesInputSchema,
+)
+
+
+# колонка параметров заказа (OrderService.COLUMN), первая строка замеров
+COLUMN_INDEX = 23
+START_ROW = 3
+# параметры заказа: строка колонки X -> значение (path_folder - строка 6)
+ORDER_CELLS: dict[int, Any] = {
+    2: 1,
+    3: "01.01.25",
+    4: "Бенчмарк",
+    9: 900,
+    10: 1,
+    11: 40,
+    12: 2100,
+    14: 6,
+    16: 150,
+    17: 150,
+    18: 1050,
+    19: 20,
+    26: "+",
+}
+PATH_FOLDER_ROW = 6
+
+
+def get_rows(count: int, seed: int = 1) -> list[tuple[Any, ...]]:
+    """
+    Возвращает строки замеров: номер, глубина, ширины, высота, кнопки.
+
+    Размеры - с шагом, как в реальных заказах, поэтому часть строк
+    совпадает и группируется в одну деталь.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    return [
+        (
+            n,
+            rng.randrange(80, 300, 5),
+            rng.randrange(40, 85, 5),
+            rng.randrange(40, 85, 5),
+            rng.randrange(60, 100, 10),
+            "20*40" if rng.random() < 0.1 else None,
+            "20*40" if rng.random() < 0.1 else None,
+        )
+        for n in range(1, count + 1)
+    ]
+
+
+def get_frames_data(
+    rows: list[tuple[Any, ...]],
+) -> tuple[FramesOneFoldInputSchema, ...]:
+    """Возвращает строки замеров как после чтения листа."""
+    fields = list(FramesOneFoldInputSchema.model_fields)
+    return tuple(
+        FramesOneFoldInputSchema.model_validate(
+            dict(zip(fields, row, strict=True))
+        )
+        for row in rows
+    )
+
+
+def get_base_data(path_folder: str) -> FramesBaseInputSchema:
+    """Возвращает параметры заказа, как в ORDER_CELLS."""
+    return FramesBaseInputSchema(
+        thickness=ORDER_CELLS[10],
+        height_platband_stands=ORDER_CELLS[12],
+        doorway=ORDER_CELLS[9],
+        number_order=ORDER_CELLS[2],
+        date_order=ORDER_CELLS[3],
+        name_client=ORDER_CELLS[4],
+        address_order=None,
+        path_folder=path_folder,
+    )
+
+
+def get_holes_data() -> HolesInputSchema:
+    """Возвращает отверстия заказа, как в ORDER_CELLS."""
+    return HolesInputSchema(
+        diameter=ORDER_CELLS[14],
+        top=ORDER_CELLS[16],
+        bottom=ORDER_CELLS[17],
+        middle=ORDER_CELLS[18],
+        from_edge=ORDER_CELLS[19],
+        button_hole_x_center_coordinate=None,
+        button_hole_y_center_coordinate=None,
+    )
+
+
+def write_xlsx(
+    path: str, rows: list[tuple[Any, ...]], path_folder: str
+) -> None:
+    """Записывает лист замеров заказа в xlsx файл."""
+    from openpyxl import Workbook
+
+    cells = ORDER_CELLS | {PATH_FOLDER_ROW: path_folder}
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for n in range(1, max(len(rows) + START_ROW, max(cells) + 1)):
+        i = n - START_ROW
+        row = list(rows[i]) if 0 <= i < len(rows) else []
+        if n in cells:
+            row += [None] * (COLUMN_INDEX - len(row)) + [cells[n]]
+        sheet.append(row)
+    workbook.save(path)
+
+
+if __name__ == "__main__":
+    write_xlsx(
+        sys.argv[1],
+        get_rows(int(sys.argv[2]) if len(sys.argv) > 2 else 1000),
+        sys.argv[3] if len(sys.argv) > 3 else str(Path.cwd()),
+    )
@@ -0,0 +1,295 @@
+"""
+Этапы обработки заказа: чтение, группировка, геометрия, документ, запись.
+
+Для каждого размера синтетического заказа (benchmarks/orders.py) этапы
+замеряются отдельно, время этапа - лучшее из --repeat запусков:
+
+- read - ExcelService.get_rows_data (xlsx, --xlsx-engine);
+- grouping - группировка строк в детали (draw_frames, _get_jobs);
+- geometry - геометрия деталей (пустой кэш геометрии);
+- document - EzDxfService.get_document_and_model_space;
+- draw - черчение элементов деталей;
+- saveas - запись dxf файлов деталей (save_document).
+
+Черчение ограничено --max-files деталями. Результат сравнивается с
+базовыми значениями (--baseline) тех же движков и --max-files, рост времени
+этапа больше --threshold - регрессия, код выхода 1. Базовые значения
+зависят от машины: сохраняются на ней же (--save-baseline). Работает без
+сети, только локальные файлы.
+
+Запуск: python benchmarks/pipeline.py [--sizes 10 1000 10000 100000]
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orders import (  # noqa: E402
+    ORDER_CELLS,
+    get_base_data,
+    get_frames_data,
+    get_holes_data,
+    get_rows,
+    write_xlsx,
+)
+
+from services.excel.sources import get_excel_service  # noqa: E402
+from services.frames.ezdxf import DxfDocument, DxfLayout  # noqa: E402
+from services.frames.frames_one_fold import FramesOneFold  # noqa: E402
+from services.order.schemas.input import OrderOptionsInputSchema  # noqa: E402
+from services.order.service import OrderService  # noqa: E402
+
+
+SIZES = (10, 1_000, 10_000, 100_000)
+STAGES = ("read", "grouping", "geometry", "document", "draw", "saveas")
+BASELINE = Path(__file__).resolve().parent / "baselines" / "pipeline.json"
+# рост времени этапа, после которого он считается регрессией
+THRESHOLD = 0.25
+# изменения меньше (сек) не считаются регрессией: шум коротких этапов
+MIN_DELTA = 0.005
+
+
+class TimedFramesOneFold(FramesOneFold):
+    """Обрамления с замером получения документа и записи файла."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.document_time = 0.0
+        self.save_time = 0.0
+
+    def get_document_and_model_space(self) -> tuple[DxfDocument, DxfLayout]:
+        """Возвращает документ и модель, время - в document_time."""
+        start = perf_counter()
+        try:
+            return super().get_document_and_model_space()
+        finally:
+            self.document_time += perf_counter() - start
+
+    def save_document(self, document: DxfDocument, path: str) -> None:
+        """Сохраняет документ, время - в save_time."""
+        start = perf_counter()
+        try:
+            super().save_document(document, path)
+        finally:
+            self.save_time += perf_counter() - start
+
+
+@contextmanager
+def timer(times: list[float]) -> Iterator[None]:
+    """Добавляет время выполнения блока в times."""
+    start = perf_counter()
+    yield
+    times.append(perf_counter() - start)
+
+
+def run_size(
+    count: int,
+    folder: Path,
+    repeat: int,
+    max_files: int,
+    xlsx_engine: str,
+    dxf_engine: str,
+) -> tuple[dict[str, float], dict[str, int]]:
+    """
+    Замеряет этапы заказа из count проёмов.
+
+    :return: Этап -> время, сек; этап -> количество (строк, деталей,
+        файлов) для времени на единицу.
+    """
+    rows = get_rows(count)
+    xlsx = folder / f"order_{count}.xlsx"
+    write_xlsx(str(xlsx), rows, str(folder))
+    frames_data = get_frames_data(rows)
+    query = OrderService(OrderOptionsInputSchema(use_cache=False)).get_query()
+    rows_query = query.rows["frames_data"]
+    frames = TimedFramesOneFold(
+        base_data=get_base_data(str(folder / "out")),
+        thickness_frames=ORDER_CELLS[11],
+        holes_data=get_holes_data(),
+        dxf_engine=dxf_engine,
+        incremental=False,
+    )
+
+    times: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    units: dict[str, int] = {}
+    for _ in range(repeat):
+        service = get_excel_service(
+            str(xlsx), xlsx_engine=xlsx_engine, read_only=True
+        )
+        with timer(times["read"]), service:
+            service.get_rows_data(
+                sheet_params=query.sheet_params,
+                range_cell_params=rows_query.range_cell_params,
+                columns=rows_query.columns,
+                validate_to_schema=rows_query.validate_to_schema,
+                batch_validation=rows_query.batch_validation,
+                identity_columns=rows_query.identity_columns,
+            )
+
+        with timer(times["grouping"]):
+            jobs, _ = frames._get_jobs(
+                frames_data, need_identical=ORDER_CELLS[26] == "+"
+            )
+
+        FramesOneFold.geometry_cache.clear()
+        with timer(times["geometry"]):
+            frames._fill_geometry_cache(jobs)
+
+        draw_jobs = jobs[:max_files]
+        frames.document_time = frames.save_time = 0.0
+        draw_time: list[float] = []
+        with timer(draw_time):
+            frames._draw_jobs(draw_jobs)
+        times["document"].append(frames.document_time)
+        times["saveas"].append(frames.save_time)
+        times["draw"].append(
+            draw_time[0] - frames.document_time - frames.save_time
+        )
+
+        units = {
+            "read": count,
+            "grouping": count,
+            "geometry": len(jobs),
+            "document": len(draw_jobs),
+            "draw": len(draw_jobs),
+            "saveas": len(draw_jobs),
+        }
+
+    return {stage: min(t) for stage, t in times.items()}, units
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Возвращает регрессии: размер/этап, время и базовое время."""
+    regressions = []
+    for size, stages in results.items():
+        for stage, seconds in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if (
+                base is not None
+                and seconds > base * (1 + threshold)
+                and seconds - base > MIN_DELTA
+            ):
+                regressions.append(
+                    f"{size}/{stage}: {seconds:.4f} сек, "
+                    f"базовое {base:.4f} сек (+{seconds / base - 1:.0%})"
+                )
+    return regressions
+
+
+def write_table(
+    results: dict[str, dict[str, float]],
+    units: dict[str, dict[str, int]],
+    baseline: dict[str, dict[str, float]],
+    write: Callable[[str], Any],
+) -> None:
+    """Выводит таблицу: время этапа, на единицу и изменение к базовому."""
+    write(
+        f"{'Проёмов':>8} {'Этап':<9} {'Время, сек':>11} {'Единиц':>7} "
+        f"{'мкс/ед.':>9} {'Базовое':>9} {'Изм.':>6}" + "\n"
+    )
+    for size, stages in results.items():
+        for stage, seconds in stages.items():
+            count = units[size][stage]
+            per_unit = seconds / count * 1_000_000 if count else 0
+            base = baseline.get(size, {}).get(stage)
+            change = f"{seconds / base - 1:+.0%}" if base else ""
+            base_text = f"{base:.4f}" if base is not None else ""
+            write(
+                f"{size:>8} {stage:<9} {seconds:>11.4f} {count:>7} "
+                f"{per_unit:>9.1f} {base_text:>9} {change:>6}" + "\n"
+            )
+
+
+def get_args() -> argparse.Namespace:
+    """Возвращает аргументы командной строки."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max-files",
+        type=int,
+        default=500,
+        help="Максимум чертимых деталей заказа.",
+    )
+    parser.add_argument(
+        "--xlsx-engine", choices=["stream", "openpyxl"], default="stream"
+    )
+    parser.add_argument(
+        "--dxf-engine", choices=["ezdxf", "native"], default="ezdxf"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Сохранить результат как базовые значения.",
+    )
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> int:
+    """Замеряет этапы, возвращает код выхода (1 - есть регрессии)."""
+    results: dict[str, dict[str, float]] = {}
+    units: dict[str, dict[str, int]] = {}
+    with TemporaryDirectory() as folder:
+        for count in args.sizes:
+            results[str(count)], units[str(count)] = run_size(
+                count,
+                Path(folder),
+                repeat=args.repeat,
+                max_files=args.max_files,
+                xlsx_engine=args.xlsx_engine,
+                dxf_engine=args.dxf_engine,
+            )
+
+    # базовые значения по параметрам замера: конфигурация -> размер -> этап
+    config = f"{args.xlsx_engine}-{args.dxf_engine}-{args.max_files}"
+    baselines: dict[str, dict[str, dict[str, float]]] = {}
+    if args.baseline.exists():
+        baselines = json.loads(args.baseline.read_text(encoding="utf-8"))
+    baseline = baselines.get(config, {})
+
+    write_table(results, units, baseline, sys.stdout.write)
+
+    if args.save_baseline:
+        baselines[config] = baseline | results
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(baselines, indent=1), encoding="utf-8"
+        )
+        sys.stdout.write(f"Базовые значения: {args.baseline}" + "\n")
+        return 0
+
+    if not baseline:
+        sys.stdout.write(
+            "Базовых значений нет, сохраните их: --save-baseline." + "\n"
+        )
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    sys.stdout.write("\n")
+    if not regressions:
+        sys.stdout.write("Регрессий нет." + "\n")
+        return 0
+
+    sys.stdout.write(f"Регрессии (рост больше {args.threshold:.0%}):" + "\n")
+    for regression in regressions:
+        sys.stdout.write(regression + "\n")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run(get_args()))
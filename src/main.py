@@ -1,29 +1,41 @@
+import argparse
+import csv
+import json
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import date
-from sys import stdout
-from time import perf_counter, sleep
+from multiprocessing import freeze_support
+from pathlib import Path
+from sys import stderr, stdout
+from time import perf_counter, process_time, sleep
+from typing import TYPE_CHECKING, Any
 
 from logs.config import logging_config
 from logs.schemas import LogLevelsEnum
 from services.excel.exceptions import ExcelNeverError, ExcelValueFromUserError
-from services.excel.schemas.input import RangeCellInputSchema, SheetInputSchema
-from services.excel.service import ExcelService
 from services.frames.exception import FramesNeverError
-from services.frames.frames_one_fold import FramesOneFold
-from services.frames.schemas.frames_common.input import FramesBaseInputSchema
-from services.frames.schemas.frames_one_fold.input import (
-    FramesOneFoldConstructionInputSchema,
-    FramesOneFoldInputSchema,
-    HolesInputSchema,
-)
+from services.metrics.service import MetricsService
 from services.start_limiter.exception import StartLimiterError
 from services.start_limiter.service import SimpleStartLimiter
 
 
-def main(excel_file_name: str) -> None:
-    """Главная функция."""
-    column = "X"
+if TYPE_CHECKING:
+    from services.order.schemas.input import OrderOptionsInputSchema
+    from services.order.schemas.output import (
+        OrderOutputSchema,
+        OrderQuoteOutputSchema,
+    )
+
+# Сервисы заказов (pydantic, openpyxl, ezdxf, numpy) импортируются в функциях
+# режимов после configure: --help и проверка ограничителя запуска не ждут
+# их загрузки, процессы пула не загружают лишнего.
+
+DEFAULT_EXCEL_FILE_NAME = "Обрамления.xlsx"
 
+
+def configure() -> None:
+    """Настройки запуска: логирование, ограничитель запуска."""
     # Настройки логирования
     logging_config(LogLevelsEnum.DEBUG)
     # Отключение loggers библиотек
@@ -33,89 +45,192 @@ def main(excel_file_name: str) -> None:
     # Закомментировать, если не нужно
     SimpleStartLimiter(date(2024, 12, 23))()
 
-    # Получение данных из schemas файла
-    excel_service = ExcelService(excel_file_name)
-    sheet_params = SheetInputSchema(index=0)
-
-    # открытие файла
-    with excel_service:
-        # Базовые данные
-        base_data = excel_service.get_cell_values(
-            sheet_params=sheet_params,
-            cells={
-                "number_order": f"{column}2",
-                "date_order": f"{column}3",
-                "name_client": f"{column}4",
-                "address_order": f"{column}5",
-                "path_folder": f"{column}6",
-                "doorway": f"{column}9",
-                "thickness": f"{column}10",
-                "height_platband_stands": f"{column}12",
-            },
-            validate_to_schema=FramesBaseInputSchema,
-        )
 
-        # Данные по отверстиям под крепления, кнопки
-        holes_data = excel_service.get_cell_values(
-            sheet_params=sheet_params,
-            cells={
-                "diameter": f"{column}14",
-                "top": f"{column}16",
-                "bottom": f"{column}17",
-                "middle": f"{column}18",
-                "from_edge": f"{column}19",
-                "button_hole_x_center_coordinate": f"{column}22",
-                "button_hole_y_center_coordinate": f"{column}23",
-            },
-            validate_to_schema=HolesInputSchema,
+def main(
+    excel_file_name: str, options: "OrderOptionsInputSchema | None" = None
+) -> None:
+    """Главная функция."""
+    configure()
+
+    from services.order.service import OrderService
+
+    result = OrderService(options).process(excel_file_name)
+
+    write_order_result(result)
+
+
+def main_batch(
+    paths: list[str],
+    max_workers: int | None = None,
+    options: "OrderOptionsInputSchema | None" = None,
+) -> None:
+    """Пакетная обработка заказов (файлы и папки с файлами)."""
+    configure()
+
+    from services.order.service import BatchOrderService
+
+    files = BatchOrderService.get_files(paths)
+    if not files:
+        stdout.write("Файлы заказов не найдены." + "\n")
+        return
+
+    stdout.write(f"Заказов к обработке - {len(files)}." + "\n")
+    results = BatchOrderService(
+        max_workers=max_workers, options=options
+    ).process(files)
+
+    # Сводка по заказам
+    stdout.write("\n")
+    stdout.write("Сводка по заказам:" + "\n")
+    for result in results:
+        if result.error:
+            stdout.write(f"{result.file} - ОШИБКА. {result.error}" + "\n")
+            continue
+
+        stdout.write(
+            f"{result.file} - файлов: {len(result.results)}, "
+            f"строк с ошибкой: {len(result.frames_data_exc)}, "
+            f"ошибок записи: {len(result.write_errors)}, "
+            f"папка: {result.path_folder}." + "\n"
         )
 
-        # Данные по особенностям конструкции
-        construction_data = excel_service.get_cell_values(
-            sheet_params=sheet_params,
-            cells={
-                "thickness_frames": f"{column}11",
-            },
-            validate_to_schema=FramesOneFoldConstructionInputSchema,
+    errors = [r for r in results if r.error]
+    stdout.write("\n")
+    stdout.write(
+        f"Обработано заказов - {len(results) - len(errors)}, "
+        f"с ошибкой - {len(errors)}." + "\n"
+    )
+
+
+def main_quote(
+    paths: list[str],
+    output_format: str,
+    options: "OrderOptionsInputSchema | None" = None,
+) -> None:
+    """Расчёт заказов без черчения: сводка в stdout (json или csv)."""
+    configure()
+
+    from services.order.service import BatchOrderService, quote_order
+
+    quotes = [
+        quote_order(file, options)
+        for file in BatchOrderService.get_files(paths)
+    ]
+    write_quotes(quotes, output_format)
+
+
+def main_serve(
+    host: str,
+    port: int,
+    max_workers: int | None = None,
+    max_queue: int = 64,
+    options: "OrderOptionsInputSchema | None" = None,
+) -> None:
+    """Сервер заказов: тёплый процесс с HTTP API очереди заданий."""
+    configure()
+
+    from services.server.api import OrderHttpServer
+    from services.server.service import OrderJobService
+
+    with OrderJobService(
+        max_workers=max_workers, max_queue=max_queue, options=options
+    ) as jobs:
+        server = OrderHttpServer((host, port), jobs)
+        stdout.write(
+            f"Сервер заказов: http://{host}:{server.server_port} "
+            f"(потоков - {jobs.max_workers}, очередь - {max_queue}). "
+            "Остановка - Ctrl+C." + "\n"
         )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            stdout.write("Остановка сервера, ожидание заданий." + "\n")
+        finally:
+            server.server_close()
 
-        # Данные по обрамлениям
-        frames_data, frames_data_exc = excel_service.get_rows_data(
-            sheet_params=sheet_params,
-            range_cell_params=RangeCellInputSchema(
-                start_row=3,
-                end_row=353,
-                start_column=1,
-                end_column=7,
-            ),
-            columns={
-                1: "number",
-                2: "depth",
-                3: "width_left",
-                4: "width_right",
-                5: "height_top",
-                6: "button_hole_left",
-                7: "button_hole_right",
-            },
-            validate_to_schema=FramesOneFoldInputSchema,
+
+def main_watch(
+    inbox: str,
+    poll_interval: float,
+    debounce: float,
+    max_workers: int | None = None,
+    max_queue: int = 64,
+    options: "OrderOptionsInputSchema | None" = None,
+) -> None:
+    """Папка входящих заказов: тёплый процесс обрабатывает новые файлы."""
+    configure()
+
+    from services.server.service import OrderJobService
+    from services.watcher.service import OrderWatchService
+
+    with OrderJobService(
+        max_workers=max_workers, max_queue=max_queue, options=options
+    ) as jobs:
+        watcher = OrderWatchService(jobs, inbox, debounce=debounce)
+        stdout.write(
+            f"Папка входящих заказов: {watcher.inbox.resolve()} "
+            f"(обработанные - {watcher.done_folder}, с ошибкой - "
+            f"{watcher.failed_folder}). Остановка - Ctrl+C." + "\n"
         )
+        try:
+            watcher.run(poll_interval)
+        except KeyboardInterrupt:
+            stdout.write("Остановлено." + "\n")
+
 
-        need_identical = (
-            True
-            if excel_service.get_cell_values(
-                sheet_params,
-                cells=(f"{column}26",),
-            )[0]
-            == "+"
-            else False
+def main_startup_report() -> None:
+    """Время запуска: загрузка модулей режимов обработки."""
+    from services.startup.service import StartupTimeService
+
+    stdout.write(
+        f"Запуск интерпретатора и main (процессорное время) - "
+        f"{process_time() * 1000:.1f} мс." + "\n"
+    )
+    service = StartupTimeService()
+    stdout.write(service.get_report(service.get_modules()) + "\n")
+
+
+def write_quotes(
+    quotes: "list[OrderQuoteOutputSchema]", output_format: str
+) -> None:
+    """Выводит расчёт заказов: json - полный, csv - строка на деталь."""
+    if output_format == "json":
+        stdout.write(
+            json.dumps(
+                [q.model_dump(mode="json") for q in quotes],
+                ensure_ascii=False,
+                indent=1,
+            )
+            + "\n"
         )
+        return
+
+    writer = csv.writer(stdout, lineterminator="\n")
+    writer.writerow(
+        ("file", "file_name", "kind", "count", "square", "weight", "error")
+    )
+    for quote in quotes:
+        if quote.quote is None:
+            writer.writerow((quote.file, "", "", "", "", "", quote.error))
+            continue
+        for part in quote.quote.parts:
+            writer.writerow(
+                (
+                    quote.file,
+                    part.file_name,
+                    part.kind,
+                    part.count,
+                    part.square,
+                    part.weight,
+                    "",
+                )
+            )
 
-    # Черчение обрамлений
-    results, average_weight = FramesOneFold(
-        base_data=base_data,
-        thickness_frames=construction_data.thickness_frames,
-        holes_data=holes_data,
-    ).draw_frames(frames_data=frames_data, need_identical=need_identical)
+
+def write_order_result(result: "OrderOutputSchema") -> None:
+    """Выводит результат обработки заказа."""
+    frames_data_exc = result.frames_data_exc
+    results = result.results
 
     # Сообщение о выполнении / статистика
     if frames_data_exc:
@@ -128,6 +243,30 @@ def main(excel_file_name: str) -> None:
         stdout.write(str(frames_data_exc))
         stdout.write("\n")
 
+    # Повторное черчение: начерчены только изменённые детали
+    if results and result.drawn_count < len(results):
+        stdout.write("\n")
+        stdout.write(
+            f"Начерчено файлов - {result.drawn_count} из {len(results)}, "
+            "остальные не изменились." + "\n"
+        )
+    if result.deleted_files:
+        stdout.write(
+            f"Удалены устаревшие файлы - {len(result.deleted_files)}: "
+            f"{result.deleted_files}." + "\n"
+        )
+
+    write_merged_rows(result.merged_rows)
+
+    # Ошибки записи файлов
+    if result.write_errors:
+        stdout.write("\n")
+        stdout.write(
+            f"Не удалось записать файлы ({len(result.write_errors)}):" + "\n"
+        )
+        for path, error in result.write_errors.items():
+            stdout.write(f"{path} - {error}" + "\n")
+
     # Вывод результатов
     if results:
         stdout.write("\n")
@@ -143,20 +282,83 @@ def main(excel_file_name: str) -> None:
             f"{len(rows_all)}." + "\n"
         )
 
+    if result.combined_file:
+        stdout.write(f"Общий файл деталей: {result.combined_file}." + "\n")
+
     # # средний вес
     # stdout.write("\n")
     # stdout.write(
-    #     f"Средний вес комплекта: {round(average_weight, 2)} кг." + "\n"
+    #     f"Средний вес комплекта: {round(result.average_weight, 2)} кг."
+    #     + "\n"
     # )
 
 
-if __name__ == "__main__":
-    stdout.write("Старт программы." + "\n")
+def write_metrics(metrics_file: str, run: str) -> None:
+    """Выводит сводку метрик запуска (этапы, файлы)."""
+    try:
+        records = MetricsService.read(metrics_file, run)
+    except (OSError, ValueError) as exc:
+        logging.error("Не удалось прочитать метрики.", exc_info=exc)
+        return
+
     stdout.write("\n")
-    start_time = perf_counter()
+    stdout.write(f"Метрики запуска ({metrics_file}):" + "\n")
+    stdout.write(MetricsService.get_summary(records) + "\n")
+
+
+def write_merged_rows(merged_rows: dict[str, list[Any]]) -> None:
+    """Выводит строки с разными размерами, объединённые сеткой."""
+    if not merged_rows:
+        return
+
+    stdout.write("\n")
+    stdout.write(
+        f"Объединены сеткой строки с разными размерами - "
+        f"{len(merged_rows)} файлов:" + "\n"
+    )
+    for file_name, rows in merged_rows.items():
+        stdout.write(f"{file_name} - {rows}." + "\n")
+
+
+@contextmanager
+def profiling(enabled: bool) -> Iterator[None]:
+    """
+    Профилирование запуска: --profile или переменная окружения.
+
+    Отчёты (pstats, горячие функции, пик памяти) - в папке app.log.
+    """
+    from services.profiler.service import ProfilerService
+
+    if not enabled and not ProfilerService.is_enabled_by_env():
+        yield
+        return
 
+    profiler = ProfilerService(folder=str(Path.cwd()))
     try:
-        main("Обрамления.xlsx")
+        with profiler:
+            yield
+    finally:
+        # stderr: stdout расчёта (--quote) - машиночитаемый
+        if profiler.files:
+            stderr.write("\n")
+            stderr.write("Отчёты профилирования:" + "\n")
+            for file in profiler.files:
+                stderr.write(file + "\n")
+
+
+def run_orders(
+    args: argparse.Namespace, options: "OrderOptionsInputSchema"
+) -> None:
+    """Обработка заказов из аргументов: ошибки выводятся пользователю."""
+    try:
+        from services.order.service import BatchOrderService
+
+        if len(args.paths) == 1 and not BatchOrderService.is_batch_path(
+            args.paths[0]
+        ):
+            main(args.paths[0], options=options)
+        else:
+            main_batch(args.paths, max_workers=args.workers, options=options)
     except (ExcelNeverError, FramesNeverError) as exc:
         msg = "Произошла ошибка в коде. Сообщите разработчику."
         stdout.write(msg + "\n")
@@ -177,8 +379,249 @@ if __name__ == "__main__":
         stdout.write(msg + "\n")
         logging.critical(msg, exc_info=exc)
 
+
+def get_args() -> argparse.Namespace:
+    """Возвращает аргументы командной строки."""
+    parser = argparse.ArgumentParser(
+        prog="draw_frames", description="Черчение обрамлений."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[DEFAULT_EXCEL_FILE_NAME],
+        help=(
+            "Файлы замеров или папки с ними. Несколько файлов или папка - "
+            "пакетный режим."
+        ),
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Количество процессов пакетного режима (по умолчанию - ядра).",
+    )
+    parser.add_argument(
+        "--draw-workers",
+        type=int,
+        default=1,
+        help=(
+            "Количество процессов черчения деталей заказа (по умолчанию - 1, "
+            "без пула). В пакетном режиме умножается на --workers."
+        ),
+    )
+    parser.add_argument(
+        "--xlsx-engine",
+        choices=["stream", "openpyxl"],
+        default="stream",
+        help="Сервис чтения xlsx файлов.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Не использовать кэш прочитанных файлов замеров.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=(
+            "Папка кэша прочитанных файлов замеров (по умолчанию - папка "
+            "данных пользователя)."
+        ),
+    )
+    parser.add_argument(
+        "--full-redraw",
+        action="store_true",
+        help="Перечертить все детали (без проверки манифеста папки заказа).",
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help=(
+            "Все детали заказа в одном dxf файле: деталь - блок, копии - "
+            "вставки блока."
+        ),
+    )
+    parser.add_argument(
+        "--grid-step",
+        type=float,
+        default=None,
+        help=(
+            "Сетка изготовления, мм: размеры деталей привязываются к сетке, "
+            "строки в пределах шага чертятся одной деталью."
+        ),
+    )
+    parser.add_argument(
+        "--dxf-engine",
+        choices=["ezdxf", "native"],
+        default="ezdxf",
+        help=(
+            "Формирование dxf файлов: ezdxf или native (быстрая запись "
+            "DXF 2000 без объектной модели ezdxf)."
+        ),
+    )
+    parser.add_argument(
+        "--quote",
+        choices=["json", "csv"],
+        default=None,
+        help=(
+            "Расчёт без черчения: количество деталей, площадь и вес в stdout "
+            "(json или csv), файлы не создаются."
+        ),
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help=(
+            "Сервер заказов: HTTP API очереди заданий (POST /jobs, "
+            "GET /jobs/<id>, GET /health), процесс остаётся запущенным. "
+            "-w - потоки обработки."
+        ),
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Адрес сервера заказов (по умолчанию - только localhost).",
+    )
+    parser.add_argument(
+        "--port", type=int, default=8765, help="Порт сервера заказов."
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=64,
+        help=(
+            "Максимум заданий сервера (папки входящих) в очереди и в работе."
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        metavar="INBOX",
+        default=None,
+        help=(
+            "Папка входящих заказов: новые файлы замеров обрабатываются "
+            "автоматически и переносятся в INBOX/done или INBOX/failed, "
+            "процесс остаётся запущенным. -w - потоки обработки."
+        ),
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=2.0,
+        help="Интервал опроса папки входящих заказов, сек.",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=3.0,
+        help=("Время без изменений файла до обработки (файл дописан), сек."),
+    )
+    parser.add_argument(
+        "--metrics",
+        default=MetricsService.DEFAULT_FILE,
+        help=(
+            "Файл метрик (JSON lines): время этапов, сущности и размер "
+            "файлов деталей. Сводка - в конце работы."
+        ),
+    )
+    parser.add_argument(
+        "--no-metrics",
+        dest="metrics",
+        action="store_const",
+        const=None,
+        help="Не записывать метрики.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Профилирование запуска (cProfile и tracemalloc, также "
+            "переменная окружения FRAMES_PROFILE=1): отчёты в папке app.log. "
+            "Процессы пулов не профилируются, работа замедляется."
+        ),
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Время запуска: загрузка модулей режимов обработки.",
+    )
+    parser.add_argument(
+        "--dxf-template",
+        default=None,
+        help="dxf файл шаблона чертежей (слои, типы линий, рамка).",
+    )
+    return parser.parse_args()
+
+
+def get_options(args: argparse.Namespace) -> "OrderOptionsInputSchema":
+    """Возвращает параметры обработки заказа из аргументов."""
+    from services.order.schemas.input import OrderOptionsInputSchema
+
+    return OrderOptionsInputSchema(
+        xlsx_engine=args.xlsx_engine,
+        use_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
+        dxf_template=args.dxf_template,
+        dxf_engine=args.dxf_engine,
+        draw_workers=args.draw_workers,
+        incremental=not args.full_redraw,
+        combined_output=args.combined,
+        grid_step=args.grid_step,
+    )
+
+
+if __name__ == "__main__":
+    # для пула процессов в exe файле
+    freeze_support()
+
+    args = get_args()
+    if args.startup_report:
+        main_startup_report()
+        raise SystemExit
+
+    options = get_options(args)
+
+    if args.quote or args.serve or args.watch:
+        # машиночитаемый вывод или сервер: без ожидания закрытия консоли
+        with profiling(args.profile):
+            try:
+                if args.watch:
+                    main_watch(
+                        args.watch,
+                        args.poll_interval,
+                        args.debounce,
+                        max_workers=args.workers,
+                        max_queue=args.max_queue,
+                        options=options,
+                    )
+                elif args.serve:
+                    main_serve(
+                        args.host,
+                        args.port,
+                        max_workers=args.workers,
+                        max_queue=args.max_queue,
+                        options=options,
+                    )
+                else:
+                    main_quote(args.paths, args.quote, options=options)
+            except StartLimiterError as exc:
+                logging.error("Пробный период окончен.", exc_info=exc)
+                stderr.write("Внимание! Пробный период окончен." + "\n")
+                raise SystemExit(1) from exc
+        raise SystemExit
+
+    stdout.write("Старт программы." + "\n")
+    stdout.write("\n")
+    start_time = perf_counter()
+    metrics_run = MetricsService.enable(args.metrics) if args.metrics else None
+
+    with profiling(args.profile):
+        run_orders(args, options)
+
     end_time = perf_counter()
 
+    if metrics_run:
+        write_metrics(args.metrics, metrics_run)
+
     stdout.write("\n")
     stdout.write(f"Время выполнения t={end_time - start_time} сек." + "\n")
 
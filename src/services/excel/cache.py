@@ -0,0 +1,244 @@
+import hashlib
+import inspect
+import json
+import logging
+import marshal
+import os
+import pickle  # noqa: S403
+import sys
+import zlib
+from functools import cache
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+from pydantic import BaseModel
+
+from services.base.service import BaseService
+from services.excel.schemas.input import (
+    CellCoordinatesInputSchema,
+    SheetQueryInputSchema,
+)
+
+
+class ExcelCacheService(BaseService):
+    """
+    Дисковый кэш прочитанных данных excel файлов.
+
+    Ключ - хэш содержимого файла и параметры плана чтения (страница,
+    ячейки, диапазоны, схемы валидации и код их модулей). Значения хранятся
+    в сжатом pickle. При превышении max_size удаляются давно не
+    используемые записи.
+
+    :param cache_dir: Папка кэша, по умолчанию - папка данных пользователя
+        (get_default_dir), не зависит от текущей папки.
+    :param max_size: Максимальный размер кэша в байтах.
+    :param read_only: Только чтение записей: папка кэша не изменяется
+        (режим расчёта заказа).
+    """
+
+    # увеличить при изменении формата записей или логики чтения
+    VERSION = 1
+    SUFFIX = ".bin"
+    TMP_SUFFIX = ".tmp"
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        max_size: int = 100 * 1024**2,
+        read_only: bool = False,
+    ) -> None:
+        self.cache_dir = Path(cache_dir or self.get_default_dir()).resolve()
+        self.max_size = max_size
+        self.read_only = read_only
+
+    @staticmethod
+    def get_default_dir() -> str:
+        """Возвращает папку кэша по умолчанию (LOCALAPPDATA, ~/.cache)."""
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / ".cache"
+        return str(Path(base, "frames", "excel_cache"))
+
+    @staticmethod
+    def get_file_hash(file: str) -> str:
+        """Возвращает хэш содержимого файла."""
+        with Path(file).open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @classmethod
+    def get_schema_fingerprint(
+        cls, schema: type[BaseModel] | None
+    ) -> str | None:
+        """
+        Возвращает отпечаток схемы валидации.
+
+        Меняется при изменении полей, типов или ограничений схемы, а также
+        кода модулей схемы и её родителей (валидаторы, преобразования
+        значений не меняют json схему).
+        """
+        if schema is None:
+            return None
+
+        json_schema = json.dumps(
+            schema.model_json_schema(), sort_keys=True, default=str
+        )
+        modules = sorted(
+            {
+                base.__module__
+                for base in schema.__mro__
+                if issubclass(base, BaseModel) and base is not BaseModel
+            }
+        )
+        code = ":".join(cls.get_module_fingerprint(m) for m in modules)
+        return (
+            f"{schema.__module__}.{schema.__qualname__}:"
+            + hashlib.sha256(f"{json_schema}:{code}".encode()).hexdigest()
+        )
+
+    @staticmethod
+    @cache
+    def get_module_fingerprint(module_name: str) -> str:
+        """
+        Возвращает хэш кода модуля.
+
+        Хэш исходного кода, без исходников (exe) - хэш байт-кода модуля.
+        """
+        module = sys.modules[module_name]
+        try:
+            code = inspect.getsource(module).encode()
+        except (OSError, TypeError):
+            code = marshal.dumps(module.__loader__.get_code(module_name))
+        return hashlib.sha256(code).hexdigest()
+
+    @classmethod
+    def get_query_fingerprint(
+        cls, query: SheetQueryInputSchema, with_schemas: bool = True
+    ) -> str:
+        """
+        Возвращает отпечаток плана чтения.
+
+        :param with_schemas: Учитывать колонки и схемы валидации. Без них
+            отпечаток описывает только читаемые ячейки (сырые значения).
+        """
+
+        def dump_cell(cell: str | CellCoordinatesInputSchema) -> Any:
+            if isinstance(cell, CellCoordinatesInputSchema):
+                return [cell.row, cell.column]
+            return cell
+
+        cells = {}
+        for name, q in query.cells.items():
+            cells[name] = {
+                "cells": (
+                    {key: dump_cell(c) for key, c in q.cells.items()}
+                    if isinstance(q.cells, dict)
+                    else [dump_cell(c) for c in q.cells]
+                )
+            }
+            if with_schemas:
+                cells[name]["schema"] = cls.get_schema_fingerprint(
+                    q.validate_to_schema
+                )
+
+        rows = {}
+        for name, q in query.rows.items():
+            rows[name] = {"range": q.range_cell_params.model_dump()}
+            if with_schemas:
+                rows[name]["columns"] = q.columns
+                rows[name]["identity_columns"] = q.identity_columns
+                rows[name]["schema"] = cls.get_schema_fingerprint(
+                    q.validate_to_schema
+                )
+
+        return json.dumps(
+            {
+                "sheet": query.sheet_params.model_dump(),
+                "cells": cells,
+                "rows": rows,
+                "with_schemas": with_schemas,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    def get_key(self, file_hash: str, fingerprint: str) -> str:
+        """Возвращает ключ записи кэша."""
+        return hashlib.sha256(
+            f"{self.VERSION}:{file_hash}:{fingerprint}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Возвращает значение из кэша или None."""
+        path = self._get_path(key)
+        try:
+            data = path.read_bytes()
+            # кэш локальный и создаётся самим приложением
+            value = pickle.loads(zlib.decompress(data))  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            # повреждённая или устаревшая запись (например, удалена схема)
+            logging.warning(
+                self._get_common_log_information(self.get)
+                + f"Не удалось прочитать запись кэша {path}.",
+                exc_info=exc,
+            )
+            if not self.read_only:
+                path.unlink(missing_ok=True)
+            return None
+
+        # время использования записи, для вытеснения
+        if not self.read_only:
+            os.utime(path)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Сохраняет значение в кэш и удаляет старые записи."""
+        if self.read_only:
+            return
+
+        path = self._get_path(key)
+        tmp_path: Path | None = None
+        try:
+            data = zlib.compress(
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # свой временный файл: запись одной записи из разных процессов
+            with NamedTemporaryFile(
+                dir=self.cache_dir, suffix=self.TMP_SUFFIX, delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+                f.write(data)
+            tmp_path.replace(path)
+        except Exception as exc:
+            # ошибка кэша не должна прерывать работу программы
+            logging.warning(
+                self._get_common_log_information(self.set)
+                + f"Не удалось сохранить запись кэша {path}.",
+                exc_info=exc,
+            )
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Удаляет давно не используемые записи сверх max_size."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
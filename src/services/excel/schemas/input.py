@@ -6,12 +6,18 @@ from exception.custom import ValueFromUserError
 
 
 class RangeCellInputSchema(BaseModel):
-    """Схема диапазона ячеек для обхода schemas документа построчно."""
+    """
+    Схема диапазона ячеек для обхода schemas документа построчно.
+
+    end_row=None - до конца заполненной части страницы. max_blank_rows -
+    количество пустых строк подряд, после которых обход прекращается.
+    """
 
     start_row: PositiveInt | None = None
     end_row: PositiveInt | None = None
     start_column: PositiveInt | None = None
     end_column: PositiveInt | None = None
+    max_blank_rows: PositiveInt | None = None
 
 
 class SheetInputSchema(BaseModel):
@@ -41,3 +47,38 @@ class CellCoordinatesInputSchema(BaseModel):
     def __hash__(self):
         """Возвращает хэш."""
         return hash((self.row, self.column))
+
+
+class CellsQueryInputSchema(BaseModel):
+    """Схема запроса значений ячеек в плане чтения страницы."""
+
+    cells: (
+        tuple[str | CellCoordinatesInputSchema, ...]
+        | dict[str, str | CellCoordinatesInputSchema]
+    )
+    validate_to_schema: type[BaseModel] | None = None
+
+
+class RowsQueryInputSchema(BaseModel):
+    """Схема запроса диапазона строк в плане чтения страницы."""
+
+    range_cell_params: RangeCellInputSchema
+    columns: dict[int, str] | None = None
+    validate_to_schema: type[BaseModel] | None = None
+    batch_validation: bool = False
+    # колонки-идентификаторы строки (номер): не учитываются при поиске
+    # одинаковых строк в batch_validation, поле схемы - без валидации (Any)
+    identity_columns: tuple[int, ...] = ()
+
+
+class SheetQueryInputSchema(BaseModel):
+    """
+    Схема плана чтения страницы.
+
+    Все ячейки и диапазоны строк одной страницы, которые нужно получить за
+    один проход по документу. Ключи словарей - имена результатов.
+    """
+
+    sheet_params: SheetInputSchema
+    cells: dict[str, CellsQueryInputSchema] = {}
+    rows: dict[str, RowsQueryInputSchema] = {}
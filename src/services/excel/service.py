@@ -1,35 +1,65 @@
 import logging
-from collections.abc import Generator
+import re
+from collections.abc import Iterable, Iterator
+from functools import partial
 from types import TracebackType
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
-from openpyxl.reader.excel import load_workbook
-from openpyxl.workbook import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from exception.custom import UnexpectedResultError
 from services.base.service import BaseService
+from services.excel.cache import ExcelCacheService
 from services.excel.exceptions import ExcelNeverError, ExcelValueFromUserError
 from services.excel.schemas.input import (
     CellCoordinatesInputSchema,
     RangeCellInputSchema,
     SheetInputSchema,
+    SheetQueryInputSchema,
 )
 from services.excel.types import BaseModelChildType
+from services.metrics.service import MetricsService
+
+
+if TYPE_CHECKING:
+    # openpyxl загружается только при открытии документа: потоковые
+    # сервисы чтения (services.excel.sources) его не импортируют
+    from openpyxl.workbook import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
 
 
 class BaseExcelService(BaseService):
     """Базовый сервис для взаимодействия с excel файлами."""
 
-    _workbook: Workbook
+    _workbook: "Workbook | None" = None
+    # координаты ячейки: "A1", "$A$1"
+    _CELL_PATTERN = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
 
-    def __init__(self, file: str) -> None:
+    def __init__(
+        self,
+        file: str,
+        read_only: bool = False,
+        cache: ExcelCacheService | None = None,
+    ) -> None:
+        """
+        Инициализация.
+
+        :param file: Путь к файлу.
+        :param read_only: Открыть документ в потоковом режиме (только
+            чтение). Объекты ячеек не создаются для всего документа,
+            поэтому рекомендуется использовать вместе с execute_query.
+        :param cache: Кэш результатов execute_query. При попадании в кэш
+            документ не открывается.
+        """
         self._file = file
+        self._read_only = read_only
+        self._cache = cache
+        self._opened = False
 
     def __enter__(self):
         """Контекстный менеджер вход."""
-        self._workbook = load_workbook(filename=self._file, data_only=True)
+        # документ открывается при первом обращении к странице
+        self._opened = True
         return self
 
     def __exit__(
@@ -39,52 +69,155 @@ class BaseExcelService(BaseService):
         exc_tb: TracebackType | None,
     ) -> None:
         """Контекстный менеджер выход."""
+        self._opened = False
+        self._close()
+
+    # Методы чтения документа. Для другого формата входных данных
+    # переопределяются в наследниках (см. services.excel.sources).
+    # -------------------------------------------------------------------------
+
+    def _close(self) -> None:
+        """Закрывает документ, если он был открыт."""
         if self._workbook:
             self._workbook.close()
+            self._workbook = None
 
-    def _get_sheet(self, sheet_params: SheetInputSchema) -> Worksheet:
-        """Возвращает страницу документа."""
-        if not self._workbook:
+    def _iter_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int | None,
+        max_row: int | None,
+        min_column: int | None,
+        max_column: int | None,
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Возвращает значения строк страницы подряд, начиная с min_row.
+
+        Значения строки - колонки с min_column по max_column. None в
+        max_row, max_column - до конца заполненной части страницы.
+        """
+        sheet = self._get_sheet(sheet_params)
+        return sheet.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_column,
+            max_col=max_column,
+            values_only=True,
+        )
+
+    def _get_cells_values(
+        self,
+        sheet_params: SheetInputSchema,
+        coordinates: Iterable[tuple[int, int]],
+    ) -> list[Any]:
+        """Возвращает значения ячеек по (строка, колонка)."""
+        sheet = self._get_sheet(sheet_params)
+        return [
+            sheet.cell(row=row, column=column).value
+            for row, column in coordinates
+        ]
+
+    def _get_workbook(self) -> "Workbook":
+        """Возвращает документ, при первом обращении открывает его."""
+        if not self._opened:
             raise ExcelNeverError("Документ не открыт.")
 
+        if self._workbook is None:
+            from openpyxl.reader.excel import load_workbook
+
+            with MetricsService.span("excel.open", file=self._file):
+                self._workbook = load_workbook(
+                    filename=self._file,
+                    data_only=True,
+                    read_only=self._read_only,
+                )
+
+        return self._workbook
+
+    def _get_sheet(self, sheet_params: SheetInputSchema) -> "Worksheet":
+        """Возвращает страницу документа."""
+        workbook = self._get_workbook()
+
         sheet_name = sheet_params.name
         sheet_index = sheet_params.index
 
         if sheet_name is not None:
-            return self._workbook[sheet_name]
+            return workbook[sheet_name]
 
         if sheet_index is not None:
-            return self._workbook.worksheets[sheet_index]
+            return workbook.worksheets[sheet_index]
 
         raise ExcelNeverError(
             "При получении страницы, не передан sheet_name или sheet_index."
         )
 
-    @staticmethod
-    def _get_cell_value(
-        sheet: Worksheet, cell: str | CellCoordinatesInputSchema
-    ) -> Any:
+    @classmethod
+    def _get_cell_coordinates(
+        cls,
+        cell: str | CellCoordinatesInputSchema,
+    ) -> tuple[int, int]:
+        """Возвращает строку и колонку ячейки."""
         if isinstance(cell, str):
-            return sheet[cell].value
+            match = cls._CELL_PATTERN.match(cell)
+            if match is None:
+                raise ExcelNeverError(f"Некорректная ячейка: {cell}")
+
+            column = 0
+            for letter in match.group(1).upper():
+                column = column * 26 + ord(letter) - ord("A") + 1
+            return int(match.group(2)), column
         if isinstance(cell, CellCoordinatesInputSchema):
-            return sheet.cell(row=cell.row, column=cell.column).value
+            return cell.row, cell.column
 
         raise ExcelNeverError(
             f"Некорректный тип ячейки: {type(cell).__name__}"
         )
 
-    @staticmethod
-    def _get_iter_rows(
-        sheet: Worksheet, range_cell_params: RangeCellInputSchema
-    ) -> Generator[tuple[Any, ...], None, None]:
-        iter_rows = sheet.iter_rows(
-            min_row=range_cell_params.start_row,
-            max_row=range_cell_params.end_row,
-            min_col=range_cell_params.start_column,
-            max_col=range_cell_params.end_column,
-            values_only=True,
-        )
-        return iter_rows
+
+class RangeRowsCollector:
+    """
+    Собирает строки диапазона по мере обхода страницы.
+
+    Для диапазона с max_blank_rows обход прекращается после указанного
+    количества пустых строк подряд, пустые строки в конце не возвращаются.
+    """
+
+    def __init__(self, range_cell_params: RangeCellInputSchema) -> None:
+        self.start_row = range_cell_params.start_row or 1
+        self.end_row = range_cell_params.end_row
+        self.start_column = range_cell_params.start_column or 1
+        self.end_column = range_cell_params.end_column
+        self.max_blank_rows = range_cell_params.max_blank_rows
+
+        self.rows: list[tuple[Any, ...]] = []
+        self.done = False
+        self._blank_rows: list[tuple[Any, ...]] = []
+
+    def add(self, n: int, row: tuple[Any, ...]) -> None:
+        """
+        Добавляет строку n.
+
+        :param row: Значения строки в колонках диапазона.
+        """
+        if self.done or n < self.start_row:
+            return
+        if self.end_row is not None and n > self.end_row:
+            self.done = True
+            return
+
+        if self.max_blank_rows is None:
+            self.rows.append(row)
+            return
+
+        if all(v is None for v in row):
+            self._blank_rows.append(row)
+            if len(self._blank_rows) >= self.max_blank_rows:
+                self.done = True
+            return
+
+        self.rows.extend(self._blank_rows)
+        self._blank_rows.clear()
+        self.rows.append(row)
 
 
 class ExcelService(BaseExcelService):
@@ -92,25 +225,278 @@ class ExcelService(BaseExcelService):
 
     BaseReturnType = tuple[Any, ...] | BaseModelChildType
 
+    # скомпилированные валидаторы списков схем, для пакетной валидации
+    _list_type_adapters: dict[type[BaseModel], TypeAdapter[Any]] = {}
+
+    @MetricsService.timed("excel.execute_query")
+    def execute_query(self, query: SheetQueryInputSchema) -> dict[str, Any]:
+        """
+        Выполняет план чтения страницы за один проход по документу.
+
+        Результат по каждому имени из query.cells аналогичен результату
+        get_cell_values, из query.rows - результату get_rows_data.
+        """
+        cells_coordinates = {
+            name: (
+                {
+                    key: self._get_cell_coordinates(cell)
+                    for key, cell in q.cells.items()
+                }
+                if isinstance(q.cells, dict)
+                else tuple(self._get_cell_coordinates(c) for c in q.cells)
+            )
+            for name, q in query.cells.items()
+        }
+
+        if not self._cache:
+            cells_values = self._read_query(query, cells_coordinates)
+            return self._get_query_result(
+                query, cells_coordinates, cells_values
+            )
+
+        file_hash = self._cache.get_file_hash(self._file)
+        result_key = self._cache.get_key(
+            file_hash, self._cache.get_query_fingerprint(query)
+        )
+        result = self._cache.get(result_key)
+        if result is not None:
+            return result
+
+        # сырые значения не зависят от схем валидации, поэтому при изменении
+        # схем документ повторно не читается
+        values_key = self._cache.get_key(
+            file_hash,
+            self._cache.get_query_fingerprint(query, with_schemas=False),
+        )
+        cells_values = self._cache.get(values_key)
+        if cells_values is None:
+            cells_values = self._read_query(query, cells_coordinates)
+            self._cache.set(values_key, cells_values)
+
+        result = self._get_query_result(query, cells_coordinates, cells_values)
+        self._cache.set(result_key, result)
+
+        return result
+
+    @MetricsService.timed("excel.validate")
+    def _get_query_result(
+        self,
+        query: SheetQueryInputSchema,
+        cells_coordinates: dict[
+            str, dict[str, tuple[int, int]] | tuple[tuple[int, int], ...]
+        ],
+        cells_values: dict[tuple[str, Any], Any],
+    ) -> dict[str, Any]:
+        """Собирает и валидирует результат плана из прочитанных значений."""
+        common_log_information = self._get_common_log_information(
+            self.execute_query
+        )
+
+        result: dict[str, Any] = {}
+        for name, q in query.cells.items():
+            coordinates = cells_coordinates[name]
+            if isinstance(coordinates, dict):
+                result[name] = self._validate_cells(
+                    data={
+                        key: cells_values[(name, key)] for key in coordinates
+                    },
+                    validate_to_schema=q.validate_to_schema,
+                    common_log_information=common_log_information,
+                )
+            else:
+                result[name] = tuple(
+                    cells_values[(name, n)] for n in range(len(coordinates))
+                )
+
+        for name, q in query.rows.items():
+            rows = cells_values[(name, None)]
+            if not q.validate_to_schema:
+                result[name] = tuple(rows), None
+                continue
+            validate_rows = (
+                partial(
+                    self._validate_rows_batch,
+                    identity_columns=q.identity_columns,
+                )
+                if q.batch_validation
+                else self._validate_rows
+            )
+            result[name] = validate_rows(
+                rows=rows,
+                start_row=q.range_cell_params.start_row or 1,
+                columns=q.columns,
+                validate_to_schema=q.validate_to_schema,
+                common_log_information=common_log_information,
+            )
+
+        return result
+
+    @MetricsService.timed("excel.read")
+    def _read_query(
+        self,
+        query: SheetQueryInputSchema,
+        cells_coordinates: dict[
+            str, dict[str, tuple[int, int]] | tuple[tuple[int, int], ...]
+        ],
+    ) -> dict[tuple[str, Any], Any]:
+        """
+        Читает значения плана за один проход по строкам страницы.
+
+        Возвращает словарь: (имя запроса, ключ ячейки) -> значение,
+        для диапазонов строк: (имя запроса, None) -> список строк.
+        """
+        cells_by_row = self._get_query_cells_by_row(cells_coordinates)
+        collectors = {
+            name: RangeRowsCollector(q.range_cell_params)
+            for name, q in query.rows.items()
+        }
+
+        values: dict[tuple[str, Any], Any] = {
+            key: None for keys in cells_by_row.values() for key, _ in keys
+        }
+
+        if cells_by_row or collectors:
+            min_row, max_row, max_column = self._get_query_bounds(
+                cells_by_row, list(collectors.values())
+            )
+            iter_rows = self._iter_rows(
+                query.sheet_params, min_row, max_row, 1, max_column
+            )
+            max_cell_row = max(cells_by_row, default=0)
+            for n, row in enumerate(iter_rows, start=min_row):
+                for key, column in cells_by_row.get(n, ()):
+                    values[key] = (
+                        row[column - 1] if column <= len(row) else None
+                    )
+
+                for c in collectors.values():
+                    c.add(n, row[c.start_column - 1 : c.end_column])
+
+                # все ячейки прочитаны, все диапазоны завершены
+                if n >= max_cell_row and all(
+                    c.done for c in collectors.values()
+                ):
+                    break
+
+        values.update({(name, None): c.rows for name, c in collectors.items()})
+        return values
+
+    @staticmethod
+    def _get_query_cells_by_row(
+        cells_coordinates: dict[
+            str, dict[str, tuple[int, int]] | tuple[tuple[int, int], ...]
+        ],
+    ) -> dict[int, list[tuple[tuple[str, Any], int]]]:
+        """Группирует ячейки плана по строкам: строка -> [(ключ, колонка)]."""
+        cells_by_row: dict[int, list[tuple[tuple[str, Any], int]]] = {}
+        for name, coordinates in cells_coordinates.items():
+            items = (
+                coordinates.items()
+                if isinstance(coordinates, dict)
+                else enumerate(coordinates)
+            )
+            for key, (row, column) in items:
+                cells_by_row.setdefault(row, []).append(((name, key), column))
+
+        return cells_by_row
+
+    @staticmethod
+    def _get_query_bounds(
+        cells_by_row: dict[int, list[tuple[tuple[str, Any], int]]],
+        collectors: list[RangeRowsCollector],
+    ) -> tuple[int, int | None, int | None]:
+        """
+        Возвращает границы прохода по странице.
+
+        Первая строка, последняя строка и последняя колонка. None - до конца
+        страницы.
+        """
+        min_row = min([*cells_by_row, *(c.start_row for c in collectors)])
+
+        end_rows = [c.end_row for c in collectors]
+        max_row = (
+            None
+            if None in end_rows
+            else max([*cells_by_row, *cast(list[int], end_rows)])
+        )
+
+        end_columns = [c.end_column for c in collectors]
+        max_column = (
+            None
+            if None in end_columns
+            else max(
+                [
+                    *(c for keys in cells_by_row.values() for _, c in keys),
+                    *cast(list[int], end_columns),
+                ]
+            )
+        )
+
+        return min_row, max_row, max_column
+
+    @MetricsService.timed("excel.get_rows_data")
     def get_rows_data(
         self,
         sheet_params: SheetInputSchema,
         range_cell_params: RangeCellInputSchema,
         columns: dict[int, str] | None = None,
         validate_to_schema: type[BaseModelChildType] | None = None,
+        batch_validation: bool = False,
+        identity_columns: tuple[int, ...] = (),
     ) -> tuple[tuple[BaseReturnType, ...], dict[int, list[Any]] | None]:
-        """Возвращает данные из страницы построчно."""
+        """
+        Возвращает данные из страницы построчно.
+
+        :param batch_validation: Валидировать все строки одним вызовом,
+            одинаковые строки валидируются один раз.
+        :param identity_columns: Колонки-идентификаторы строки, см.
+            RowsQueryInputSchema.identity_columns.
+        """
         common_log_information = self._get_common_log_information(
             self.get_rows_data
         )
 
-        sheet: Worksheet = self._get_sheet(sheet_params)
-
-        iter_rows = self._get_iter_rows(sheet, range_cell_params)
+        collector = RangeRowsCollector(range_cell_params)
+        iter_rows = self._iter_rows(
+            sheet_params,
+            collector.start_row,
+            collector.end_row,
+            collector.start_column,
+            collector.end_column,
+        )
+        for n, row in enumerate(iter_rows, start=collector.start_row):
+            collector.add(n, row)
+            if collector.done:
+                break
 
         if not validate_to_schema:
-            return tuple(iter_rows), None
+            return tuple(collector.rows), None
+
+        validate_rows = (
+            partial(
+                self._validate_rows_batch, identity_columns=identity_columns
+            )
+            if batch_validation
+            else self._validate_rows
+        )
+        return validate_rows(
+            rows=collector.rows,
+            start_row=collector.start_row,
+            columns=columns,
+            validate_to_schema=validate_to_schema,
+            common_log_information=common_log_information,
+        )
 
+    @classmethod
+    def _validate_rows(
+        cls,
+        rows: Iterable[tuple[Any, ...]],
+        start_row: int,
+        columns: dict[int, str] | None,
+        validate_to_schema: type[BaseModelChildType] | None,
+        common_log_information: str,
+    ) -> tuple[tuple[BaseModelChildType, ...], dict[int, list[Any]]]:
+        """Валидирует строки, строки с ошибкой возвращает отдельно."""
         # Проверка, что для ответа в pydantic схемах переданы
         # необходимые параметры
         for a in (columns, validate_to_schema):
@@ -123,9 +509,13 @@ class ExcelService(BaseExcelService):
 
         result = []
         rows_with_exc = {}
-        for n, row in enumerate(iter_rows, start=range_cell_params.start_row):
+        for n, row in enumerate(rows, start=start_row):
+            # пустые строки не валидируются
+            if all(v is None for v in row):
+                continue
+
             data = {
-                field_name: row[column - 1]
+                field_name: row[column - 1] if column <= len(row) else None
                 for column, field_name in columns.items()
             }
 
@@ -133,8 +523,8 @@ class ExcelService(BaseExcelService):
             try:
                 result.append(validate_to_schema.model_validate(data))
             except ValidationError as exc:
-                if len({r for r in data.values() if r is not None}) > 1:
-                    values = list(data.values())
+                values = list(data.values())
+                if cls._has_several_values(values):
                     rows_with_exc[n] = values
                     logging.warning(
                         common_log_information
@@ -146,6 +536,160 @@ class ExcelService(BaseExcelService):
 
         return tuple(result), rows_with_exc
 
+    @classmethod
+    def _validate_rows_batch(
+        cls,
+        rows: Iterable[tuple[Any, ...]],
+        start_row: int,
+        columns: dict[int, str] | None,
+        validate_to_schema: type[BaseModelChildType] | None,
+        common_log_information: str,
+        identity_columns: tuple[int, ...] = (),
+    ) -> tuple[tuple[BaseModelChildType, ...], dict[int, list[Any]]]:
+        """
+        Валидирует строки одним вызовом TypeAdapter.
+
+        Результат аналогичен _validate_rows. Одинаковые строки валидируются
+        один раз, ошибки собираются из одного ValidationError. Строки,
+        отличающиеся только колонками identity_columns, одинаковые: у копий
+        значения этих колонок заменяются без валидации.
+        """
+        for a in (columns, validate_to_schema):
+            if not a:
+                raise UnexpectedResultError(
+                    common_log_information
+                    + f"Для получения ответа в pydantic схемах, "
+                    f"{a} обязателен."
+                )
+
+        distinct_values, row_indexes = cls._get_distinct_rows(
+            rows, start_row, columns, identity_columns
+        )
+        validated, errors = cls._validate_distinct_rows(
+            data=[
+                dict(zip(columns.values(), v, strict=True))
+                for v in distinct_values
+            ],
+            validate_to_schema=validate_to_schema,
+        )
+
+        result = []
+        rows_with_exc = {}
+        used = set()
+        for n, index, row_values in row_indexes:
+            if index in errors:
+                values = list(row_values)
+                if cls._has_several_values(values):
+                    rows_with_exc[n] = values
+                    logging.warning(
+                        common_log_information
+                        + f"Значения строки {n}-{values} "
+                        f"заполнены некорректно: {errors[index]}"
+                    )
+                continue
+
+            # повторяющаяся строка - отдельный объект со своими
+            # идентификаторами
+            schema = validated[index]
+            if index in used:
+                schema = schema.model_copy(
+                    update={
+                        name: value
+                        for (column, name), value in zip(
+                            columns.items(), row_values, strict=True
+                        )
+                        if column in identity_columns
+                    }
+                )
+            result.append(schema)
+            used.add(index)
+
+        return tuple(result), rows_with_exc
+
+    @staticmethod
+    def _get_distinct_rows(
+        rows: Iterable[tuple[Any, ...]],
+        start_row: int,
+        columns: dict[int, str],
+        identity_columns: tuple[int, ...],
+    ) -> tuple[list[tuple[Any, ...]], list[tuple[int, int, tuple[Any, ...]]]]:
+        """
+        Группирует одинаковые строки (без учёта identity_columns).
+
+        :return: Значения уникальных строк (первая строка группы);
+            для непустых строк - номер строки, индекс уникальной строки и
+            значения строки.
+        """
+        distinct_values: list[tuple[Any, ...]] = []
+        # ключ строки без колонок-идентификаторов -> индекс
+        distinct: dict[tuple[Any, ...], int] = {}
+        row_indexes: list[tuple[int, int, tuple[Any, ...]]] = []
+        for n, row in enumerate(rows, start=start_row):
+            # пустые строки не валидируются
+            if all(v is None for v in row):
+                continue
+
+            values = tuple(
+                row[column - 1] if column <= len(row) else None
+                for column in columns
+            )
+            key = tuple(
+                v
+                for column, v in zip(columns, values, strict=True)
+                if column not in identity_columns
+            )
+            try:
+                index = distinct.setdefault(key, len(distinct_values))
+            except TypeError:
+                # нехэшируемые значения (списки, словари jsonl) -
+                # строка валидируется отдельно
+                index = len(distinct_values)
+            if index == len(distinct_values):
+                distinct_values.append(values)
+            row_indexes.append((n, index, values))
+
+        return distinct_values, row_indexes
+
+    @staticmethod
+    def _has_several_values(values: list[Any]) -> bool:
+        """Проверяет, что в строке больше одного разного значения."""
+        # сравнение, а не set: значения jsonl могут быть нехэшируемыми
+        filled = [v for v in values if v is not None]
+        return any(v != filled[0] for v in filled[1:])
+
+    @classmethod
+    def _validate_distinct_rows(
+        cls,
+        data: list[dict[str, Any]],
+        validate_to_schema: type[BaseModelChildType],
+    ) -> tuple[dict[int, BaseModelChildType], dict[int, list[str]]]:
+        """
+        Валидирует список строк.
+
+        Возвращает валидные строки и ошибки по индексу строки.
+        """
+        type_adapter = cls._list_type_adapters.get(validate_to_schema)
+        if type_adapter is None:
+            type_adapter = TypeAdapter(list[validate_to_schema])
+            cls._list_type_adapters[validate_to_schema] = type_adapter
+
+        try:
+            return dict(enumerate(type_adapter.validate_python(data))), {}
+        except ValidationError as exc:
+            errors: dict[int, list[str]] = {}
+            for error in exc.errors(include_url=False):
+                index, *loc = error["loc"]
+                errors.setdefault(cast(int, index), []).append(
+                    f"{'.'.join(map(str, loc))}: {error['msg']}"
+                )
+
+        # повторная валидация только корректных строк
+        indexes = [i for i in range(len(data)) if i not in errors]
+        validated = type_adapter.validate_python([data[i] for i in indexes])
+
+        return dict(zip(indexes, validated, strict=True)), errors
+
+    @MetricsService.timed("excel.get_cell_values")
     def get_cell_values(
         self,
         sheet_params: SheetInputSchema,
@@ -175,35 +719,58 @@ class ExcelService(BaseExcelService):
                 "`validate_to_schema` должен быть передан."
             )
 
-        sheet: Worksheet = self._get_sheet(sheet_params)
-
         # Обработка данных
         if isinstance(cells, tuple):
             # Сырые данные (только tuple)
-            return tuple(self._get_cell_value(sheet, cell) for cell in cells)
+            return tuple(
+                self._get_cells_values(
+                    sheet_params,
+                    [self._get_cell_coordinates(cell) for cell in cells],
+                )
+            )
 
         if isinstance(cells, dict):
             # Преобразование данных для схемы
-            data_to_validate = {
-                field_name: self._get_cell_value(sheet, cell)
-                for field_name, cell in cells.items()
-            }
-            try:
-                schema = validate_to_schema.model_validate(data_to_validate)
-            except ValidationError as exc:
-                msg = f"Ошибка при валидации схемы {validate_to_schema}."
-                logging.warning(
-                    common_log_information + msg,
-                    exc_info=exc,
-                )
-                raise ExcelValueFromUserError(
-                    common_log_information + msg
-                ) from exc
-
-            return schema
+            values = self._get_cells_values(
+                sheet_params,
+                [self._get_cell_coordinates(c) for c in cells.values()],
+            )
+            data_to_validate = dict(zip(cells, values, strict=True))
+            return self._validate_cells(
+                data=data_to_validate,
+                validate_to_schema=validate_to_schema,
+                common_log_information=common_log_information,
+            )
 
         # Если формат cells не распознан
         raise ExcelNeverError(
             common_log_information
             + f"Некорректный формат cells: {type(cells).__name__}"
         )
+
+    @staticmethod
+    def _validate_cells(
+        data: dict[str, Any],
+        validate_to_schema: type[BaseModelChildType] | None,
+        common_log_information: str,
+    ) -> BaseModelChildType:
+        """Валидирует значения ячеек в схему."""
+        if not validate_to_schema:
+            raise ExcelNeverError(
+                common_log_information + "Для `cells` в формате dict,"
+                "`validate_to_schema` должен быть передан."
+            )
+
+        try:
+            schema = validate_to_schema.model_validate(data)
+        except ValidationError as exc:
+            msg = f"Ошибка при валидации схемы {validate_to_schema}."
+            logging.warning(
+                common_log_information + msg,
+                exc_info=exc,
+            )
+            raise ExcelValueFromUserError(
+                common_log_information + msg
+            ) from exc
+
+        return schema
@@ -0,0 +1,818 @@
+import csv
+import json
+import posixpath
+import re
+import sqlite3
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from typing import Any, TextIO, cast
+from xml.etree import ElementTree as ET  # noqa: N817
+from xml.parsers import expat
+
+from services.excel.exceptions import ExcelNeverError, ExcelValueFromUserError
+from services.excel.schemas.input import SheetInputSchema
+from services.excel.service import ExcelService
+
+
+class StreamExcelService(ExcelService, ABC):
+    """
+    Базовый сервис построчного чтения табличных файлов без openpyxl.
+
+    Контракт get_cell_values, get_rows_data, execute_query и валидация
+    такие же, как у ExcelService. Наследники реализуют _iter_sheet_rows.
+    """
+
+    @abstractmethod
+    def _iter_sheet_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[int, Sequence[Any]]]:
+        """
+        Возвращает (номер строки, значения начиная с первой колонки).
+
+        Номера строк по возрастанию, пустые строки можно пропускать.
+        min_row, max_row - подсказка, строки вне диапазона отбрасываются.
+        """
+
+    def _iter_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int | None,
+        max_row: int | None,
+        min_column: int | None,
+        max_column: int | None,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Возвращает значения строк страницы подряд, начиная с min_row."""
+        if not self._opened:
+            raise ExcelNeverError("Документ не открыт.")
+
+        min_row = min_row or 1
+        min_column = min_column or 1
+        width = None if max_column is None else max_column - min_column + 1
+        empty_row = (None,) * (width or 0)
+
+        expected_row = min_row
+        for n, values in self._iter_sheet_rows(sheet_params, min_row, max_row):
+            if n < min_row:
+                continue
+            if max_row is not None and n > max_row:
+                break
+
+            # пропущенные пустые строки
+            for _ in range(expected_row, n):
+                yield empty_row
+
+            row = tuple(values[min_column - 1 : max_column])
+            if width is not None and len(row) < width:
+                row += (None,) * (width - len(row))
+            yield row
+            expected_row = n + 1
+
+    def _get_cells_values(
+        self,
+        sheet_params: SheetInputSchema,
+        coordinates: Iterable[tuple[int, int]],
+    ) -> list[Any]:
+        """Возвращает значения ячеек за один проход по строкам."""
+        coordinates = list(coordinates)
+        if not coordinates:
+            return []
+
+        rows = {row for row, _ in coordinates}
+        min_row = min(rows)
+        max_column = max(column for _, column in coordinates)
+
+        values_by_row = {}
+        iter_rows = self._iter_rows(
+            sheet_params, min_row, max(rows), 1, max_column
+        )
+        for n, values in enumerate(iter_rows, start=min_row):
+            if n in rows:
+                values_by_row[n] = values
+
+        return [
+            values_by_row.get(row, (None,) * max_column)[column - 1]
+            for row, column in coordinates
+        ]
+
+    def _check_single_sheet(self, sheet_params: SheetInputSchema) -> None:
+        """
+        Проверяет страницу для файлов с одной страницей.
+
+        Страница доступна по индексу 0 или по имени файла без расширения.
+        """
+        if sheet_params.index in (None, 0) and sheet_params.name in (
+            None,
+            Path(self._file).stem,
+        ):
+            return
+
+        raise ExcelValueFromUserError(
+            f"В файле {self._file} нет страницы {sheet_params}."
+        )
+
+
+class TextExcelService(StreamExcelService):
+    """Базовый сервис чтения текстовых файлов с одной страницей."""
+
+    ENCODING = "utf-8-sig"
+
+    # числа в текстовых файлах, десятичный разделитель - точка или запятая
+    INT_PATTERN = re.compile(r"-?\d+")
+    FLOAT_PATTERN = re.compile(r"-?\d*[.,]\d+")
+
+    def __init__(
+        self, file: str, *args: Any, encoding: str | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(file, *args, **kwargs)
+        self._encoding = encoding or self.ENCODING
+
+    @classmethod
+    def _convert_text_value(cls, value: str) -> Any:
+        """
+        Приводит текстовое значение к значению ячейки excel.
+
+        Пустая строка - None, числа - int или float.
+        """
+        if value == "":
+            return None
+        if cls.INT_PATTERN.fullmatch(value):
+            return int(value)
+        if cls.FLOAT_PATTERN.fullmatch(value):
+            return float(value.replace(",", "."))
+        return value
+
+    def _open_text(self) -> TextIO:
+        return Path(self._file).open(newline="", encoding=self._encoding)
+
+
+class CsvExcelService(TextExcelService):
+    """
+    Сервис чтения CSV файлов.
+
+    Одна строка файла - одна строка страницы. Разделитель (",", ";" или
+    табуляция) определяется автоматически, если не передан.
+    """
+
+    DELIMITERS = ",;\t"
+
+    def __init__(
+        self,
+        file: str,
+        *args: Any,
+        delimiter: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file, *args, **kwargs)
+        self._delimiter = delimiter
+
+    def _iter_sheet_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[int, Sequence[Any]]]:
+        self._check_single_sheet(sheet_params)
+
+        with self._open_text() as f:
+            reader = csv.reader(f, delimiter=self._get_delimiter(f))
+            for n, row in enumerate(reader, start=1):
+                if max_row is not None and n > max_row:
+                    break
+                if n < min_row or not row:
+                    continue
+                yield n, [self._convert_text_value(v) for v in row]
+
+    def _get_delimiter(self, f: TextIO) -> str:
+        """Возвращает разделитель, при необходимости определяет его."""
+        if self._delimiter:
+            return self._delimiter
+
+        # самый частый из поддерживаемых разделителей в начале файла
+        sample = f.read(4096)
+        f.seek(0)
+        counts = {d: sample.count(d) for d in self.DELIMITERS}
+        delimiter = max(counts, key=lambda d: counts[d])
+        return delimiter if counts[delimiter] else ","
+
+
+class JsonLinesExcelService(TextExcelService):
+    """
+    Сервис чтения JSON Lines файлов.
+
+    Одна строка файла - JSON массив значений строки страницы начиная с
+    первой колонки. Пустая строка файла или null - пустая строка страницы.
+    """
+
+    def _iter_sheet_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[int, Sequence[Any]]]:
+        self._check_single_sheet(sheet_params)
+
+        with self._open_text() as f:
+            for n, line in enumerate(f, start=1):
+                if max_row is not None and n > max_row:
+                    break
+                if n < min_row or not line.strip():
+                    continue
+
+                try:
+                    values = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise ExcelValueFromUserError(
+                        f"Строка {n} файла {self._file} не является JSON."
+                    ) from exc
+                if values is None:
+                    continue
+                if not isinstance(values, list):
+                    raise ExcelValueFromUserError(
+                        f"Строка {n} файла {self._file} должна быть "
+                        f"JSON массивом."
+                    )
+
+                yield n, [None if v == "" else v for v in values]
+
+
+class SqliteExcelService(StreamExcelService):
+    """
+    Сервис чтения SQLite файлов.
+
+    Ячейки хранятся в таблице cells(sheet_index, row, column, value), имена
+    страниц - в таблице sheets(sheet_index, name), нужна только для
+    получения страницы по имени. Номера строк и колонок начинаются с 1.
+    """
+
+    SELECT_ROWS = (
+        'SELECT "row", "column", value FROM cells '
+        'WHERE sheet_index = ? AND "row" >= ? '
+        'ORDER BY "row", "column"'
+    )
+    SELECT_ROWS_LIMITED = (
+        'SELECT "row", "column", value FROM cells '
+        'WHERE sheet_index = ? AND "row" >= ? AND "row" <= ? '
+        'ORDER BY "row", "column"'
+    )
+    SELECT_SHEET_INDEX = "SELECT sheet_index FROM sheets WHERE name = ?"
+
+    _connection: sqlite3.Connection | None = None
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Возвращает соединение, при первом обращении открывает его."""
+        if self._connection is None:
+            uri = Path(self._file).resolve().as_uri() + "?mode=ro"
+            self._connection = sqlite3.connect(uri, uri=True)
+        return self._connection
+
+    def _get_sheet_index(self, sheet_params: SheetInputSchema) -> int:
+        if sheet_params.name is None and sheet_params.index is not None:
+            return sheet_params.index
+
+        row = (
+            self._get_connection()
+            .execute(self.SELECT_SHEET_INDEX, (sheet_params.name,))
+            .fetchone()
+        )
+        if row is None:
+            raise ExcelValueFromUserError(
+                f"В файле {self._file} нет страницы {sheet_params}."
+            )
+        return row[0]
+
+    def _iter_sheet_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[int, Sequence[Any]]]:
+        sheet_index = self._get_sheet_index(sheet_params)
+        if max_row is None:
+            cursor = self._get_connection().execute(
+                self.SELECT_ROWS, (sheet_index, min_row)
+            )
+        else:
+            cursor = self._get_connection().execute(
+                self.SELECT_ROWS_LIMITED, (sheet_index, min_row, max_row)
+            )
+
+        current_row = None
+        values: list[Any] = []
+        for n, column, value in cursor:
+            if n != current_row:
+                if current_row is not None:
+                    yield current_row, values
+                current_row, values = n, []
+            values.extend([None] * (column - len(values)))
+            values[column - 1] = value
+
+        if current_row is not None:
+            yield current_row, values
+
+
+class XlsxStreamExcelService(StreamExcelService):
+    """
+    Сервис потокового чтения xlsx файлов без объектной модели openpyxl.
+
+    xml страницы и таблица строк (sharedStrings.xml) читаются из zip архива
+    инкрементальным парсером. Строки таблицы строк разбираются только до
+    последней запрошенной, разбор страницы прекращается после последней
+    запрошенной строки. Значения совпадают с ExcelService (data_only=True).
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    REL_TYPE_OFFICE_DOCUMENT = "/officeDocument"
+    REL_TYPE_WORKSHEET = "/worksheet"
+    REL_TYPE_SHARED_STRINGS = "/sharedStrings"
+    REL_TYPE_STYLES = "/styles"
+
+    WINDOWS_EPOCH = datetime(1899, 12, 30)
+    MAC_EPOCH = datetime(1904, 1, 1)
+    SECONDS_PER_DAY = 86400
+
+    # встроенные форматы чисел, которые являются датами
+    BUILTIN_DATE_FORMATS = {
+        14: "mm-dd-yy",
+        15: "d-mmm-yy",
+        16: "d-mmm",
+        17: "mmm-yy",
+        18: "h:mm AM/PM",
+        19: "h:mm:ss AM/PM",
+        20: "h:mm",
+        21: "h:mm:ss",
+        22: "m/d/yy h:mm",
+        45: "mm:ss",
+        46: "[h]:mm:ss",
+        47: "mmss.0",
+    }
+    # правила определения формата даты как в openpyxl
+    DATE_FORMAT_STRIP_PATTERN = re.compile(
+        r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]'
+    )
+    DATE_FORMAT_PATTERN = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+    TIMEDELTA_FORMAT_PATTERN = re.compile(
+        r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?",
+        re.IGNORECASE,
+    )
+
+    _archive: zipfile.ZipFile | None = None
+
+    def __init__(self, file: str, *args: Any, **kwargs: Any) -> None:
+        super().__init__(file, *args, **kwargs)
+        self._reset()
+
+    def _reset(self) -> None:
+        # страницы: (имя, путь в архиве)
+        self._sheets: list[tuple[str, str]] | None = None
+        self._shared_strings_path: str | None = None
+        self._styles_path: str | None = None
+        self._epoch = self.WINDOWS_EPOCH
+
+        self._shared_strings: list[str] = []
+        self._shared_strings_iter: Iterator[str] | None = None
+        # стили с форматом даты -> является ли формат интервалом времени
+        self._date_styles: dict[int, bool] | None = None
+
+    def _close(self) -> None:
+        if self._shared_strings_iter is not None:
+            cast(Generator[str, None, None], self._shared_strings_iter).close()
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        self._reset()
+
+    def _get_archive(self) -> zipfile.ZipFile:
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self._file)
+        return self._archive
+
+    # Структура документа
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_local_name(tag: str) -> str:
+        """Возвращает имя тега без пространства имён."""
+        return tag.rpartition("}")[2]
+
+    def _get_relationships(self, part: str) -> list[tuple[str, str, str]]:
+        """
+        Возвращает связи части документа: (id, тип, путь в архиве).
+
+        :param part: Путь части документа в архиве ("" - сам архив).
+        """
+        directory, _, name = part.rpartition("/")
+        rels_path = posixpath.join(directory, "_rels", f"{name}.rels")
+        try:
+            root = ET.fromstring(self._get_archive().read(rels_path))  # noqa: S314
+        except KeyError:
+            return []
+
+        relationships = []
+        for element in root:
+            target = element.get("Target", "")
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join(directory, target))
+            relationships.append(
+                (element.get("Id", ""), element.get("Type", ""), path)
+            )
+        return relationships
+
+    def _get_sheets(self) -> list[tuple[str, str]]:
+        """Возвращает страницы документа: (имя, путь в архиве)."""
+        if self._sheets is not None:
+            return self._sheets
+
+        workbook_path = next(
+            (
+                path
+                for _, rel_type, path in self._get_relationships("")
+                if rel_type.endswith(self.REL_TYPE_OFFICE_DOCUMENT)
+            ),
+            "xl/workbook.xml",
+        )
+        relationships = {}
+        for rel_id, rel_type, path in self._get_relationships(workbook_path):
+            relationships[rel_id] = (rel_type, path)
+            if rel_type.endswith(self.REL_TYPE_SHARED_STRINGS):
+                self._shared_strings_path = path
+            elif rel_type.endswith(self.REL_TYPE_STYLES):
+                self._styles_path = path
+
+        sheets = []
+        root = ET.fromstring(self._get_archive().read(workbook_path))  # noqa: S314
+        for element in root.iter():
+            name = self._get_local_name(element.tag)
+            if name == "workbookPr" and element.get("date1904") in (
+                "1",
+                "true",
+            ):
+                self._epoch = self.MAC_EPOCH
+            elif name == "sheet":
+                rel_id = next(
+                    (
+                        v
+                        for k, v in element.attrib.items()
+                        if k.endswith("}id")
+                    ),
+                    None,
+                )
+                rel_type, path = relationships.get(rel_id, ("", ""))
+                # листы диаграмм не входят в страницы, как и в openpyxl
+                if rel_type.endswith(self.REL_TYPE_WORKSHEET):
+                    sheets.append((element.get("name", ""), path))
+
+        self._sheets = sheets
+        return sheets
+
+    def _get_sheet_path(self, sheet_params: SheetInputSchema) -> str:
+        sheets = self._get_sheets()
+
+        if sheet_params.name is not None:
+            for name, path in sheets:
+                if name == sheet_params.name:
+                    return path
+        elif sheet_params.index is not None:
+            if sheet_params.index < len(sheets):
+                return sheets[sheet_params.index][1]
+        else:
+            raise ExcelNeverError(
+                "При получении страницы, не передан sheet_name или "
+                "sheet_index."
+            )
+
+        raise ExcelValueFromUserError(
+            f"В файле {self._file} нет страницы {sheet_params}."
+        )
+
+    # Чтение страницы
+    # -------------------------------------------------------------------------
+
+    def _iter_sheet_rows(
+        self,
+        sheet_params: SheetInputSchema,
+        min_row: int,
+        max_row: int | None,
+    ) -> Iterator[tuple[int, Sequence[Any]]]:
+        sheet_path = self._get_sheet_path(sheet_params)
+
+        parser = XlsxSheetParser(self._get_cell_xml_value, min_row)
+        with self._get_archive().open(sheet_path) as source:
+            while chunk := source.read(self.CHUNK_SIZE):
+                parser.feed(chunk)
+                for n, values in parser.pop_rows():
+                    if max_row is not None and n > max_row:
+                        return
+                    yield n, values
+
+    @staticmethod
+    def _get_column_index(reference: str) -> int:
+        """Возвращает номер колонки по адресу ячейки ("AB12" -> 28)."""
+        column = 0
+        for char in reference:
+            if not char.isalpha():
+                break
+            column = column * 26 + ord(char.upper()) - 64
+        return column
+
+    def _get_cell_xml_value(
+        self, data_type: str, value: str | None, style_id: int
+    ) -> Any:
+        """Возвращает значение ячейки, правила как в openpyxl."""
+        if not value:
+            return None
+
+        match data_type:
+            case "n":
+                number = (
+                    float(value)
+                    if "." in value or "E" in value or "e" in value
+                    else int(value)
+                )
+                if style_id:
+                    date_styles = self._get_date_styles()
+                    if style_id in date_styles:
+                        return self._from_excel(number, date_styles[style_id])
+                return number
+            case "s":
+                return self._get_shared_string(int(value))
+            case "b":
+                return bool(int(value))
+            case "d":
+                return datetime.fromisoformat(value)
+            case _:
+                # inlineStr, str - результат формулы, e - ошибка
+                return value
+
+    def _get_text(self, element: ET.Element) -> str:
+        """Возвращает текст строки (si, is) без форматирования."""
+        snippets = []
+        for child in element:
+            name = self._get_local_name(child.tag)
+            if name == "t":
+                snippets.append(child.text or "")
+            elif name == "r":
+                snippets.extend(
+                    t.text or ""
+                    for t in child
+                    if self._get_local_name(t.tag) == "t"
+                )
+        return "".join(snippets)
+
+    def _get_shared_string(self, index: int) -> str:
+        """Возвращает строку таблицы строк, разбирая её по мере надобности."""
+        if self._shared_strings_iter is None:
+            self._shared_strings_iter = self._iter_shared_strings()
+
+        while len(self._shared_strings) <= index:
+            try:
+                self._shared_strings.append(next(self._shared_strings_iter))
+            except StopIteration as exc:
+                raise ExcelValueFromUserError(
+                    f"В файле {self._file} нет строки {index} в таблице "
+                    f"строк."
+                ) from exc
+
+        return self._shared_strings[index]
+
+    def _iter_shared_strings(self) -> Generator[str, None, None]:
+        self._get_sheets()
+        if self._shared_strings_path is None:
+            return
+
+        with self._get_archive().open(self._shared_strings_path) as source:
+            root = None
+            for event, element in ET.iterparse(source, ("start", "end")):  # noqa: S314
+                if root is None:
+                    root = element
+                if (
+                    event == "end"
+                    and self._get_local_name(element.tag) == "si"
+                ):
+                    yield self._get_text(element).replace("x005F_", "")
+                    root.clear()
+
+    def _get_date_styles(self) -> dict[int, bool]:
+        """
+        Возвращает стили ячеек с форматом даты.
+
+        Стиль -> является ли формат интервалом времени.
+        """
+        if self._date_styles is not None:
+            return self._date_styles
+
+        self._get_sheets()
+        self._date_styles = {}
+        if self._styles_path is None:
+            return self._date_styles
+
+        root = ET.fromstring(self._get_archive().read(self._styles_path))  # noqa: S314
+        formats: dict[int, str] = dict(self.BUILTIN_DATE_FORMATS)
+        for element in root.iter():
+            if self._get_local_name(element.tag) == "numFmt":
+                formats[int(element.get("numFmtId", 0))] = element.get(
+                    "formatCode", ""
+                )
+
+        cell_xfs = next(
+            (e for e in root if self._get_local_name(e.tag) == "cellXfs"), []
+        )
+        for style_id, xf in enumerate(cell_xfs):
+            fmt = formats.get(int(xf.get("numFmtId", 0)))
+            if fmt is None:
+                continue
+            fmt = fmt.split(";")[0]
+            if self.DATE_FORMAT_PATTERN.search(
+                self.DATE_FORMAT_STRIP_PATTERN.sub("", fmt)
+            ):
+                self._date_styles[style_id] = bool(
+                    self.TIMEDELTA_FORMAT_PATTERN.search(fmt)
+                )
+
+        return self._date_styles
+
+    def _from_excel(
+        self, value: float, is_timedelta: bool
+    ) -> datetime | time | timedelta:
+        """Переводит число excel в дату, как openpyxl.from_excel."""
+        if is_timedelta:
+            td = timedelta(days=value)
+            if td.microseconds:
+                td = timedelta(
+                    seconds=td.total_seconds() // 1,
+                    microseconds=round(td.microseconds, -3),
+                )
+            return td
+
+        day, fraction = divmod(value, 1)
+        diff = timedelta(
+            milliseconds=round(fraction * self.SECONDS_PER_DAY * 1000)
+        )
+        if 0 <= value < 1 and diff.days == 0:
+            minutes, seconds = divmod(diff.seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            return time(hours, minutes, seconds, diff.microseconds)
+        if 0 < value < 60 and self._epoch == self.WINDOWS_EPOCH:
+            day += 1
+        return self._epoch + timedelta(days=day) + diff
+
+
+class XlsxSheetParser:
+    """
+    Инкрементальный разбор xml страницы xlsx файла (expat).
+
+    Объекты элементов не создаются: значения ячеек собираются в строки по
+    мере поступления данных в feed, готовые строки забираются pop_rows.
+
+    :param get_value: Функция значения ячейки (тип, текст, стиль).
+    :param min_row: Строки до min_row не собираются.
+    """
+
+    def __init__(
+        self,
+        get_value: Callable[[str, str | None, int], Any],
+        min_row: int = 1,
+    ) -> None:
+        self._get_value = get_value
+        self._min_row = min_row
+
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._characters
+
+        self._rows: list[tuple[int, list[Any]]] = []
+        self._row_number = 0
+        self._values: list[Any] | None = None
+        self._column = 0
+        self._data_type = "n"
+        self._style_id = 0
+        self._text: list[str] | None = None
+        self._inline = False
+        self._phonetic = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Разбирает очередную часть xml."""
+        self._parser.Parse(chunk, False)
+
+    def pop_rows(self) -> list[tuple[int, list[Any]]]:
+        """Возвращает разобранные строки: (номер строки, значения)."""
+        rows, self._rows = self._rows, []
+        return rows
+
+    def _start(self, name: str, attrs: dict[str, str]) -> None:
+        name = name.rpartition(":")[2]
+        if name == "c":
+            if self._values is None:
+                return
+            reference = attrs.get("r")
+            self._column = (
+                XlsxStreamExcelService._get_column_index(reference)
+                if reference
+                else self._column + 1
+            )
+            self._data_type = attrs.get("t", "n")
+            self._style_id = int(attrs.get("s") or 0)
+            self._text = None
+            self._inline = False
+        elif name == "row":
+            reference = attrs.get("r")
+            self._row_number = (
+                int(reference) if reference else self._row_number + 1
+            )
+            self._column = 0
+            self._values = [] if self._row_number >= self._min_row else None
+        elif name == "v" or (name == "t" and self._inline):
+            if self._values is not None and not self._phonetic:
+                if self._text is None:
+                    self._text = []
+        elif name == "is":
+            self._inline = True
+        elif name == "rPh":
+            self._phonetic = True
+
+    def _characters(self, data: str) -> None:
+        if self._text is not None and not self._phonetic:
+            self._text.append(data)
+
+    def _end(self, name: str) -> None:
+        name = name.rpartition(":")[2]
+        if name == "c":
+            if self._values is None:
+                return
+            value = self._get_value(
+                self._data_type,
+                "".join(self._text) if self._text is not None else None,
+                self._style_id,
+            )
+            self._text = None
+            if value is None:
+                return
+            if self._column > len(self._values):
+                self._values.extend(
+                    [None] * (self._column - len(self._values))
+                )
+            self._values[self._column - 1] = value
+        elif name == "row":
+            if self._values:
+                self._rows.append((self._row_number, self._values))
+            self._values = None
+        elif name == "rPh":
+            self._phonetic = False
+
+
+# Сервисы чтения по расширению файла
+EXCEL_SERVICES: dict[str, type[ExcelService]] = {
+    ".xlsx": ExcelService,
+    ".xlsm": ExcelService,
+    ".csv": CsvExcelService,
+    ".jsonl": JsonLinesExcelService,
+    ".ndjson": JsonLinesExcelService,
+    ".sqlite": SqliteExcelService,
+    ".sqlite3": SqliteExcelService,
+    ".db": SqliteExcelService,
+}
+
+
+# Сервисы чтения xlsx файлов
+XLSX_ENGINES: dict[str, type[ExcelService]] = {
+    "openpyxl": ExcelService,
+    "stream": XlsxStreamExcelService,
+}
+
+
+def get_excel_service(
+    file: str, xlsx_engine: str = "openpyxl", **kwargs: Any
+) -> ExcelService:
+    """
+    Возвращает сервис чтения файла по его расширению.
+
+    :param file: Путь к файлу.
+    :param xlsx_engine: Сервис чтения xlsx файлов (см. XLSX_ENGINES).
+    :param kwargs: Параметры сервиса (read_only, cache и т.д.).
+    """
+    suffix = Path(file).suffix.lower()
+    service_class = EXCEL_SERVICES.get(suffix)
+    if service_class is ExcelService:
+        service_class = XLSX_ENGINES[xlsx_engine]
+    if service_class is None:
+        raise ExcelValueFromUserError(
+            f"Формат файла {suffix} не поддерживается. Поддерживаются: "
+            f"{', '.join(EXCEL_SERVICES)}."
+        )
+
+    return service_class(file, **kwargs)
@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any
+
+
+class FramesGeometryCacheService:
+    """
+    Кэш геометрии деталей между заказами (LRU, потокобезопасный).
+
+    Геометрия детали зависит только от её размеров и параметров заказа
+    (толщина, отверстия, проём), поэтому одинаковые детали разных заказов
+    считаются один раз. Значения кэша неизменяемые.
+
+    :param max_size: Максимум деталей в кэше.
+    """
+
+    MAX_SIZE = 4096
+
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Возвращает значение из кэша, при отсутствии - вычисляет и сохраняет.
+
+        :param key: Ключ: размеры детали и параметры заказа.
+        :param compute: Вычисление значения.
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+
+        value = compute()
+
+        with self._lock:
+            self.misses += 1
+            self._set(key, value)
+
+        return value
+
+    def fill(
+        self,
+        items: Mapping[Hashable, Any],
+        compute: Callable[[list[Any]], list[Any]],
+    ) -> None:
+        """
+        Вычисляет одним пакетом значения, которых нет в кэше.
+
+        :param items: Ключ -> данные для вычисления значения.
+        :param compute: Пакетное вычисление: список данных -> список значений.
+        """
+        with self._lock:
+            missing = {
+                key: data
+                for key, data in items.items()
+                if key not in self._items
+            }
+        if not missing:
+            return
+
+        values = compute(list(missing.values()))
+
+        with self._lock:
+            self.misses += len(missing)
+            for key, value in zip(missing, values, strict=True):
+                self._set(key, value)
+
+    def clear(self) -> None:
+        """Очищает кэш и счётчики."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _set(self, key: Hashable, value: Any) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Количество деталей в кэше."""
+        return len(self._items)
@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ezdxf import bbox
+from ezdxf.document import Drawing
+from ezdxf.layouts import BaseLayout, BlockLayout
+from ezdxf.math import Vec2
+
+from services.base.service import BaseService
+from services.frames.exception import FramesNeverError
+
+
+class CombinedDxfService(BaseService):
+    """
+    Общий dxf документ деталей заказа.
+
+    Каждая уникальная деталь - блок (BLOCK), копии детали - вставки (INSERT)
+    в модели, ряд на деталь. Повторяющиеся элементы деталей (отверстия под
+    крепления, вырезы для гибки) - общие блоки внутри блоков деталей.
+
+    :param document: Документ (из прототипа или шаблона) для деталей.
+    """
+
+    PART_BLOCK_PREFIX = "PART_"
+    FEATURE_BLOCK_PREFIX = "FEATURE_"
+    # расстояние между деталями, мм
+    GAP = 20
+
+    def __init__(self, document: Drawing) -> None:
+        self.document = document
+        # детали в порядке черчения: (имя файла детали, имя блока)
+        self.parts: list[tuple[str, str]] = []
+        # имя элемента -> (имя блока, результат черчения элемента)
+        self._features: dict[str, tuple[str, Any]] = {}
+        self._current: BlockLayout | None = None
+
+    def new_part(self) -> tuple[Drawing, BlockLayout]:
+        """Возвращает документ и новый блок детали для черчения."""
+        self._current = self.document.blocks.new(
+            f"{self.PART_BLOCK_PREFIX}{len(self.parts) + 1}"
+        )
+        return self.document, self._current
+
+    def set_part_path(self, path: str) -> None:
+        """Завершает черчение детали: блок связывается с файлом детали."""
+        if self._current is None:
+            raise FramesNeverError("Нет детали для сохранения.")
+
+        # имя файла детали - в описании блока
+        self._current.block.dxf.description = Path(path).stem
+        self.parts.append((Path(path).name, self._current.name))
+        self._current = None
+
+    def add_feature(
+        self,
+        layout: BaseLayout,
+        name: str,
+        draw: Callable[[BlockLayout], Any],
+        insert: Vec2,
+    ) -> Any:
+        """
+        Вставляет общий блок элемента, блок чертится при первом обращении.
+
+        :param layout: Блок детали.
+        :param name: Имя элемента.
+        :param draw: Черчение элемента относительно начала координат.
+        :param insert: Точка вставки.
+        :return: Результат draw (например, конечная точка элемента).
+        """
+        if name not in self._features:
+            block = self.document.blocks.new(
+                f"{self.FEATURE_BLOCK_PREFIX}{name}"
+            )
+            self._features[name] = (block.name, draw(block))
+
+        block_name, result = self._features[name]
+        layout.add_blockref(block_name, insert)
+        return result
+
+    def place_parts(self, counts: list[int]) -> None:
+        """
+        Вставляет копии деталей в модель: ряд на деталь.
+
+        :param counts: Количество копий деталей в порядке черчения.
+        """
+        model_space = self.document.modelspace()
+        y = 0.0
+        for (_, block_name), count in zip(self.parts, counts, strict=True):
+            block = self.document.blocks[block_name]
+            extents = bbox.extents(block)
+            if not extents.has_data:
+                continue
+
+            size = extents.size
+            x = 0.0
+            for _ in range(count):
+                model_space.add_blockref(
+                    block.name,
+                    (x - extents.extmin.x, y - extents.extmin.y),
+                )
+                x += size.x + self.GAP
+            y += size.y + self.GAP
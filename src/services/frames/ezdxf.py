@@ -1,17 +1,170 @@
+import os
+import threading
+from io import StringIO
+from pathlib import Path
+from typing import Any, Literal
+
 import ezdxf
 from ezdxf import DXF2000
 from ezdxf.document import Drawing
-from ezdxf.layouts import Modelspace
+from ezdxf.layouts import BlockLayout, Modelspace
 
 from services.base.service import BaseService
+from services.frames.combined import CombinedDxfService
+from services.frames.exception import FramesValueFromUserError
+from services.frames.native_dxf import NativeDxfDocument, NativeDxfTemplate
+from services.frames.writer import DxfBufferWriter, DxfWriterService
+from services.metrics.service import MetricsService
+
+
+DxfEngine = Literal["ezdxf", "native"]
+DxfDocument = Drawing | NativeDxfDocument
+# модель или блок детали (общий документ)
+DxfLayout = Modelspace | BlockLayout | NativeDxfDocument
+
+
+class EzDxfPrototype:
+    """
+    Прототип dxf документа.
+
+    Таблицы, слои, типы линий и стили создаются (или читаются из шаблона)
+    один раз, для каждой детали очищаются только сущности модели, добавленные
+    после создания прототипа. Сущности шаблона (рамка, штамп) сохраняются.
+
+    Документ прототипа переиспользуется: его нужно сохранить до следующего
+    вызова get_document_and_model_space.
+
+    :param template: Путь к dxf файлу шаблона, None - пустой документ.
+    """
+
+    def __init__(self, template: str | None = None) -> None:
+        self.template = template
+
+        if template is None:
+            self.document = ezdxf.new(dxfversion=DXF2000)
+        else:
+            if not Path(template).is_file():
+                raise FramesValueFromUserError(
+                    f"Файл шаблона dxf не найден: {template}."
+                )
+            self.document = ezdxf.readfile(template)
+
+        self.model_space = self.document.modelspace()
+        # сущности шаблона
+        self._template_handles = {e.dxf.handle for e in self.model_space}
+        self._native_template: NativeDxfTemplate | None = None
+
+    def get_document_and_model_space(self) -> tuple[Drawing, Modelspace]:
+        """Возвращает очищенный документ прототипа и модель."""
+        model_space = self.model_space
+        for entity in list(model_space):
+            if entity.dxf.handle not in self._template_handles:
+                model_space.delete_entity(entity)
+        # удалённые сущности убираются из базы документа
+        self.document.entitydb.purge()
+
+        return self.document, model_space
+
+    def get_native_template(self) -> NativeDxfTemplate:
+        """Возвращает текст документа прототипа для NativeDxfDocument."""
+        if self._native_template is None:
+            document, _ = self.get_document_and_model_space()
+            self._native_template = NativeDxfTemplate(document)
+        return self._native_template
 
 
 class EzDxfService(BaseService):
-    """Класс для работы с библиотекой ezdxf."""
+    """
+    Класс для работы с библиотекой ezdxf.
+
+    Документы деталей создаются из прототипа (EzDxfPrototype), общего для
+    сервисов одного потока с одинаковым шаблоном. Документы сохраняются
+    через writer (фоновая запись), без него - сразу. С combined детали
+    чертятся блоками общего документа заказа (CombinedDxfService).
+
+    :param dxf_template: Путь к dxf файлу шаблона.
+    :param dxf_engine: Формирование dxf: "ezdxf" - объектная модель ezdxf,
+        "native" - текст DXF 2000 сразу из координат (NativeDxfDocument).
+    """
+
+    # прототипы потока: шаблон -> прототип
+    _prototypes = threading.local()
+
+    dxf_template: str | None = None
+    dxf_engine: DxfEngine = "ezdxf"
+    writer: DxfWriterService | DxfBufferWriter | None = None
+    combined: CombinedDxfService | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Состояние для передачи в процессы пула (без writer)."""
+        state = self.__dict__.copy()
+        state.pop("writer", None)
+        state.pop("combined", None)
+        return state
 
     @staticmethod
-    def get_document_and_model_space() -> tuple[Drawing, Modelspace]:
-        """Возвращает dxf документ и модель."""
+    def get_new_document_and_model_space() -> tuple[Drawing, Modelspace]:
+        """Возвращает новый dxf документ и модель."""
         document = ezdxf.new(dxfversion=DXF2000)
         model_space = document.modelspace()
         return document, model_space
+
+    @classmethod
+    def get_prototype(cls, template: str | None = None) -> EzDxfPrototype:
+        """Возвращает прототип документа текущего потока."""
+        prototypes: dict[str | None, EzDxfPrototype] | None = getattr(
+            cls._prototypes, "value", None
+        )
+        if prototypes is None:
+            prototypes = cls._prototypes.value = {}
+
+        if template not in prototypes:
+            prototypes[template] = EzDxfPrototype(template)
+        return prototypes[template]
+
+    def get_document_and_model_space(
+        self,
+    ) -> tuple[DxfDocument, DxfLayout]:
+        """Возвращает dxf документ и модель (из прототипа)."""
+        if self.combined is not None:
+            return self.combined.new_part()
+
+        prototype = self.get_prototype(self.dxf_template)
+        if self.dxf_engine == "native":
+            document = prototype.get_native_template().new_document()
+            return document, document.modelspace()
+
+        return prototype.get_document_and_model_space()
+
+    @staticmethod
+    def get_document_data(document: DxfDocument) -> bytes:
+        """Возвращает содержимое dxf файла документа."""
+        if isinstance(document, NativeDxfDocument):
+            return document.get_data()
+
+        stream = StringIO()
+        document.write(stream)
+        # как при записи в текстовом режиме (saveas)
+        return document.encode(stream.getvalue().replace("\n", os.linesep))
+
+    def save_document(self, document: DxfDocument, path: str) -> None:
+        """
+        Сохраняет документ: в очередь writer или сразу.
+
+        С combined деталь остаётся блоком общего документа.
+        """
+        if self.combined is not None:
+            self.combined.set_part_path(path)
+            return
+
+        with MetricsService.span("dxf.serialize"):
+            data = self.get_document_data(document)
+        MetricsService.add_file(path, len(document.modelspace()), len(data))
+        self.save_data(path, data)
+
+    def save_data(self, path: str, data: bytes) -> None:
+        """Сохраняет содержимое файла: в очередь writer или сразу."""
+        if self.writer is None:
+            DxfWriterService.write_atomic(path, data)
+        else:
+            self.writer.submit(path, data)
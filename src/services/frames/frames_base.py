@@ -5,7 +5,7 @@ from typing import assert_never
 
 from ezdxf.math import ConstructionArc, Vec2
 
-from services.frames.ezdxf import EzDxfService
+from services.frames.ezdxf import DxfEngine, EzDxfService
 from services.frames.schemas.frames_common.input import FramesBaseInputSchema
 
 
@@ -14,7 +14,18 @@ class FramesBase(EzDxfService):
 
     ZERO_POINT = Vec2(0, 0)
 
-    def __init__(self, *, base_data: FramesBaseInputSchema) -> None:
+    def __init__(
+        self,
+        *,
+        base_data: FramesBaseInputSchema,
+        dxf_template: str | None = None,
+        dxf_engine: DxfEngine = "ezdxf",
+        dry_run: bool = False,
+    ) -> None:
+        self.dxf_template = dxf_template
+        # режим расчёта без черчения: файлы и папки не создаются
+        self.dry_run = dry_run
+        self.dxf_engine = dxf_engine
         self.thickness = base_data.thickness
         self.height_platband_stands = base_data.height_platband_stands
         self.doorway = base_data.doorway
@@ -33,7 +44,8 @@ class FramesBase(EzDxfService):
         self.path_folder: str = self._get_absolute_path(
             base_data.path_folder or "", name_folder
         )
-        stdout.write("Рабочая папка: " + self.path_folder + "\n")
+        if not dry_run:
+            stdout.write("Рабочая папка: " + self.path_folder + "\n")
 
     @staticmethod
     def get_coordinates_angle_line(
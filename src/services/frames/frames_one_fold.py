@@ -1,20 +1,50 @@
-from collections import defaultdict
-from collections.abc import Callable
+import hashlib
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache, partial
 from pathlib import Path
 from typing import Any, assert_never, cast
 
+import numpy as np
 from ezdxf.math import Vec2
 
-from services.frames.exception import FramesValueFromUserError
+from services.frames.cache import FramesGeometryCacheService
+from services.frames.combined import CombinedDxfService
+from services.frames.exception import (
+    FramesNeverError,
+    FramesValueFromUserError,
+)
+from services.frames.ezdxf import DxfLayout, EzDxfPrototype
 from services.frames.frames_base import FramesBase
+from services.frames.manifest import FramesManifestService
 from services.frames.schemas.frames_common.enums import SideEnum, ThicknessEnum
+from services.frames.schemas.frames_common.internal import (
+    ManifestFileInternalSchema,
+)
 from services.frames.schemas.frames_one_fold.input import (
     FramesOneFoldInputSchema,
     HolesInputSchema,
 )
 from services.frames.schemas.frames_one_fold.internal import (
-    PlatbandPostInternalSchema,
+    NotchGeometryInternal,
+    PlatbandPostInternal,
+    PlatbandTopInternal,
+    StandGeometryInternal,
+    TopGeometryInternal,
+)
+from services.frames.schemas.frames_one_fold.output import (
+    FramesQuoteOutputSchema,
+    FramesQuotePartOutputSchema,
 )
+from services.frames.writer import DxfBufferWriter, DxfWriterService
+from services.metrics.service import MetricsService
+
+
+# деталь для черчения: (метод черчения, данные, номера)
+DrawJob = tuple[str, PlatbandPostInternal | PlatbandTopInternal, list[str]]
 
 
 class FramesOneFold(FramesBase):
@@ -26,6 +56,27 @@ class FramesOneFold(FramesBase):
         INACCURACY_STEEL_REAMER = 3.63
         INACCURACY_ONE_FOLD = 2.82
 
+    # минимум деталей для черчения в пуле процессов
+    MIN_PARALLEL_JOBS = 8
+    # увеличить при изменении геометрии или имён файлов деталей (манифест)
+    DRAWING_VERSION = 2
+    # вырезы для гибки левой половины верхушки (правая - зеркальная): углы
+    # линии, двух отрезков дуги, линии и направление дуги (по часовой стрелке)
+    TOP_NOTCHES = {
+        "first": (65, 100, 170, 180 + 25, True),
+        "second": (270 + 65, 270 + 100, 270 + 170, 90 + 25, True),
+    }
+    TOP_NOTCH_LINE_LENGTH = 2.69
+    TOP_NOTCH_ARC_LENGTH = 0.56
+    # кэш геометрии деталей, общий для заказов процесса
+    geometry_cache = FramesGeometryCacheService()
+    # метод черчения стойки -> сторона
+    STAND_SIDES = {
+        "draw_left_platband": SideEnum.LEFT,
+        "draw_right_platband": SideEnum.RIGHT,
+        "draw_identical_platband": SideEnum.IDENTICAL,
+    }
+
     SUPPORTED_THICKNESS = {ThicknessEnum.ONE_POINT_ZERO}
     # погрешность развёртки стали
     MATERIAL_MAP = {ThicknessEnum.ONE_POINT_ZERO: OnePointZero}
@@ -35,12 +86,36 @@ class FramesOneFold(FramesBase):
         *,
         thickness_frames: float,
         holes_data: HolesInputSchema,
+        max_workers: int = 1,
+        incremental: bool = True,
+        combined_output: bool = False,
+        grid_step: float | None = None,
+        dry_run: bool = False,
         **kwargs: dict[str, Any],
     ):
-        super().__init__(**kwargs)
+        super().__init__(dry_run=dry_run, **kwargs)
 
         self.thickness_frames = thickness_frames
         self.holes_data = holes_data
+        # процессы черчения деталей, 1 - в текущем процессе
+        self.max_workers = max_workers
+        # черчение только изменённых деталей (манифест папки заказа)
+        self.incremental = incremental
+        # все детали в одном файле (блоки и вставки), см. _draw_combined
+        self.combined_output = combined_output
+        self.combined_file: str | None = None
+        # сетка изготовления, мм: размеры деталей привязываются к ней перед
+        # группировкой, None - группировка по точным размерам
+        self.grid_step = grid_step
+
+        # последнее черчение: ошибки записи (путь -> ошибка), количество
+        # начерченных деталей, удалённые устаревшие файлы
+        self.write_errors: dict[str, str] = {}
+        self.drawn_count = 0
+        self.deleted_files: list[str] = []
+        # файлы, в которые сеткой объединены строки с разными размерами:
+        # имя файла -> номера строк
+        self.merged_rows: dict[str, list[str]] = {}
 
         # self.thickness из FramesBase
         if self.thickness not in self.SUPPORTED_THICKNESS:
@@ -54,8 +129,10 @@ class FramesOneFold(FramesBase):
 
         path_stands = Path(self.path_folder, "Стойки")
         path_tops = Path(self.path_folder, "Верхушки")
-        for path in (path_stands, path_tops):
-            path.mkdir(parents=True, exist_ok=True)
+        # в режиме расчёта (quote_frames) папки не создаются
+        if not self.dry_run:
+            for path in (path_stands, path_tops):
+                path.mkdir(parents=True, exist_ok=True)
 
         self.path_stands = path_stands
         self.path_tops = path_tops
@@ -66,94 +143,417 @@ class FramesOneFold(FramesBase):
         need_identical: bool,
     ) -> tuple[dict[str, list[str]], float]:
         """Чертит обрамления."""
-        left_platbands: dict[PlatbandPostInternalSchema, list[str]] = (
-            defaultdict(list)
-        )
-        right_platbands: dict[PlatbandPostInternalSchema, list[str]] = (
-            defaultdict(list)
+        jobs, merged_jobs = self._get_jobs(frames_data, need_identical)
+
+        self._fill_geometry_cache(jobs)
+
+        if self.dry_run:
+            raise FramesNeverError("Черчение недоступно в режиме расчёта.")
+
+        results: dict[str, list[str]] = {}
+        if self.combined_output:
+            drawn = self._draw_combined(jobs)
+        else:
+            drawn = self._draw_changed_jobs(jobs)
+
+        # результаты в порядке jobs при любом способе черчения
+        self.merged_rows = {}
+        weight = 0.0
+        parts_count = 0
+        for index, ((_, _, numbers), (file_name, square)) in enumerate(
+            zip(jobs, drawn, strict=True)
+        ):
+            results[file_name] = numbers
+            if index in merged_jobs:
+                self.merged_rows[file_name] = numbers
+            weight += square * self._material_data.FOR_WEIGHT * len(numbers)
+            parts_count += len(numbers)
+
+        return results, self._get_average_weight(weight, parts_count)
+
+    def quote_frames(
+        self,
+        frames_data: tuple[FramesOneFoldInputSchema, ...],
+        need_identical: bool,
+    ) -> FramesQuoteOutputSchema:
+        """
+        Расчёт заказа без черчения: детали, площадь и вес.
+
+        Выполняются только группировка и расчёт геометрии (кэш), файлы и
+        папки не создаются.
+        """
+        jobs, _ = self._get_jobs(frames_data, need_identical)
+        self._fill_geometry_cache(jobs)
+
+        parts = []
+        square_total = 0.0
+        parts_count = 0
+        for job in jobs:
+            method_name, data, numbers = job
+            side = self.STAND_SIDES.get(method_name)
+            if side is None:
+                kind = "top"
+                square = self._get_top_geometry(
+                    cast(PlatbandTopInternal, data)
+                ).square
+            else:
+                kind = side.name.lower()
+                square = self._get_stand_geometry(
+                    cast(PlatbandPostInternal, data), side
+                ).square
+
+            parts.append(
+                FramesQuotePartOutputSchema(
+                    file_name=self._get_job_path(job).name,
+                    kind=kind,
+                    count=len(numbers),
+                    square=square,
+                    weight=square * self._material_data.FOR_WEIGHT,
+                    numbers=numbers,
+                )
+            )
+            square_total += square * len(numbers)
+            parts_count += len(numbers)
+
+        weight = square_total * self._material_data.FOR_WEIGHT
+        return FramesQuoteOutputSchema(
+            parts=parts,
+            files_count=len(parts),
+            parts_count=parts_count,
+            square=square_total,
+            weight=weight,
+            average_weight=self._get_average_weight(weight, parts_count),
         )
-        identical_platbands: dict[PlatbandPostInternalSchema, list[str]] = (
-            defaultdict(list)
+
+    @staticmethod
+    def _get_average_weight(weight: float, parts_count: int) -> float:
+        """Возвращает средний вес комплекта (3 детали), кг."""
+        if not parts_count:
+            return 0.0
+        return weight / parts_count * 3
+
+    @MetricsService.timed("frames.grouping")
+    def _get_jobs(
+        self,
+        frames_data: tuple[FramesOneFoldInputSchema, ...],
+        need_identical: bool,
+    ) -> tuple[list[DrawJob], set[int]]:
+        """
+        Группирует строки замеров в детали.
+
+        :return: Детали для черчения и индексы деталей, в которые сеткой
+            изготовления объединены строки с разными размерами.
+        """
+        left_platbands: dict[PlatbandPostInternal, list[str]] = defaultdict(
+            list
         )
-        top_platbands: dict[FramesOneFoldInputSchema, list[str]] = defaultdict(
+        right_platbands: dict[PlatbandPostInternal, list[str]] = defaultdict(
             list
         )
+        identical_platbands: dict[PlatbandPostInternal, list[str]] = (
+            defaultdict(list)
+        )
+        top_platbands: dict[PlatbandTopInternal, list[str]] = defaultdict(list)
+        # деталь -> исходные размеры строк детали (отчёт merged_rows)
+        row_sizes: dict[Hashable, set[tuple[float, ...]]] = defaultdict(set)
+
+        def add_part(
+            platbands: dict[Any, list[str]],
+            key: PlatbandPostInternal | PlatbandTopInternal,
+            number: str,
+            sizes: tuple[float, ...],
+        ) -> None:
+            platbands[key].append(number)
+            row_sizes[id(platbands), key].add(sizes)
+
         part_condition_identical = (
             need_identical
             and self.holes_data.top == self.holes_data.bottom
             and (self.holes_data.middle * 2 == self.height_platband_stands)
         )
         for f in frames_data:
-            # потому что в листе замеров без учета отгиба
-            f.depth += self.thickness_frames
-
-            left_schema = PlatbandPostInternalSchema(
-                depth=f.depth,
-                width=f.width_left,
-                button_hole=f.button_hole_left,
+            # потому что в листе замеров без учета отгиба, входные данные
+            # не изменяются
+            depth = self._snap(f.depth) + self.thickness_frames
+            width_left = self._snap(f.width_left)
+            width_right = self._snap(f.width_right)
+
+            left_schema = PlatbandPostInternal(
+                depth,
+                width_left,
+                self._parse_button_hole(f.button_hole_left),
             )
-            right_schema = PlatbandPostInternalSchema(
-                depth=f.depth,
-                width=f.width_right,
-                button_hole=f.button_hole_right,
+            right_schema = PlatbandPostInternal(
+                depth,
+                width_right,
+                self._parse_button_hole(f.button_hole_right),
             )
+            left_sizes = (f.depth, f.width_left)
+            right_sizes = (f.depth, f.width_right)
 
             number = f.number
 
             if part_condition_identical:
                 if not left_schema.button_hole:
-                    identical_platbands[left_schema].append(f"{number}л")
+                    add_part(
+                        identical_platbands,
+                        left_schema,
+                        f"{number}л",
+                        left_sizes,
+                    )
                 else:
-                    left_platbands[left_schema].append(number)
+                    add_part(left_platbands, left_schema, number, left_sizes)
                 if not right_schema.button_hole:
-                    identical_platbands[right_schema].append(f"{number}п")
+                    add_part(
+                        identical_platbands,
+                        right_schema,
+                        f"{number}п",
+                        right_sizes,
+                    )
                 else:
-                    right_platbands[right_schema].append(number)
+                    add_part(
+                        right_platbands, right_schema, number, right_sizes
+                    )
             else:
-                left_platbands[left_schema].append(number)
-                right_platbands[right_schema].append(number)
-
-            top_platbands[f].append(number)
-
-        weights = []
-        results: dict[str, list[str]] = {}
-        for data, numbers in left_platbands.items():
-            file_name, square = self.draw_left_platband(data, numbers)
-            results[file_name] = numbers
-            weights.extend(
-                [square * self._material_data.FOR_WEIGHT] * len(numbers)
+                add_part(left_platbands, left_schema, number, left_sizes)
+                add_part(right_platbands, right_schema, number, right_sizes)
+
+            add_part(
+                top_platbands,
+                PlatbandTopInternal(
+                    depth, width_left, width_right, self._snap(f.height_top)
+                ),
+                number,
+                (f.depth, f.width_left, f.width_right, f.height_top),
             )
 
-        for data, numbers in right_platbands.items():
-            file_name, square = self.draw_right_platband(data, numbers)
-            results[file_name] = numbers
-            weights.extend(
-                [square * self._material_data.FOR_WEIGHT] * len(numbers)
+        jobs: list[DrawJob] = []
+        merged_jobs: set[int] = set()
+        for method_name, platbands in (
+            ("draw_left_platband", left_platbands),
+            ("draw_right_platband", right_platbands),
+            ("draw_identical_platband", identical_platbands),
+            ("draw_top_platband", top_platbands),
+        ):
+            for data, numbers in platbands.items():
+                if len(row_sizes[id(platbands), data]) > 1:
+                    merged_jobs.add(len(jobs))
+                jobs.append((method_name, data, numbers))
+
+        return jobs, merged_jobs
+
+    @MetricsService.timed("frames.geometry")
+    def _fill_geometry_cache(self, jobs: list[DrawJob]) -> None:
+        """Считает геометрию деталей заказа пакетами по видам деталей."""
+        # сторона стойки (None - верхний наличник) -> ключ кэша -> данные
+        groups: dict[SideEnum | None, dict[Hashable, Any]] = defaultdict(dict)
+        for method_name, data, _ in jobs:
+            side = self.STAND_SIDES.get(method_name)
+            if side is None:
+                key = self._get_top_cache_key(cast(PlatbandTopInternal, data))
+            else:
+                key = self._get_stand_cache_key(
+                    cast(PlatbandPostInternal, data), side
+                )
+            groups[side][key] = data
+
+        for side, items in groups.items():
+            self.geometry_cache.fill(
+                items,
+                (
+                    self._get_tops_geometry
+                    if side is None
+                    else partial(self._get_stands_geometry, side=side)
+                ),
             )
 
-        for data, numbers in identical_platbands.items():
-            file_name, square = self.draw_identical_platband(data, numbers)
-            results[file_name] = numbers
-            weights.extend(
-                [square * self._material_data.FOR_WEIGHT] * len(numbers)
+    @MetricsService.timed("frames.draw")
+    def _draw_combined(self, jobs: list[DrawJob]) -> list[tuple[str, float]]:
+        """
+        Чертит детали в общий документ заказа и записывает один файл.
+
+        Детали - блоки документа (CombinedDxfService), копии - вставки.
+        Черчение в текущем процессе, без манифеста, всегда через ezdxf.
+        """
+        combined = CombinedDxfService(
+            EzDxfPrototype(self.dxf_template).document
+        )
+        self.combined = combined
+        try:
+            drawn = [self.draw_job(job) for job in jobs]
+        finally:
+            self.combined = None
+        combined.place_parts([len(numbers) for _, _, numbers in jobs])
+
+        path = self._get_absolute_path(
+            self.path_folder, f"{Path(self.path_folder).name}.dxf"
+        )
+        with MetricsService.span("dxf.serialize"):
+            data = self.get_document_data(combined.document)
+        MetricsService.add_file(
+            path, len(combined.document.modelspace()), len(data)
+        )
+        # без пула - запись сразу, ошибка в writer.errors
+        writer = DxfWriterService()
+        writer.submit(path, data)
+
+        self.write_errors = writer.errors
+        self.drawn_count = len({file_name for file_name, _ in drawn})
+        self.deleted_files = []
+        self.combined_file = path
+        return drawn
+
+    @MetricsService.timed("frames.draw")
+    def _draw_changed_jobs(
+        self, jobs: list[DrawJob]
+    ) -> list[tuple[str, float]]:
+        """
+        Чертит детали, параметры которых изменились (по манифесту).
+
+        Без incremental чертятся все детали. Манифест обновляется всегда,
+        файлы прошлого черчения, которых нет в текущем, удаляются.
+        """
+        manifest = FramesManifestService(self.path_folder)
+        old_files = manifest.load()
+        common_params = self._get_common_params()
+
+        paths = [self._get_job_path(job) for job in jobs]
+        keys = [manifest.get_key(path) for path in paths]
+        hashes = [
+            manifest.get_hash(self._get_job_params(job) | common_params)
+            for job in jobs
+        ]
+        # одно имя файла у разных деталей - чертятся все такие детали
+        keys_count = Counter(keys)
+
+        changed = [
+            i
+            for i, (path, key, hash_) in enumerate(
+                zip(paths, keys, hashes, strict=True)
             )
+            if not self.incremental
+            or keys_count[key] > 1
+            or key not in old_files
+            or old_files[key].hash != hash_
+            or not path.exists()
+        ]
+
+        # запись файлов параллельно с черчением
+        with DxfWriterService() as writer:
+            self.writer = writer
+            try:
+                changed_drawn = self._draw_jobs([jobs[i] for i in changed])
+            finally:
+                self.writer = None
+        self.write_errors = writer.errors
+        self.drawn_count = len({paths[i] for i in changed})
+
+        drawn_by_index = dict(zip(changed, changed_drawn, strict=True))
+        drawn = []
+        files = {}
+        for i, (path, key, hash_) in enumerate(
+            zip(paths, keys, hashes, strict=True)
+        ):
+            if i in drawn_by_index:
+                file_name, square = drawn_by_index[i]
+            else:
+                file_name, square = path.name, old_files[key].square
+            drawn.append((file_name, square))
+            if str(path) not in self.write_errors:
+                files[key] = ManifestFileInternalSchema(
+                    hash=hash_, square=square
+                )
 
-        for data, numbers in top_platbands.items():
-            file_name, square = self.draw_top_platband(data, numbers)
-            results[file_name] = numbers
-            weights.extend(
-                [square * self._material_data.FOR_WEIGHT] * len(numbers)
+        self.deleted_files = manifest.delete_stale(old_files, set(keys))
+        manifest.save(files)
+        return drawn
+
+    def _get_job_path(self, job: DrawJob) -> Path:
+        """Возвращает путь файла детали."""
+        method_name, data, numbers = job
+        if method_name == "draw_top_platband":
+            file_name = self._get_top_file_name(
+                data=cast(PlatbandTopInternal, data), numbers=numbers
+            )
+            return Path(
+                self._get_absolute_path(str(self.path_tops), file_name)
             )
 
-        if weights:
-            average_weight = sum(weights) / len(weights) * 3
+        file_name = self._get_stand_file_name(
+            data=cast(PlatbandPostInternal, data),
+            numbers=numbers,
+            side=self.STAND_SIDES[method_name],
+        )
+        return Path(self._get_absolute_path(str(self.path_stands), file_name))
+
+    @staticmethod
+    def _get_job_params(job: DrawJob) -> dict[str, Any]:
+        """Возвращает параметры детали, от которых зависит её файл."""
+        method_name, data, _ = job
+        return {"method": method_name, "data": data._asdict()}
+
+    def _get_common_params(self) -> dict[str, Any]:
+        """Возвращает параметры заказа, от которых зависят все детали."""
+        if self.dxf_template is None:
+            template_hash = None
         else:
-            average_weight = 0.0
+            with Path(self.dxf_template).open("rb") as f:
+                template_hash = hashlib.file_digest(f, "sha256").hexdigest()
+
+        return {
+            "version": self.DRAWING_VERSION,
+            "thickness": self.thickness,
+            "thickness_frames": self.thickness_frames,
+            "height_platband_stands": self.height_platband_stands,
+            "doorway": self.doorway,
+            "holes_data": self.holes_data.model_dump(),
+            "dxf_engine": self.dxf_engine,
+            "dxf_template": template_hash,
+        }
+
+    def _draw_jobs(self, jobs: list[DrawJob]) -> list[tuple[str, float]]:
+        """
+        Чертит детали: последовательно или в пуле процессов.
+
+        Пул используется, если max_workers больше 1 и деталей не меньше
+        MIN_PARALLEL_JOBS, иначе (и если пул не удалось создать) - черчение
+        в текущем процессе. Файлы из процессов пула записываются writer
+        текущего процесса.
+        """
+        max_workers = min(self.max_workers, len(jobs))
+        if max_workers > 1 and len(jobs) >= self.MIN_PARALLEL_JOBS:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=init_draw_worker,
+                    initargs=(self,),
+                ) as executor:
+                    drawn = []
+                    for file_name, square, files in executor.map(
+                        draw_job,
+                        jobs,
+                        chunksize=max(1, len(jobs) // (max_workers * 4)),
+                    ):
+                        for path, data in files:
+                            self.save_data(path, data)
+                        drawn.append((file_name, square))
+                    return drawn
+            except (OSError, BrokenProcessPool) as exc:
+                logging.warning(
+                    self._get_common_log_information(self._draw_jobs)
+                    + "Пул процессов недоступен, черчение в одном процессе.",
+                    exc_info=exc,
+                )
+
+        return [self.draw_job(job) for job in jobs]
 
-        return results, average_weight
+    def draw_job(self, job: DrawJob) -> tuple[str, float]:
+        """Чертит деталь задания, возвращает имя файла и площадь."""
+        method_name, data, numbers = job
+        return getattr(self, method_name)(data, numbers)
 
     def draw_left_platband(
-        self, data: PlatbandPostInternalSchema, numbers: list[str]
+        self, data: PlatbandPostInternal, numbers: list[str]
     ) -> tuple[str, float]:
         """Чертит левую стойку."""
         return self._draw_stand_platband(
@@ -161,7 +561,7 @@ class FramesOneFold(FramesBase):
         )
 
     def draw_right_platband(
-        self, data: PlatbandPostInternalSchema, numbers: list[str]
+        self, data: PlatbandPostInternal, numbers: list[str]
     ) -> tuple[str, float]:
         """Чертит правую стойку."""
         return self._draw_stand_platband(
@@ -169,259 +569,434 @@ class FramesOneFold(FramesBase):
         )
 
     def draw_identical_platband(
-        self, data: PlatbandPostInternalSchema, numbers: list[str]
+        self, data: PlatbandPostInternal, numbers: list[str]
     ) -> tuple[str, float]:
         """Чертит идентичную стойку."""
         return self._draw_stand_platband(
             data=data, numbers=numbers, side=SideEnum.IDENTICAL
         )
 
+    @MetricsService.timed("frames.draw_top")
     def draw_top_platband(
-        self, data: FramesOneFoldInputSchema, numbers: list[str]
+        self, data: PlatbandTopInternal, numbers: list[str]
     ) -> tuple[str, float]:
         """Чертит верхний наличник."""
+        geometry = self._get_top_geometry(data)
+
         document, model_space = self.get_document_and_model_space()
 
+        for start, end in geometry.lines:
+            model_space.add_line(start, end)
+
+        # вырезы для гибки
+        for notch in geometry.notches:
+            self._draw_top_notch(model_space, notch)
+
+        # отверстие под крепления
+        for h in geometry.holes:
+            self._add_feature(model_space, "TOP_HOLE", self._draw_hole, h)
+
+        file_name = self._get_top_file_name(data=data, numbers=numbers)
+        path = self._get_absolute_path(*(str(self.path_tops), file_name))
+        self.save_document(document, path)
+
+        return file_name, geometry.square
+
+    def _get_top_geometry(
+        self, data: PlatbandTopInternal
+    ) -> TopGeometryInternal:
+        """Возвращает геометрию верхнего наличника (кэш)."""
+        return self.geometry_cache.get(
+            self._get_top_cache_key(data),
+            lambda: self._get_tops_geometry([data])[0],
+        )
+
+    def _get_tops_geometry(
+        self, data: Sequence[PlatbandTopInternal]
+    ) -> list[TopGeometryInternal]:
+        """
+        Возвращает геометрию верхних наличников (пакетно, numpy).
+
+        Считается левая половина: для n верхушек с шириной правой стойки и
+        n с шириной левой, вторые n отражаются по оси Y - правая половина.
+        """
         inaccuracy_one_fold = 2.4
         inaccuracy_width = 1.354
 
         extension_length = 10
         thickness_frames_length = self.thickness_frames - inaccuracy_one_fold
-        item_arc_length = 0.56
-        pre_arc_length = 2.69
-        height_length = data.height_top - 2.71
 
-        # проём
-        p1_left = Vec2(self.ZERO_POINT.x - self.doorway / 2, self.ZERO_POINT.y)
-        p1_right = Vec2(
-            self.ZERO_POINT.x + self.doorway / 2, self.ZERO_POINT.y
+        count = len(data)
+        depth, width_left, width_right, height_top = (
+            np.array(data, dtype=float).reshape(-1, 4).T
         )
-        model_space.add_line(p1_left, p1_right)
+        depth = np.tile(depth, 2)
+        width = np.concatenate((width_right, width_left))
+        height_length = np.tile(height_top, 2) - 2.71
+        zeros = np.zeros_like(depth)
 
+        # проём
+        p1 = self._get_points(
+            self.ZERO_POINT.x - self.doorway / 2, zeros + self.ZERO_POINT.y
+        )
         # Y - вырез под проём
-        p2_y = p1_left.y + 60
-        p2_left = Vec2(p1_left.x, p2_y)
-        p2_right = Vec2(p1_right.x, p2_y)
-        model_space.add_line(p1_left, p2_left)
-        model_space.add_line(p1_right, p2_right)
-
+        p2 = p1 + (0, 60)
         # X - расширение
-        p3_left = Vec2(p2_left.x - extension_length, p2_left.y)
-        p3_right = Vec2(p2_right.x + extension_length, p2_left.y)
-        model_space.add_line(p2_left, p3_left)
-        model_space.add_line(p2_right, p3_right)
-
+        p3 = p2 - (extension_length, 0)
         # Y - глубина
-        p4_y = data.depth - thickness_frames_length - 60 - inaccuracy_one_fold
-        p4_left = Vec2(p3_left.x, p3_left.y + p4_y)
-        p4_right = Vec2(p3_right.x, p3_right.y + p4_y)
-        model_space.add_line(p3_left, p4_left)
-        model_space.add_line(p3_right, p4_right)
-
+        p4_y = depth - thickness_frames_length - 60 - inaccuracy_one_fold
+        p4 = p3 + self._get_points(zeros, p4_y)
         # X - ширина под стойки
-        p5_left = Vec2(
-            p4_left.x
-            - (data.width_right - inaccuracy_width - extension_length),
-            p4_left.y,
-        )
-        p5_right = Vec2(
-            p4_right.x
-            + (data.width_left - inaccuracy_width - extension_length),
-            p4_right.y,
+        p5 = p4 - self._get_points(
+            width - inaccuracy_width - extension_length, zeros
         )
-        model_space.add_line(p4_left, p5_left)
-        model_space.add_line(p4_right, p5_right)
-
         # Y - отгиб толщина обрамления
-        p6_y = p5_left.y + thickness_frames_length
-        p6_left = Vec2(p5_left.x, p6_y)
-        p6_right = Vec2(p5_right.x, p6_y)
-        model_space.add_line(p5_left, p6_left)
-        model_space.add_line(p5_right, p6_right)
-
+        p6 = p5 + (0, thickness_frames_length)
         # первый вырез для гибки
-        p7_left = self.get_coordinates_angle_line(p6_left, 65, pre_arc_length)
-        p7_right = self.get_coordinates_angle_line(
-            p6_right, 115, pre_arc_length
-        )
-        model_space.add_line(p6_left, p7_left)
-        model_space.add_line(p6_right, p7_right)
-
-        a1_left = p7_left
-        a1_right = p7_right
-        a2_left = self.get_coordinates_angle_line(
-            a1_left, 100, item_arc_length
-        )
-        a2_right = self.get_coordinates_angle_line(
-            a1_right, 80, item_arc_length
-        )
-        a3_left = self.get_coordinates_angle_line(
-            a2_left, 170, item_arc_length
-        )
-        a3_right = self.get_coordinates_angle_line(
-            a2_right, 10, item_arc_length
-        )
-        arc_data_1_left = self.get_drawing_arc_data(
-            a1_left, a2_left, a3_left, clockwise=True
-        )
-        arc_data_1_right = self.get_drawing_arc_data(
-            a1_right, a2_right, a3_right, clockwise=False
-        )
-        model_space.add_arc(*arc_data_1_left)
-        model_space.add_arc(*arc_data_1_right)
-
-        p8_left = a3_left
-        p8_right = a3_right
-        p9_left = self.get_coordinates_angle_line(
-            p8_left, 180 + 25, pre_arc_length
-        )
-        p9_right = self.get_coordinates_angle_line(
-            p8_right, 335, pre_arc_length
-        )
-        model_space.add_line(p8_left, p9_left)
-        model_space.add_line(p8_right, p9_right)
-        # первый вырез для гибки - конец
-
+        p9 = p6 + tuple(self._get_top_notch_template("first", False).end)
         # X - отгиб толщина обрамления
         # самая крайняя точка по оси X
-        p10_left = Vec2(p9_left.x - thickness_frames_length, p9_left.y)
-        p10_right = Vec2(p9_right.x + thickness_frames_length, p9_right.y)
-        model_space.add_line(p9_left, p10_left)
-        model_space.add_line(p9_right, p10_right)
-
+        p10 = p9 - (thickness_frames_length, 0)
         # Y - высота наличника
-        p11_left = Vec2(p10_left.x, p10_left.y + height_length)
-        p11_right = Vec2(p10_right.x, p10_right.y + height_length)
-        model_space.add_line(p10_left, p11_left)
-        model_space.add_line(p10_right, p11_right)
-
+        p11 = p10 + self._get_points(zeros, height_length)
         # X - отгиб толщина обрамления
-        p12_left = Vec2(p11_left.x + thickness_frames_length, p11_left.y)
-        p12_right = Vec2(p11_right.x - thickness_frames_length, p11_right.y)
-        model_space.add_line(p11_left, p12_left)
-        model_space.add_line(p11_right, p12_right)
-
+        p12 = p11 + (thickness_frames_length, 0)
         # второй вырез для гибки
-        p13_left = self.get_coordinates_angle_line(
-            p12_left, 270 + 65, pre_arc_length
-        )
-        p13_right = self.get_coordinates_angle_line(
-            p12_right, 90 + 115, pre_arc_length
-        )
-        model_space.add_line(p12_left, p13_left)
-        model_space.add_line(p12_right, p13_right)
+        p15 = p12 + tuple(self._get_top_notch_template("second", False).end)
+        # Y - отгиб толщина обрамления
+        # самая крайняя точка по оси Y
+        p16 = p15 + (0, thickness_frames_length)
+
+        def get_sides(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            """Левая и отражённая правая половины."""
+            return points[:count], points[count:] * (-1, 1)
+
+        p1_left, p1_right = get_sides(p1)
+        p16_left, p16_right = get_sides(p16)
+        lines = [(p1_left, p1_right)]
+        for start, end in (
+            (p1, p2),
+            (p2, p3),
+            (p3, p4),
+            (p4, p5),
+            (p5, p6),
+            (p9, p10),
+            (p10, p11),
+            (p11, p12),
+            (p15, p16),
+        ):
+            lines.extend(zip(get_sides(start), get_sides(end), strict=True))
+        # замыкаю контур
+        lines.append((p16_left, p16_right))
 
-        a4_left = p13_left
-        a4_right = p13_right
-        a5_left = self.get_coordinates_angle_line(
-            a4_left, 270 + 100, item_arc_length
-        )
-        a5_right = self.get_coordinates_angle_line(
-            a4_right, 90 + 80, item_arc_length
-        )
-        a6_left = self.get_coordinates_angle_line(
-            a5_left, 270 + 170, item_arc_length
-        )
-        a6_right = self.get_coordinates_angle_line(
-            a5_right, 90 + 10, item_arc_length
-        )
-        arc_data_2_left = self.get_drawing_arc_data(
-            a4_left, a5_left, a6_left, clockwise=True
-        )
-        arc_data_2_right = self.get_drawing_arc_data(
-            a4_right, a5_right, a6_right, clockwise=False
+        notches = [
+            self._get_top_notches_geometry(name, mirror, side_starts)
+            for name, starts in (("first", p6), ("second", p12))
+            for mirror, side_starts in zip(
+                (False, True), get_sides(starts), strict=True
+            )
+        ]
+
+        # отверстие под крепления
+        holes: list[list[list[float]]] = [[] for _ in data]
+        if self.holes_data.diameter:
+            h_delta = self.holes_data.from_edge - 0.42
+            h = self._get_points(p12[:, 0] + h_delta, p15[:, 1] - h_delta)
+            holes = np.stack(get_sides(h), axis=1).tolist()
+
+        _, p10_right = get_sides(p10)
+        squares_in_meters = (
+            (p10_right[:, 0] * 2 / 1000) * p16_right[:, 1] / 1000
+        ).tolist()
+
+        # (n, линии, 2 точки, 2 координаты)
+        lines_coordinates = np.stack(
+            [np.stack(line, axis=1) for line in lines], axis=1
+        ).tolist()
+
+        return [
+            TopGeometryInternal(
+                lines=tuple(
+                    (Vec2(start), Vec2(end))
+                    for start, end in lines_coordinates[i]
+                ),
+                notches=tuple(n[i] for n in notches),
+                holes=tuple(map(Vec2, holes[i])),
+                square=squares_in_meters[i],
+            )
+            for i in range(count)
+        ]
+
+    # вспомогательные методы элементов деталей
+    # -------------------------------------------------------------------------
+
+    def _add_feature(
+        self,
+        model_space: DxfLayout,
+        name: str,
+        draw: Callable[[DxfLayout, Vec2], None],
+        insert: Vec2,
+    ) -> None:
+        """
+        Чертит повторяющийся элемент детали от точки insert.
+
+        В общем документе заказа элемент - общий блок, вставленный в insert.
+
+        :param name: Имя элемента (блока).
+        :param draw: Черчение элемента от точки.
+        :param insert: Начальная точка элемента.
+        """
+        if self.combined is None:
+            draw(model_space, insert)
+            return
+
+        self.combined.add_feature(
+            model_space,
+            name,
+            lambda block: draw(block, self.ZERO_POINT),
+            insert,
         )
-        model_space.add_arc(*arc_data_2_left)
-        model_space.add_arc(*arc_data_2_right)
 
-        p14_left = a6_left
-        p14_right = a6_right
-        p15_left = self.get_coordinates_angle_line(
-            p14_left, 90 + 25, pre_arc_length
+    @classmethod
+    @cache
+    def _get_top_notch_template(
+        cls, name: str, mirror: bool
+    ) -> NotchGeometryInternal:
+        """
+        Возвращает вырез для гибки от начала координат (см. TOP_NOTCHES).
+
+        :param name: Имя выреза.
+        :param mirror: Правый вырез - отражение левого по оси Y.
+        """
+        line_angle_1, arc_angle_1, arc_angle_2, line_angle_2, clockwise = (
+            cls.TOP_NOTCHES[name]
         )
-        p15_right = self.get_coordinates_angle_line(
-            p14_right, 65, pre_arc_length
+        line_length = cls.TOP_NOTCH_LINE_LENGTH
+        arc_length = cls.TOP_NOTCH_ARC_LENGTH
+
+        start = cls.ZERO_POINT
+        a1 = cls.get_coordinates_angle_line(start, line_angle_1, line_length)
+        a2 = cls.get_coordinates_angle_line(a1, arc_angle_1, arc_length)
+        a3 = cls.get_coordinates_angle_line(a2, arc_angle_2, arc_length)
+        end = cls.get_coordinates_angle_line(a3, line_angle_2, line_length)
+        center, radius, start_angle, end_angle = cls.get_drawing_arc_data(
+            a1, a2, a3, clockwise=clockwise
         )
-        model_space.add_line(p14_left, p15_left)
-        model_space.add_line(p14_right, p15_right)
-        # второй вырез для гибки - конец
 
-        # Y - отгиб толщина обрамления
-        # самая крайняя точка по оси Y
-        p16_y = p15_left.y + thickness_frames_length
-        p16_left = Vec2(p15_left.x, p16_y)
-        p16_right = Vec2(p15_right.x, p16_y)
-        model_space.add_line(p15_left, p16_left)
-        model_space.add_line(p15_right, p16_right)
+        if not mirror:
+            return NotchGeometryInternal(
+                name=f"{name}_left",
+                start=start,
+                lines=((start, a1), (a3, end)),
+                arc=(center, radius, start_angle, end_angle),
+                end=end,
+            )
 
-        # замыкаю контур
-        model_space.add_line(p16_left, p16_right)
+        def get_mirror(point: Vec2) -> Vec2:
+            return Vec2(-point.x, point.y)
+
+        # при отражении направление дуги меняется
+        return NotchGeometryInternal(
+            name=f"{name}_right",
+            start=start,
+            lines=((start, get_mirror(a1)), (get_mirror(a3), get_mirror(end))),
+            arc=(
+                get_mirror(center),
+                radius,
+                180 - end_angle,
+                180 - start_angle,
+            ),
+            end=get_mirror(end),
+        )
 
-        # отверстие под крепления
-        if self.holes_data.diameter:
-            h_delta = self.holes_data.from_edge - 0.42
-            h_left = Vec2(p12_left.x + h_delta, p15_left.y - h_delta)
-            h_right = Vec2(p12_right.x - h_delta, p15_right.y - h_delta)
-            for h in (h_left, h_right):
-                model_space.add_circle(
-                    center=h, radius=self.holes_data.diameter / 2
+    def _get_top_notches_geometry(
+        self, name: str, mirror: bool, starts: np.ndarray
+    ) -> list[NotchGeometryInternal]:
+        """
+        Возвращает вырезы для гибки: шаблон, перенесённый в точки starts.
+
+        :param name: Имя выреза.
+        :param mirror: Правый вырез.
+        :param starts: Начальные точки вырезов, массив (n, 2).
+        """
+        template = self._get_top_notch_template(name, mirror)
+        (_, a1), (a3, end) = template.lines
+        center, radius, start_angle, end_angle = template.arc
+
+        notches = []
+        for start in map(Vec2, starts.tolist()):
+            notches.append(
+                NotchGeometryInternal(
+                    name=template.name,
+                    start=start,
+                    lines=((start, start + a1), (start + a3, start + end)),
+                    arc=(start + center, radius, start_angle, end_angle),
+                    end=start + end,
                 )
+            )
+        return notches
 
-        file_name = self._get_top_file_name(data=data, numbers=numbers)
-        path = self._get_absolute_path(*(str(self.path_tops), file_name))
-        document.saveas(path)
+    def _draw_top_notch(
+        self, model_space: DxfLayout, notch: NotchGeometryInternal
+    ) -> None:
+        """
+        Чертит вырез для гибки верхушки.
+
+        В общем документе - блок выреза от начала координат.
+        """
+        if self.combined is None:
+            self._draw_notch_entities(model_space, notch)
+            return
+
+        self.combined.add_feature(
+            model_space,
+            f"TOP_NOTCH_{notch.name.upper()}",
+            partial(self._draw_top_notch_block, name=notch.name),
+            notch.start,
+        )
 
-        square_in_meters = (p10_right.x * 2 / 1000) * p16_right.y / 1000
+    def _draw_top_notch_block(self, block: DxfLayout, name: str) -> None:
+        """Чертит вырез для гибки от начала координат."""
+        notch_name, side = name.rsplit("_", 1)
+        self._draw_notch_entities(
+            block, self._get_top_notch_template(notch_name, side == "right")
+        )
 
-        return file_name, square_in_meters
+    @staticmethod
+    def _draw_notch_entities(
+        model_space: DxfLayout, notch: NotchGeometryInternal
+    ) -> None:
+        """Чертит линии и дугу выреза для гибки."""
+        for start, end in notch.lines:
+            model_space.add_line(start, end)
+        model_space.add_arc(*notch.arc)
+
+    def _draw_hole(self, model_space: DxfLayout, center: Vec2) -> None:
+        """Чертит отверстие под крепление."""
+        model_space.add_circle(
+            center=center, radius=self.holes_data.diameter / 2
+        )
 
     # вспомогательные методы стоек
     # -------------------------------------------------------------------------
 
+    @MetricsService.timed("frames.draw_stand")
     def _draw_stand_platband(
         self,
-        data: PlatbandPostInternalSchema,
+        data: PlatbandPostInternal,
         numbers: list[str],
         side: SideEnum,
     ) -> tuple[str, float]:
         """Чертит стойку."""
+        geometry = self._get_stand_geometry(data, side)
+
         document, model_space = self.get_document_and_model_space()
 
         # контур
-        contour_coordinates = self._get_stand_contour_coordinates(
-            data=data, side=side
-        )
-        model_space.add_polyline2d(points=contour_coordinates, close=True)
+        model_space.add_polyline2d(points=geometry.contour, close=True)
 
         # отверстие под крепления
-        if self.holes_data.diameter:
-            coordinates_holes_stands = self._get_stand_coordinates_holes(
-                side=side
+        if geometry.holes:
+            self._add_feature(
+                model_space,
+                f"STAND_HOLES_{side.name}",
+                partial(self._draw_stand_holes, holes=geometry.holes),
+                self.ZERO_POINT,
             )
-            for coordinate in coordinates_holes_stands:
-                model_space.add_circle(
-                    center=coordinate, radius=self.holes_data.diameter / 2
-                )
 
         # отверстие под кнопку
-        if data.button_hole:
-            coordinates_button_hole = self._get_button_hole_coordinates(
-                data=data, side=side
-            )
-            model_space.add_polyline2d(
-                points=coordinates_button_hole, close=True
-            )
+        if geometry.button_hole:
+            model_space.add_polyline2d(points=geometry.button_hole, close=True)
 
         file_name = self._get_stand_file_name(
             data=data, numbers=numbers, side=side
         )
         path = self._get_absolute_path(*(str(self.path_stands), file_name))
-        document.saveas(path)
+        self.save_document(document, path)
+
+        return file_name, geometry.square
+
+    def _get_stand_geometry(
+        self, data: PlatbandPostInternal, side: SideEnum
+    ) -> StandGeometryInternal:
+        """Возвращает геометрию стойки (кэш)."""
+        return self.geometry_cache.get(
+            self._get_stand_cache_key(data, side),
+            lambda: self._get_stands_geometry([data], side)[0],
+        )
+
+    def _get_stands_geometry(
+        self, data: Sequence[PlatbandPostInternal], side: SideEnum
+    ) -> list[StandGeometryInternal]:
+        """Возвращает геометрию стоек одной стороны (пакетно, numpy)."""
+        contours = self._get_stands_contour_coordinates(data=data, side=side)
+        squares_in_meters = (
+            np.abs(contours[:, 2, 0]) / 1000 * contours[:, 2, 1] / 1000
+        ).tolist()
+
+        # отверстия под крепления одинаковые для стоек стороны
+        holes = (
+            self._get_stand_coordinates_holes(side=side)
+            if self.holes_data.diameter
+            else ()
+        )
+
+        indexes = [i for i, d in enumerate(data) if d.button_hole]
+        button_holes: dict[int, list[list[float]]] = {}
+        if indexes:
+            button_holes = dict(
+                zip(
+                    indexes,
+                    self._get_button_holes_coordinates(
+                        data=[data[i] for i in indexes], side=side
+                    ).tolist(),
+                    strict=True,
+                )
+            )
+
+        return [
+            StandGeometryInternal(
+                contour=tuple(map(Vec2, contour)),
+                holes=holes,
+                button_hole=(
+                    tuple(map(Vec2, button_holes[i]))
+                    if i in button_holes
+                    else None
+                ),
+                square=squares_in_meters[i],
+            )
+            for i, contour in enumerate(contours.tolist())
+        ]
+
+    def _draw_stand_holes(
+        self, model_space: DxfLayout, start: Vec2, holes: tuple[Vec2, ...]
+    ) -> None:
+        """Чертит отверстия под крепления стойки от точки start."""
+        for coordinate in holes:
+            model_space.add_circle(
+                center=start + coordinate,
+                radius=self.holes_data.diameter / 2,
+            )
+
+    def _get_stand_cache_key(
+        self, data: PlatbandPostInternal, side: SideEnum
+    ) -> tuple[Any, ...]:
+        """Возвращает ключ кэша геометрии стойки."""
+        return "stand", side, data, *self._get_order_key()
 
-        p3 = contour_coordinates[2]
-        square_in_meters = abs(p3.x) / 1000 * p3.y / 1000
+    def _get_top_cache_key(self, data: PlatbandTopInternal) -> tuple[Any, ...]:
+        """Возвращает ключ кэша геометрии верхнего наличника."""
+        return "top", data, *self._get_order_key()
 
-        return file_name, square_in_meters
+    def _get_order_key(self) -> tuple[Any, ...]:
+        """Возвращает параметры заказа, от которых зависит геометрия."""
+        return (
+            self.thickness,
+            self.thickness_frames,
+            self.height_platband_stands,
+            self.doorway,
+            *self.holes_data.model_dump().values(),
+        )
 
     @staticmethod
     def _select_func_side(
@@ -436,48 +1011,60 @@ class FramesOneFold(FramesBase):
             case _:
                 assert_never(side)
 
-    def _get_stand_contour_coordinates(
-        self, data: PlatbandPostInternalSchema, side: SideEnum
-    ) -> tuple[Vec2, Vec2, Vec2, Vec2]:
-        """Возвращает координаты контура стойки."""
+    def _get_stands_contour_coordinates(
+        self, data: Sequence[PlatbandPostInternal], side: SideEnum
+    ) -> np.ndarray:
+        """Возвращает координаты контуров стоек, массив (n, 4, 2)."""
         func_side = self._select_func_side(side)
 
+        depth, width = (
+            np.array([(d.depth, d.width) for d in data], dtype=float)
+            .reshape(-1, 2)
+            .T
+        )
         width = (
-            data.depth
-            + data.width
+            depth
+            + width
             + self.thickness_frames
             - self._material_data.INACCURACY_STEEL_REAMER
         )
         height = self.height_platband_stands
 
-        p1 = self.ZERO_POINT
-        p2 = Vec2(p1.x, p1.y + height)
-
-        p3_x = p2.x + func_side(width)
-        p3 = Vec2(p3_x, p2.y)
+        p1 = self._get_points(np.zeros_like(width) + self.ZERO_POINT.x, 0)
+        p2 = p1 + (0, height)
+        p3 = p2 + self._get_points(func_side(width), 0)
+        p4 = p3 - (0, height)
 
-        p4 = Vec2(p3.x, p3.y - height)
+        return np.stack((p1, p2, p3, p4), axis=1)
 
-        return p1, p2, p3, p4
-
-    def _get_button_hole_coordinates(
-        self, data: PlatbandPostInternalSchema, side: SideEnum
-    ) -> tuple[Vec2, Vec2, Vec2, Vec2]:
-        """Возвращает координаты отверстия под кнопку."""
+    def _get_button_holes_coordinates(
+        self, data: Sequence[PlatbandPostInternal], side: SideEnum
+    ) -> np.ndarray:
+        """Возвращает координаты отверстий под кнопку, массив (n, 4, 2)."""
         inaccuracy = self._material_data.INACCURACY_ONE_FOLD
         func_side = self._select_func_side(side)
 
-        width_hole, height_hole = map(float, data.button_hole.split("*"))
+        width, width_hole, height_hole = (
+            np.array(
+                [
+                    (d.width, *cast(tuple[float, float], d.button_hole))
+                    for d in data
+                ],
+                dtype=float,
+            )
+            .reshape(-1, 3)
+            .T
+        )
 
         if self.holes_data.button_hole_x_center_coordinate:
             x1_delta = (
-                data.width
+                width
                 - self.holes_data.button_hole_x_center_coordinate
                 - width_hole / 2
             )
         else:
             # по умолчанию посередине стойки
-            x1_delta = data.width / 2 - width_hole / 2
+            x1_delta = width / 2 - width_hole / 2
         x1 = func_side(self.thickness_frames + x1_delta - inaccuracy)
 
         if self.holes_data.button_hole_y_center_coordinate:
@@ -489,12 +1076,19 @@ class FramesOneFold(FramesBase):
             # по умолчанию 1250 мм от пола
             y1 = 1250 - height_hole / 2
 
-        p1 = Vec2(x1, y1)
-        p2 = Vec2(p1.x, p1.y + height_hole)
-        p3 = Vec2(p2.x + func_side(width_hole), p2.y)
-        p4 = Vec2(p3.x, p3.y - height_hole)
+        p1 = self._get_points(x1, y1)
+        p2 = p1 + self._get_points(0, height_hole)
+        p3 = p2 + self._get_points(func_side(width_hole), 0)
+        p4 = p3 - self._get_points(0, height_hole)
 
-        return p1, p2, p3, p4
+        return np.stack((p1, p2, p3, p4), axis=1)
+
+    @staticmethod
+    def _get_points(
+        x: np.ndarray | float, y: np.ndarray | float
+    ) -> np.ndarray:
+        """Возвращает массив точек (n, 2) из координат x и y."""
+        return np.column_stack(np.broadcast_arrays(x, y)).astype(float)
 
     def _get_stand_coordinates_holes(
         self, side: SideEnum
@@ -518,9 +1112,26 @@ class FramesOneFold(FramesBase):
 
         return cast(tuple[Vec2, Vec2, Vec2], result)
 
+    def _snap(self, value: float) -> float:
+        """Привязывает размер к сетке изготовления grid_step."""
+        if not self.grid_step:
+            return value
+        # округление убирает погрешность умножения на шаг сетки
+        return round(round(value / self.grid_step) * self.grid_step, 6)
+
+    @staticmethod
+    def _parse_button_hole(
+        button_hole: str | None,
+    ) -> tuple[float, float] | None:
+        """Возвращает ширину и высоту отверстия под кнопку из "Ш*В"."""
+        if not button_hole:
+            return None
+        width_hole, height_hole = map(float, button_hole.split("*"))
+        return width_hole, height_hole
+
     @staticmethod
     def _get_stand_file_name(
-        data: PlatbandPostInternalSchema, numbers: list[str], side: SideEnum
+        data: PlatbandPostInternal, numbers: list[str], side: SideEnum
     ) -> str:
         """Возвращает имя файла стойки."""
         if side != side.IDENTICAL:
@@ -528,10 +1139,9 @@ class FramesOneFold(FramesBase):
         else:
             side_output = ""
 
-        button_hole = data.button_hole
-        if button_hole:
-            button_hole = button_hole.replace("*", "_")
-            hole_output = f"_Отв-{button_hole}"
+        if data.button_hole:
+            width_hole, height_hole = data.button_hole
+            hole_output = f"_Отв-{width_hole:g}_{height_hole:g}"
         else:
             hole_output = ""
 
@@ -544,7 +1154,7 @@ class FramesOneFold(FramesBase):
         )
 
     def _get_top_file_name(
-        self, data: FramesOneFoldInputSchema, numbers: list[str]
+        self, data: PlatbandTopInternal, numbers: list[str]
     ) -> str:
         return (
             f"{len(numbers)}шт"
@@ -557,6 +1167,27 @@ class FramesOneFold(FramesBase):
         )
 
 
+# сервис черчения процесса пула
+_draw_worker_frames: FramesOneFold | None = None
+
+
+def init_draw_worker(frames: FramesOneFold) -> None:
+    """Настраивает процесс пула черчения деталей."""
+    global _draw_worker_frames
+    _draw_worker_frames = frames
+    logging.getLogger("ezdxf").propagate = False
+
+
+def draw_job(job: DrawJob) -> tuple[str, float, list[tuple[str, bytes]]]:
+    """Чертит деталь в процессе пула, файлы возвращаются в результате."""
+    if _draw_worker_frames is None:
+        raise FramesNeverError("Процесс черчения не настроен.")
+    writer = DxfBufferWriter()
+    _draw_worker_frames.writer = writer
+    file_name, square = _draw_worker_frames.draw_job(job)
+    return file_name, square, writer.pop_files()
+
+
 class FramesOneFoldStandsHelper:
     def __init__(
         self,
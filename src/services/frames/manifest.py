@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from services.base.service import BaseService
+from services.frames.schemas.frames_common.internal import (
+    ManifestFileInternalSchema,
+    ManifestInternalSchema,
+)
+from services.frames.writer import DxfWriterService
+
+
+class FramesManifestService(BaseService):
+    """
+    Манифест файлов папки заказа для повторного черчения.
+
+    Хранит для каждого файла детали хэш её параметров и площадь. При
+    повторном черчении файлы с тем же хэшем не перечерчиваются, файлы из
+    манифеста, которых нет в новом черчении, удаляются. Файлы, созданные не
+    черчением (нет в манифесте), не трогаются. Удаляются только dxf файлы
+    папок деталей и общий файл заказа: манифест лежит в папке заказа и
+    может быть изменён не черчением.
+
+    :param path_folder: Папка заказа.
+    """
+
+    FILE_NAME = ".frames_manifest.json"
+    # увеличить при изменении формата манифеста
+    VERSION = 1
+    # папки файлов деталей (FramesOneFold.path_stands, path_tops)
+    FOLDERS = ("Стойки", "Верхушки")
+    SUFFIX = ".dxf"
+
+    def __init__(self, path_folder: str) -> None:
+        self.path_folder = Path(path_folder)
+        self.path = self.path_folder / self.FILE_NAME
+
+    @staticmethod
+    def get_hash(params: dict[str, Any]) -> str:
+        """Возвращает хэш параметров детали."""
+        return hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get_key(self, path: Path) -> str:
+        """Возвращает ключ файла: путь относительно папки заказа."""
+        return path.relative_to(self.path_folder).as_posix()
+
+    def load(self) -> dict[str, ManifestFileInternalSchema]:
+        """Возвращает файлы манифеста, без манифеста - пустой словарь."""
+        try:
+            manifest = ManifestInternalSchema.model_validate_json(
+                self.path.read_bytes()
+            )
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            # повреждённый манифест - черчение всех деталей
+            logging.warning(
+                self._get_common_log_information(self.load)
+                + f"Не удалось прочитать манифест {self.path}.",
+                exc_info=exc,
+            )
+            return {}
+
+        if manifest.version != self.VERSION:
+            return {}
+        return manifest.files
+
+    def save(self, files: dict[str, ManifestFileInternalSchema]) -> None:
+        """Сохраняет манифест."""
+        manifest = ManifestInternalSchema(version=self.VERSION, files=files)
+        try:
+            DxfWriterService.write_atomic(
+                str(self.path), manifest.model_dump_json(indent=1).encode()
+            )
+        except Exception as exc:
+            # без манифеста следующее черчение будет полным
+            logging.warning(
+                self._get_common_log_information(self.save)
+                + f"Не удалось сохранить манифест {self.path}.",
+                exc_info=exc,
+            )
+
+    def delete_stale(
+        self, old_files: dict[str, ManifestFileInternalSchema], keys: set[str]
+    ) -> list[str]:
+        """
+        Удаляет файлы старого манифеста, которых нет в новом черчении.
+
+        :param old_files: Файлы старого манифеста.
+        :param keys: Ключи файлов нового черчения.
+        """
+        deleted = []
+        for key in old_files.keys() - keys:
+            path = self.path_folder / key
+            if not self.is_drawing_file(path):
+                logging.warning(
+                    self._get_common_log_information(self.delete_stale)
+                    + f"Файл манифеста {key} не удалён: не файл черчения."
+                )
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                logging.warning(
+                    self._get_common_log_information(self.delete_stale)
+                    + f"Не удалось удалить файл {path}.",
+                    exc_info=exc,
+                )
+                continue
+            deleted.append(key)
+        return sorted(deleted)
+
+    def is_drawing_file(self, path: Path) -> bool:
+        """
+        Проверяет, что путь - dxf файл черчения папки заказа.
+
+        Файлы черчения: файлы деталей в папках FOLDERS и общий файл заказа
+        (<имя папки заказа>.dxf).
+        """
+        folder = self.path_folder.resolve()
+        path = path.resolve()
+        if path.suffix.lower() != self.SUFFIX:
+            return False
+        if not path.is_relative_to(folder):
+            return False
+
+        parent = path.relative_to(folder).parent
+        if parent == Path():
+            return path.name == f"{folder.name}{self.SUFFIX}"
+        return len(parent.parts) == 1 and parent.name in self.FOLDERS
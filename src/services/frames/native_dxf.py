@@ -0,0 +1,197 @@
+import os
+import re
+from collections.abc import Iterable, Sequence
+from io import StringIO
+from typing import Any
+
+from ezdxf.document import Drawing
+
+from services.frames.exception import FramesNeverError
+
+
+# точка: Vec2 или последовательность координат
+Point = Sequence[float]
+
+
+class NativeDxfTemplate:
+    """
+    Текст dxf документа (DXF 2000), в который вставляются сущности деталей.
+
+    Заголовок, таблицы, блоки и объекты берутся из документа ezdxf один раз,
+    при записи детали меняются только секция ENTITIES и $HANDSEED.
+
+    :param document: Документ ezdxf (прототип или шаблон) без сущностей
+        деталей.
+    """
+
+    ENTITIES_START = "  0\nSECTION\n  2\nENTITIES\n"
+    SECTION_END = "  0\nENDSEC\n"
+    HANDSEED_PATTERN = re.compile(r"(\$HANDSEED\n  5\n)([0-9A-Fa-f]+)\n")
+
+    def __init__(self, document: Drawing) -> None:
+        stream = StringIO()
+        document.write(stream)
+        text = stream.getvalue()
+
+        entities_start = text.find(self.ENTITIES_START)
+        if entities_start == -1:
+            raise FramesNeverError("В документе нет секции ENTITIES.")
+        entities_start += len(self.ENTITIES_START)
+        entities_end = text.index(self.SECTION_END, entities_start)
+
+        handseed = self.HANDSEED_PATTERN.search(text, 0, entities_start)
+        if handseed is None:
+            raise FramesNeverError("В документе нет $HANDSEED.")
+
+        self.encoding = document.output_encoding
+        self.owner = document.modelspace().block_record_handle
+        self.start_handle = int(handseed.group(2), 16)
+
+        # текст до значения $HANDSEED, от него до конца сущностей шаблона,
+        # после сущностей
+        self._head = text[: handseed.end(1)]
+        self._body = text[handseed.end(2) : entities_end]
+        self._tail = text[entities_end:]
+
+    def new_document(self) -> "NativeDxfDocument":
+        """Возвращает пустой документ детали."""
+        return NativeDxfDocument(self)
+
+    def get_data(self, entities: str, handseed: int) -> bytes:
+        """Возвращает содержимое dxf файла с сущностями."""
+        text = "".join(
+            (self._head, f"{handseed:X}", self._body, entities, self._tail)
+        )
+        # как при записи в текстовом режиме (saveas)
+        return text.replace("\n", os.linesep).encode(
+            self.encoding, errors="dxfreplace"
+        )
+
+
+class NativeDxfDocument:
+    """
+    Документ детали: сущности записываются сразу в текст DXF 2000.
+
+    Поддерживаются только сущности, которые используют обрамления: LINE,
+    ARC, CIRCLE и POLYLINE (2d). Методы модели совпадают с ezdxf.
+
+    :param template: Текст документа шаблона.
+    """
+
+    def __init__(self, template: NativeDxfTemplate) -> None:
+        self.template = template
+        self._owner = template.owner
+        self._handle = template.start_handle
+        self._parts: list[str] = []
+        # сущностей модели (вершины полилинии - часть полилинии)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Количество сущностей модели, как len(Modelspace) у ezdxf."""
+        return self._count
+
+    def modelspace(self) -> "NativeDxfDocument":
+        """Возвращает модель (сам документ)."""
+        return self
+
+    def get_data(self) -> bytes:
+        """Возвращает содержимое dxf файла."""
+        return self.template.get_data("".join(self._parts), self._handle)
+
+    # Сущности
+    # -------------------------------------------------------------------------
+
+    def add_line(
+        self,
+        start: Point,
+        end: Point,
+        dxfattribs: dict[str, Any] | None = None,
+    ) -> None:
+        """Добавляет отрезок."""
+        self._add_entity("LINE", dxfattribs)
+        self._parts.append(
+            f"100\nAcDbLine\n{self._point(start)}"
+            f"{self._point(end, 11, 21, 31)}"
+        )
+
+    def add_circle(
+        self,
+        center: Point,
+        radius: float,
+        dxfattribs: dict[str, Any] | None = None,
+    ) -> None:
+        """Добавляет окружность."""
+        self._add_entity("CIRCLE", dxfattribs)
+        self._parts.append(
+            f"100\nAcDbCircle\n{self._point(center)} 40\n{float(radius)}\n"
+        )
+
+    def add_arc(
+        self,
+        center: Point,
+        radius: float,
+        start_angle: float,
+        end_angle: float,
+        is_counter_clockwise: bool = True,
+        dxfattribs: dict[str, Any] | None = None,
+    ) -> None:
+        """Добавляет дугу (углы в градусах)."""
+        if not is_counter_clockwise:
+            start_angle, end_angle = end_angle, start_angle
+
+        self._add_entity("ARC", dxfattribs)
+        self._parts.append(
+            f"100\nAcDbCircle\n{self._point(center)} 40\n{float(radius)}\n"
+            f"100\nAcDbArc\n 50\n{float(start_angle)}\n"
+            f" 51\n{float(end_angle)}\n"
+        )
+
+    def add_polyline2d(
+        self,
+        points: Iterable[Point],
+        close: bool = False,
+        dxfattribs: dict[str, Any] | None = None,
+    ) -> None:
+        """Добавляет 2d полилинию."""
+        polyline_handle = self._add_entity("POLYLINE", dxfattribs)
+        self._parts.append(
+            f"100\nAcDb2dPolyline\n 66\n1\n{self._point((0, 0))}"
+            f" 70\n{1 if close else 0}\n"
+        )
+        for point in points:
+            self._add_entity("VERTEX", dxfattribs, owner=polyline_handle)
+            self._parts.append(
+                f"100\nAcDbVertex\n100\nAcDb2dVertex\n{self._point(point)}"
+                " 70\n0\n"
+            )
+        self._add_entity("SEQEND", dxfattribs, owner=polyline_handle)
+
+    def _add_entity(
+        self,
+        name: str,
+        dxfattribs: dict[str, Any] | None,
+        owner: str | None = None,
+    ) -> str:
+        """Добавляет общие данные сущности, возвращает её handle."""
+        handle = f"{self._handle:X}"
+        self._handle += 1
+        if owner is None:
+            self._count += 1
+        layer = (dxfattribs or {}).get("layer", "0")
+        self._parts.append(
+            f"  0\n{name}\n  5\n{handle}\n330\n{owner or self._owner}\n"
+            f"100\nAcDbEntity\n  8\n{layer}\n"
+        )
+        return handle
+
+    @staticmethod
+    def _point(
+        point: Point, x_code: int = 10, y_code: int = 20, z_code: int = 30
+    ) -> str:
+        """Возвращает группы координат точки, без z - нулевая."""
+        z = point[2] if len(point) > 2 else 0
+        return (
+            f"{x_code:>3}\n{float(point[0])}\n"
+            f"{y_code:>3}\n{float(point[1])}\n"
+            f"{z_code:>3}\n{float(z)}\n"
+        )
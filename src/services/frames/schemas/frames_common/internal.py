@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class ManifestFileInternalSchema(BaseModel):
+    """Файл детали в манифесте папки заказа."""
+
+    # хэш параметров детали
+    hash: str
+    # площадь детали, м2 (для веса без черчения)
+    square: float
+
+
+class ManifestInternalSchema(BaseModel):
+    """Манифест файлов папки заказа."""
+
+    version: int
+    # путь файла относительно папки заказа -> данные файла
+    files: dict[str, ManifestFileInternalSchema] = {}
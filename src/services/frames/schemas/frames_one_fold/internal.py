@@ -1,25 +1,52 @@
-from typing import Any
+from typing import NamedTuple
 
-from pydantic import BaseModel
+from ezdxf.math import Vec2
 
 
-class PlatbandPostInternalSchema(BaseModel):
-    """Внутренняя схема стойки обрамления."""
+class PlatbandPostInternal(NamedTuple):
+    """Стойка обрамления: ключ группировки деталей."""
 
     depth: float
     width: float
-    button_hole: str | None
-
-    def __hash__(self) -> int:
-        """Возвращает хэш."""
-        return hash((self.depth, self.width, self.button_hole))
-
-    def __eq__(self, other: Any) -> bool:
-        """Возвращает результат сравнения объектов."""
-        return all(
-            (
-                self.depth == other.depth,
-                self.width == other.width,
-                self.button_hole == other.button_hole,
-            )
-        )
+    # ширина и высота отверстия под кнопку, мм
+    button_hole: tuple[float, float] | None
+
+
+class PlatbandTopInternal(NamedTuple):
+    """Верхний наличник обрамления: ключ группировки деталей."""
+
+    depth: float
+    width_left: float
+    width_right: float
+    height_top: float
+
+
+class NotchGeometryInternal(NamedTuple):
+    """Геометрия выреза для гибки."""
+
+    name: str
+    start: Vec2
+    lines: tuple[tuple[Vec2, Vec2], ...]
+    # центр, радиус, начальный и конечный углы
+    arc: tuple[Vec2, float, float, float]
+    end: Vec2
+
+
+class StandGeometryInternal(NamedTuple):
+    """Геометрия стойки: контур, отверстия под крепления, под кнопку."""
+
+    contour: tuple[Vec2, ...]
+    holes: tuple[Vec2, ...]
+    button_hole: tuple[Vec2, ...] | None
+    # площадь, м2
+    square: float
+
+
+class TopGeometryInternal(NamedTuple):
+    """Геометрия верхнего наличника: контур, вырезы для гибки, отверстия."""
+
+    lines: tuple[tuple[Vec2, Vec2], ...]
+    notches: tuple[NotchGeometryInternal, ...]
+    holes: tuple[Vec2, ...]
+    # площадь, м2
+    square: float
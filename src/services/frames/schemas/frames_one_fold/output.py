@@ -0,0 +1,33 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class FramesQuotePartOutputSchema(BaseModel):
+    """Деталь расчёта заказа без черчения."""
+
+    # имя файла детали (как при черчении)
+    file_name: str
+    # вид детали: left, right, identical (стойки), top (верхний наличник)
+    kind: str
+    count: int
+    # площадь развёртки одной детали, м2
+    square: float
+    # вес одной детали, кг
+    weight: float
+    # номера строк
+    numbers: list[Any]
+
+
+class FramesQuoteOutputSchema(BaseModel):
+    """Расчёт заказа без черчения: детали, площадь и вес."""
+
+    parts: list[FramesQuotePartOutputSchema] = []
+    files_count: int = 0
+    parts_count: int = 0
+    # площадь развёртки всех деталей, м2
+    square: float = 0.0
+    # вес всех деталей, кг
+    weight: float = 0.0
+    # средний вес комплекта, кг
+    average_weight: float = 0.0
@@ -0,0 +1,123 @@
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from services.base.service import BaseService
+from services.metrics.service import MetricsService
+
+
+class DxfWriterService(BaseService):
+    """
+    Фоновая запись dxf файлов (write-behind).
+
+    Документы сериализуются при черчении, запись на диск выполняется в пуле
+    потоков, черчение и запись идут одновременно. Очередь ограничена
+    max_pending: submit ждёт, пока очередь не освободится. Файл пишется во
+    временный файл той же папки и переименовывается, недописанных dxf файлов
+    не остаётся. Ошибки записи собираются в errors.
+
+    :param max_workers: Количество потоков записи.
+    :param max_pending: Максимум файлов в очереди записи.
+    """
+
+    TMP_SUFFIX = ".tmp"
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        # путь файла -> текст ошибки записи
+        self.errors: dict[str, str] = {}
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        """Контекстный менеджер вход: запуск пула записи."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="dxf_writer"
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Контекстный менеджер выход: ожидание записи всех файлов."""
+        self.close()
+
+    def submit(self, path: str, data: bytes) -> None:
+        """Ставит файл в очередь записи."""
+        if self._executor is None:
+            # без пула - запись в текущем потоке
+            self._write(path, data)
+            return
+
+        self._pending.acquire()
+        future = self._executor.submit(self._write, path, data)
+        future.add_done_callback(self._release)
+
+    def close(self) -> None:
+        """Дожидается записи всех файлов очереди."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @classmethod
+    def write_atomic(cls, path: str, data: bytes) -> None:
+        """Записывает файл через временный файл и переименование."""
+        file_path = Path(path)
+        # уникальное имя в той же папке: переименование атомарно
+        tmp_path = file_path.with_name(
+            f".{file_path.name}.{os.getpid()}.{threading.get_ident()}"
+            f"{cls.TMP_SUFFIX}"
+        )
+        try:
+            with MetricsService.span("dxf.write"):
+                tmp_path.write_bytes(data)
+                tmp_path.replace(file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write(self, path: str, data: bytes) -> None:
+        try:
+            self.write_atomic(path, data)
+        except Exception as exc:
+            logging.error(
+                self._get_common_log_information(self._write)
+                + f"Не удалось записать файл {path}.",
+                exc_info=exc,
+            )
+            with self._lock:
+                self.errors[path] = f"{type(exc).__name__}: {exc}"
+
+    def _release(self, _: Future[None]) -> None:
+        self._pending.release()
+
+
+class DxfBufferWriter:
+    """
+    Накопитель файлов вместо записи на диск.
+
+    Используется в процессах пула черчения: файлы передаются в основной
+    процесс и записываются его DxfWriterService.
+    """
+
+    def __init__(self) -> None:
+        self._files: list[tuple[str, bytes]] = []
+
+    def submit(self, path: str, data: bytes) -> None:
+        """Сохраняет файл в буфер."""
+        self._files.append((path, data))
+
+    def pop_files(self) -> list[tuple[str, bytes]]:
+        """Возвращает накопленные файлы и очищает буфер."""
+        files, self._files = self._files, []
+        return files
@@ -0,0 +1,198 @@
+import json
+import os
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from time import perf_counter, time
+from typing import Any, TextIO, TypeVar
+from uuid import uuid4
+
+
+FuncType = TypeVar("FuncType", bound=Callable[..., Any])
+
+
+class MetricsService:
+    """
+    Метрики обработки заказов: время этапов (span) и записанные файлы.
+
+    Записи добавляются строками JSON в файл метрик (JSON lines) сразу, с
+    run - идентификатором запуска. Включается enable: путь файла и запуск
+    передаются через переменные окружения, поэтому процессы пулов пишут в
+    тот же файл. Выключенные метрики - только проверка переменной окружения.
+
+    Запись span: {"type": "span", "name", "seconds", ...атрибуты};
+    запись файла: {"type": "file", "path", "entities", "bytes"}.
+    """
+
+    ENV_FILE = "FRAMES_METRICS_FILE"
+    ENV_RUN = "FRAMES_METRICS_RUN"
+    DEFAULT_FILE = "metrics.jsonl"
+
+    _lock = threading.Lock()
+    # открытый файл метрик процесса: (pid, путь, файл)
+    _file: tuple[int, str, TextIO] | None = None
+
+    @classmethod
+    def enable(cls, path: str = DEFAULT_FILE) -> str:
+        """
+        Включает метрики текущего процесса и дочерних процессов.
+
+        :param path: Файл метрик, записи добавляются в конец.
+        :return: Идентификатор запуска.
+        """
+        run = uuid4().hex
+        os.environ[cls.ENV_FILE] = str(Path(path).resolve())
+        os.environ[cls.ENV_RUN] = run
+        return run
+
+    @classmethod
+    def disable(cls) -> None:
+        """Выключает метрики и закрывает файл."""
+        os.environ.pop(cls.ENV_FILE, None)
+        os.environ.pop(cls.ENV_RUN, None)
+        with cls._lock:
+            if cls._file is not None:
+                cls._file[2].close()
+                cls._file = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Проверяет, что метрики включены."""
+        return cls.ENV_FILE in os.environ
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, **attributes: Any) -> Iterator[None]:
+        """
+        Замеряет время блока (в том числе завершённого исключением).
+
+        :param name: Имя этапа, например "excel.get_rows_data".
+        :param attributes: Атрибуты записи (файл, количество строк и т.д.).
+        """
+        if not cls.is_enabled():
+            yield
+            return
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            cls.add(
+                "span",
+                name=name,
+                seconds=perf_counter() - start,
+                **attributes,
+            )
+
+    @classmethod
+    def timed(cls, name: str) -> Callable[[FuncType], FuncType]:
+        """Декоратор: span на каждый вызов функции."""
+
+        def decorator(func: FuncType) -> FuncType:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with cls.span(name):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    @classmethod
+    def add_file(cls, path: str, entities: int, size: int) -> None:
+        """
+        Добавляет запись о dxf файле детали.
+
+        :param path: Путь файла.
+        :param entities: Сущностей в модели.
+        :param size: Записано байт.
+        """
+        if cls.is_enabled():
+            cls.add("file", path=path, entities=entities, bytes=size)
+
+    @classmethod
+    def add(cls, record_type: str, **fields: Any) -> None:
+        """Добавляет запись в файл метрик, если метрики включены."""
+        path = os.environ.get(cls.ENV_FILE)
+        if path is None:
+            return
+
+        record = {
+            "type": record_type,
+            "run": os.environ.get(cls.ENV_RUN),
+            "time": time(),
+            "pid": os.getpid(),
+            "thread": threading.current_thread().name,
+            **fields,
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with cls._lock:
+            cls._get_file(path).write(line)
+
+    @classmethod
+    def _get_file(cls, path: str) -> TextIO:
+        """Возвращает файл метрик процесса (после fork - новый)."""
+        pid = os.getpid()
+        if cls._file is None or cls._file[:2] != (pid, path):
+            # строковая буферизация: строки процессов не перемешиваются
+            file = Path(path).open("a", encoding="utf-8", buffering=1)
+            cls._file = (pid, path, file)
+        return cls._file[2]
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        """Новый процесс (fork): блокировка и файл родителя не используются."""
+        cls._lock = threading.Lock()
+        cls._file = None
+
+    @staticmethod
+    def read(path: str, run: str | None = None) -> list[dict[str, Any]]:
+        """Читает записи файла метрик, run - только записи запуска."""
+        with Path(path).open(encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        if run is None:
+            return records
+        return [r for r in records if r.get("run") == run]
+
+    @staticmethod
+    def get_summary(records: list[dict[str, Any]]) -> str:
+        """
+        Возвращает таблицу: этапы (количество, время) и записанные файлы.
+
+        Время этапов - сумма по всем потокам и процессам, может быть больше
+        времени обработки.
+        """
+        spans: dict[str, list[float]] = defaultdict(list)
+        files = [r for r in records if r["type"] == "file"]
+        for r in records:
+            if r["type"] == "span":
+                spans[r["name"]].append(r["seconds"])
+
+        width = max([len(name) for name in spans] + [len("Этап")])
+        lines = [
+            f"{'Этап':<{width}} {'Кол-во':>7} {'Всего, с':>9} "
+            f"{'Сред., мс':>10} {'Макс., мс':>10}"
+        ]
+        for name, times in sorted(
+            spans.items(), key=lambda item: -sum(item[1])
+        ):
+            lines.append(
+                f"{name:<{width}} {len(times):>7} {sum(times):>9.3f} "
+                f"{sum(times) / len(times) * 1000:>10.2f} "
+                f"{max(times) * 1000:>10.2f}"
+            )
+
+        if files:
+            lines.append(
+                f"Файлов: {len(files)}, сущностей: "
+                f"{sum(f['entities'] for f in files)}, записано: "
+                f"{sum(f['bytes'] for f in files) / 1024:.1f} КБ."
+            )
+        return "\n".join(lines)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=MetricsService._reset_after_fork)
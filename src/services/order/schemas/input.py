@@ -0,0 +1,27 @@
+from typing import Literal
+
+from pydantic import BaseModel, PositiveFloat, PositiveInt
+
+
+class OrderOptionsInputSchema(BaseModel):
+    """Параметры обработки заказа."""
+
+    # сервис чтения xlsx файлов (см. services.excel.sources.XLSX_ENGINES)
+    xlsx_engine: Literal["openpyxl", "stream"] = "stream"
+    # кэш прочитанных данных файла замеров
+    use_cache: bool = True
+    # папка кэша, None - папка данных пользователя (см. ExcelCacheService)
+    cache_dir: str | None = None
+    # dxf шаблон чертежей деталей (слои, рамка), None - пустой документ
+    dxf_template: str | None = None
+    # формирование dxf (см. services.frames.ezdxf.EzDxfService)
+    dxf_engine: Literal["ezdxf", "native"] = "ezdxf"
+    # процессы черчения деталей заказа, 1 - в текущем процессе
+    draw_workers: PositiveInt = 1
+    # черчение только изменённых деталей (манифест папки заказа)
+    incremental: bool = True
+    # все детали заказа в одном dxf файле (блоки и вставки)
+    combined_output: bool = False
+    # сетка изготовления, мм: строки с размерами в пределах шага сетки
+    # чертятся одной деталью, None - группировка по точным размерам
+    grid_step: PositiveFloat | None = None
@@ -0,0 +1,46 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+from services.frames.schemas.frames_one_fold.output import (
+    FramesQuoteOutputSchema,
+)
+
+
+class OrderOutputSchema(BaseModel):
+    """Результат обработки заказа."""
+
+    file: str
+    path_folder: str | None = None
+
+    # имя файла -> номера строк
+    results: dict[str, list[Any]] = {}
+    # номер строки -> значения строки с ошибкой
+    frames_data_exc: dict[int, list[Any]] = {}
+    average_weight: float = 0.0
+    # путь файла -> ошибка записи
+    write_errors: dict[str, str] = {}
+    # начерчено файлов (остальные не изменились с прошлого черчения)
+    drawn_count: int = 0
+    # удалённые устаревшие файлы прошлого черчения
+    deleted_files: list[str] = []
+    # файлы, в которые сеткой изготовления объединены строки с разными
+    # размерами: имя файла -> номера строк
+    merged_rows: dict[str, list[Any]] = {}
+    # общий файл деталей заказа (режим combined_output)
+    combined_file: str | None = None
+
+    # ошибка обработки заказа (для пакетного режима)
+    error: str | None = None
+
+
+class OrderQuoteOutputSchema(BaseModel):
+    """Расчёт заказа без черчения (dry run)."""
+
+    file: str
+    quote: FramesQuoteOutputSchema | None = None
+    # номер строки -> значения строки с ошибкой
+    frames_data_exc: dict[int, list[Any]] = {}
+
+    # ошибка расчёта заказа
+    error: str | None = None
@@ -0,0 +1,305 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from logs.config import logging_config
+from logs.schemas import LogLevelsEnum
+from services.base.service import BaseService
+from services.excel.cache import ExcelCacheService
+from services.excel.exceptions import ExcelValueFromUserError
+from services.excel.schemas.input import (
+    CellsQueryInputSchema,
+    RangeCellInputSchema,
+    RowsQueryInputSchema,
+    SheetInputSchema,
+    SheetQueryInputSchema,
+)
+from services.excel.sources import EXCEL_SERVICES, get_excel_service
+from services.frames.exception import FramesValueFromUserError
+from services.frames.frames_one_fold import FramesOneFold
+from services.frames.schemas.frames_common.input import FramesBaseInputSchema
+from services.frames.schemas.frames_one_fold.input import (
+    FramesOneFoldConstructionInputSchema,
+    FramesOneFoldInputSchema,
+    HolesInputSchema,
+)
+from services.metrics.service import MetricsService
+from services.order.schemas.input import OrderOptionsInputSchema
+from services.order.schemas.output import (
+    OrderOutputSchema,
+    OrderQuoteOutputSchema,
+)
+
+
+class OrderService(BaseService):
+    """Сервис обработки заказа: чтение листа замеров и черчение обрамлений."""
+
+    # колонка параметров заказа в листе замеров
+    COLUMN = "X"
+
+    def __init__(self, options: OrderOptionsInputSchema | None = None) -> None:
+        self.options = options or OrderOptionsInputSchema()
+
+    def get_cache(self, read_only: bool = False) -> ExcelCacheService | None:
+        """Возвращает кэш чтения листа замеров, None - кэш выключен."""
+        if not self.options.use_cache:
+            return None
+        return ExcelCacheService(self.options.cache_dir, read_only=read_only)
+
+    def get_query(self) -> SheetQueryInputSchema:
+        """Возвращает план чтения листа замеров."""
+        column = self.COLUMN
+
+        return SheetQueryInputSchema(
+            sheet_params=SheetInputSchema(index=0),
+            cells={
+                # Базовые данные
+                "base_data": CellsQueryInputSchema(
+                    cells={
+                        "number_order": f"{column}2",
+                        "date_order": f"{column}3",
+                        "name_client": f"{column}4",
+                        "address_order": f"{column}5",
+                        "path_folder": f"{column}6",
+                        "doorway": f"{column}9",
+                        "thickness": f"{column}10",
+                        "height_platband_stands": f"{column}12",
+                    },
+                    validate_to_schema=FramesBaseInputSchema,
+                ),
+                # Данные по отверстиям под крепления, кнопки
+                "holes_data": CellsQueryInputSchema(
+                    cells={
+                        "diameter": f"{column}14",
+                        "top": f"{column}16",
+                        "bottom": f"{column}17",
+                        "middle": f"{column}18",
+                        "from_edge": f"{column}19",
+                        "button_hole_x_center_coordinate": f"{column}22",
+                        "button_hole_y_center_coordinate": f"{column}23",
+                    },
+                    validate_to_schema=HolesInputSchema,
+                ),
+                # Данные по особенностям конструкции
+                "construction_data": CellsQueryInputSchema(
+                    cells={
+                        "thickness_frames": f"{column}11",
+                    },
+                    validate_to_schema=FramesOneFoldConstructionInputSchema,
+                ),
+                "need_identical": CellsQueryInputSchema(
+                    cells=(f"{column}26",),
+                ),
+            },
+            rows={
+                # Данные по обрамлениям
+                "frames_data": RowsQueryInputSchema(
+                    range_cell_params=RangeCellInputSchema(
+                        start_row=3,
+                        start_column=1,
+                        end_column=7,
+                        max_blank_rows=50,
+                    ),
+                    columns={
+                        1: "number",
+                        2: "depth",
+                        3: "width_left",
+                        4: "width_right",
+                        5: "height_top",
+                        6: "button_hole_left",
+                        7: "button_hole_right",
+                    },
+                    validate_to_schema=FramesOneFoldInputSchema,
+                    batch_validation=True,
+                    # номер проёма: одинаковые размеры валидируются один раз
+                    identity_columns=(1,),
+                ),
+            },
+        )
+
+    def process(self, file: str) -> OrderOutputSchema:
+        """Читает лист замеров и чертит обрамления заказа."""
+        query_result = self.read(file)
+
+        frames_data, frames_data_exc = query_result["frames_data"]
+        need_identical = query_result["need_identical"][0] == "+"
+
+        # Черчение обрамлений
+        frames = self.get_frames(query_result)
+        results, average_weight = frames.draw_frames(
+            frames_data=frames_data, need_identical=need_identical
+        )
+
+        return OrderOutputSchema(
+            file=file,
+            path_folder=frames.path_folder,
+            results=results,
+            frames_data_exc=frames_data_exc,
+            average_weight=average_weight,
+            write_errors=frames.write_errors,
+            drawn_count=frames.drawn_count,
+            deleted_files=frames.deleted_files,
+            merged_rows=frames.merged_rows,
+            combined_file=frames.combined_file,
+        )
+
+    def quote(self, file: str) -> OrderQuoteOutputSchema:
+        """
+        Читает лист замеров и считает заказ без черчения (dry run).
+
+        Расчёт ничего не пишет на диск: кэш только для чтения.
+        """
+        query_result = self.read(file, cache=self.get_cache(read_only=True))
+
+        frames_data, frames_data_exc = query_result["frames_data"]
+        need_identical = query_result["need_identical"][0] == "+"
+
+        frames = self.get_frames(query_result, dry_run=True)
+        return OrderQuoteOutputSchema(
+            file=file,
+            quote=frames.quote_frames(
+                frames_data=frames_data, need_identical=need_identical
+            ),
+            frames_data_exc=frames_data_exc,
+        )
+
+    def read(
+        self, file: str, cache: ExcelCacheService | None = None
+    ) -> dict[str, Any]:
+        """
+        Читает лист замеров (результат execute_query).
+
+        :param cache: Кэш чтения, по умолчанию - get_cache.
+        """
+        # сервис чтения выбирается по расширению файла (xlsx, csv, jsonl,
+        # sqlite)
+        excel_service = get_excel_service(
+            file,
+            xlsx_engine=self.options.xlsx_engine,
+            read_only=True,
+            cache=cache or self.get_cache(),
+        )
+
+        # открытие файла, чтение всех данных страницы за один проход
+        with MetricsService.span("order.read", file=file), excel_service:
+            return excel_service.execute_query(self.get_query())
+
+    def get_frames(
+        self, query_result: dict[str, Any], dry_run: bool = False
+    ) -> FramesOneFold:
+        """Возвращает сервис черчения обрамлений заказа."""
+        return FramesOneFold(
+            base_data=query_result["base_data"],
+            thickness_frames=query_result[
+                "construction_data"
+            ].thickness_frames,
+            holes_data=query_result["holes_data"],
+            dxf_template=self.options.dxf_template,
+            dxf_engine=self.options.dxf_engine,
+            max_workers=self.options.draw_workers,
+            incremental=self.options.incremental,
+            combined_output=self.options.combined_output,
+            grid_step=self.options.grid_step,
+            dry_run=dry_run,
+        )
+
+
+class BatchOrderService(BaseService):
+    """
+    Пакетная обработка заказов в пуле процессов.
+
+    Каждый заказ обрабатывается в отдельном процессе, ошибка заказа не
+    прерывает обработку остальных.
+
+    :param max_workers: Количество процессов, по умолчанию - число ядер.
+    :param options: Параметры обработки заказов.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        options: OrderOptionsInputSchema | None = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.options = options or OrderOptionsInputSchema()
+
+    @staticmethod
+    def is_batch_path(path: str) -> bool:
+        """Проверяет, что путь - папка с заказами."""
+        return Path(path).is_dir()
+
+    @staticmethod
+    def get_files(paths: list[str]) -> list[str]:
+        """
+        Возвращает файлы заказов.
+
+        Папки раскрываются в файлы поддерживаемых форматов, временные файлы
+        excel (~$*) пропускаются.
+        """
+        files = []
+        for path in map(Path, paths):
+            if not path.is_dir():
+                files.append(str(path))
+                continue
+
+            files.extend(
+                str(p)
+                for p in sorted(path.iterdir())
+                if p.is_file()
+                and p.suffix.lower() in EXCEL_SERVICES
+                and not p.name.startswith("~$")
+            )
+
+        return files
+
+    def process(self, files: list[str]) -> list[OrderOutputSchema]:
+        """Обрабатывает заказы, результаты в порядке files."""
+        options = [self.options] * len(files)
+        if self.max_workers == 1 or len(files) == 1:
+            return list(map(process_order, files, options))
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(files)),
+            initializer=init_order_worker,
+        ) as executor:
+            return list(executor.map(process_order, files, options))
+
+
+def init_order_worker() -> None:
+    """Настраивает процесс пула обработки заказов."""
+    logging_config(LogLevelsEnum.DEBUG)
+    logging.getLogger("ezdxf").propagate = False
+
+
+def quote_order(
+    file: str, options: OrderOptionsInputSchema | None = None
+) -> OrderQuoteOutputSchema:
+    """Считает заказ без черчения, ошибка возвращается в результате."""
+    try:
+        return OrderService(options).quote(file)
+    except (ExcelValueFromUserError, FramesValueFromUserError) as exc:
+        logging.error(f"Пользовательская ошибка, файл {file}.", exc_info=exc)
+        error = f"Пользовательская ошибка: {exc}"
+    except Exception as exc:
+        logging.critical(f"Ошибка расчёта файла {file}.", exc_info=exc)
+        error = f"Ошибка в коде: {type(exc).__name__}: {exc}"
+
+    return OrderQuoteOutputSchema(file=file, error=error)
+
+
+def process_order(
+    file: str, options: OrderOptionsInputSchema | None = None
+) -> OrderOutputSchema:
+    """Обрабатывает заказ, ошибка возвращается в результате."""
+    try:
+        return OrderService(options).process(file)
+    except (ExcelValueFromUserError, FramesValueFromUserError) as exc:
+        logging.error(f"Пользовательская ошибка, файл {file}.", exc_info=exc)
+        error = f"Пользовательская ошибка: {exc}"
+    except Exception as exc:
+        logging.critical(f"Ошибка обработки файла {file}.", exc_info=exc)
+        error = f"Ошибка в коде: {type(exc).__name__}: {exc}"
+
+    return OrderOutputSchema(file=file, error=error)
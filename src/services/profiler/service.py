@@ -0,0 +1,168 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from services.base.service import BaseService
+
+
+class ProfilerService(BaseService):
+    """
+    Профилирование запуска: cProfile и tracemalloc.
+
+    При выходе из контекста в folder записываются:
+    <prefix>.pstats - дамп cProfile (pstats, snakeviz);
+    <prefix>.txt - top горячих функций по собственному и общему времени;
+    <prefix>_memory.txt - пик памяти по модулям (снимок tracemalloc при
+    максимальном объёме, опрос раз в SAMPLE_INTERVAL секунд).
+    Профилируется только текущий процесс, процессы пулов - нет.
+    tracemalloc замедляет работу в несколько раз.
+
+    :param folder: Папка отчётов (по умолчанию - папка app.log).
+    :param top: Строк в отчётах.
+    """
+
+    # переменная окружения: включение профилирования без аргументов
+    ENV = "FRAMES_PROFILE"
+    TOP = 30
+    SAMPLE_INTERVAL = 0.5
+
+    def __init__(self, folder: str = ".", top: int = TOP) -> None:
+        self.folder = Path(folder)
+        self.top = top
+        self.prefix = f"profile_{datetime.now():%Y%m%d_%H%M%S}"
+        # записанные отчёты
+        self.files: list[str] = []
+
+        self._profiler = cProfile.Profile()
+        self._peak: tracemalloc.Snapshot | None = None
+        self._peak_size = 0
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    @classmethod
+    def is_enabled_by_env(cls) -> bool:
+        """Проверяет, что профилирование включено переменной окружения."""
+        return os.environ.get(cls.ENV, "") not in ("", "0")
+
+    def __enter__(self) -> Self:
+        """Контекстный менеджер вход: запуск профилирования."""
+        tracemalloc.start()
+        self._sampler = threading.Thread(
+            target=self._sample, name="profiler_memory", daemon=True
+        )
+        self._sampler.start()
+        self._profiler.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Контекстный менеджер выход: запись отчётов."""
+        self._profiler.disable()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._take_peak_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        try:
+            self._write_reports(peak)
+        except OSError as exc:
+            logging.error(
+                self._get_common_log_information(self.__exit__)
+                + "Не удалось записать отчёты профилирования.",
+                exc_info=exc,
+            )
+
+    def _sample(self) -> None:
+        """Сохраняет снимок памяти при новом максимуме."""
+        while not self._stop.wait(self.SAMPLE_INTERVAL):
+            self._take_peak_snapshot()
+
+    def _take_peak_snapshot(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._peak_size:
+            self._peak_size = current
+            self._peak = tracemalloc.take_snapshot()
+
+    def _write_reports(self, peak: int) -> None:
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+        stats_path = self.folder / f"{self.prefix}.pstats"
+        self._profiler.dump_stats(stats_path)
+
+        hotspots_path = self.folder / f"{self.prefix}.txt"
+        hotspots_path.write_text(self.get_hotspots(), encoding="utf-8")
+
+        memory_path = self.folder / f"{self.prefix}_memory.txt"
+        memory_path.write_text(self.get_memory(peak), encoding="utf-8")
+
+        self.files = [
+            self._get_absolute_path(str(p))
+            for p in (stats_path, hotspots_path, memory_path)
+        ]
+
+    def get_hotspots(self) -> str:
+        """Возвращает top функций: по собственному и по общему времени."""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.strip_dirs()
+        for sort, title in (
+            (pstats.SortKey.TIME, "Собственное время функций"),
+            (pstats.SortKey.CUMULATIVE, "Общее время функций (с вызовами)"),
+        ):
+            stream.write(f"{title}, top {self.top}:\n")
+            stats.sort_stats(sort).print_stats(self.top)
+        return stream.getvalue()
+
+    def get_memory(self, peak: int) -> str:
+        """Возвращает пик памяти и top модулей по памяти на пике."""
+        lines = [
+            f"Пик памяти (tracemalloc): {peak / 1024 / 1024:.1f} МБ.",
+            f"Снимок на максимуме: {self._peak_size / 1024 / 1024:.1f} МБ.",
+        ]
+        if self._peak is None:
+            return "\n".join(lines) + "\n"
+
+        modules: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for stat in self._peak.statistics("filename"):
+            module = modules[self._get_module(stat.traceback[0].filename)]
+            module[0] += stat.size
+            module[1] += stat.count
+
+        lines.append("")
+        lines.append(f"{'Модуль':<40} {'МБ':>9} {'Блоков':>10}")
+        for name, (size, count) in sorted(
+            modules.items(), key=lambda item: -item[1][0]
+        )[: self.top]:
+            lines.append(f"{name:<40} {size / 1024 / 1024:>9.2f} {count:>10}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _get_module(filename: str) -> str:
+        """Возвращает пакет файла (два уровня), например services.frames."""
+        path = Path(filename)
+        roots = sorted(
+            (Path(p) for p in sys.path if p), key=lambda p: -len(p.parts)
+        )
+        for root in roots:
+            if path.is_relative_to(root):
+                parts = path.relative_to(root).with_suffix("").parts
+                if parts[-1] == "__init__":
+                    parts = parts[:-1]
+                return ".".join(parts[:2])
+        return filename
@@ -0,0 +1,118 @@
+import json
+import logging
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from services.server.exception import (
+    ServerQueueFullError,
+    ServerValueFromUserError,
+)
+from services.server.schemas.input import OrderJobInputSchema
+from services.server.service import OrderJobService
+
+
+class OrderHttpServer(ThreadingHTTPServer):
+    """
+    HTTP API очереди заказов.
+
+    POST /jobs - задание (OrderJobInputSchema), ответ 202 и задание;
+    GET /jobs - задания без результатов; GET /jobs/<id> - задание с
+    результатом; GET /health - состояние очереди.
+
+    :param address: Адрес и порт, по умолчанию слушается только localhost.
+    :param jobs: Очередь заданий.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int], jobs: OrderJobService
+    ) -> None:
+        self.jobs = jobs
+        super().__init__(address, OrderRequestHandler)
+
+
+class OrderRequestHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов API очереди заказов."""
+
+    server: OrderHttpServer
+    # максимальный размер тела запроса (файл замеров в base64), байт
+    MAX_BODY_SIZE = 64 * 1024 * 1024
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Статус заданий и очереди."""
+        jobs = self.server.jobs
+        match self.path.rstrip("/").split("/"):
+            case ["", "health"]:
+                self._send(HTTPStatus.OK, jobs.get_stats())
+            case ["", "jobs"]:
+                self._send(HTTPStatus.OK, jobs.get_all())
+            case ["", "jobs", job_id]:
+                record = jobs.get(job_id)
+                if record is None:
+                    self._send_error(HTTPStatus.NOT_FOUND, "Задания нет.")
+                else:
+                    self._send(HTTPStatus.OK, record)
+            case _:
+                self._send_error(HTTPStatus.NOT_FOUND, "Нет такого пути.")
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Новое задание."""
+        if self.path.rstrip("/") != "/jobs":
+            self._send_error(HTTPStatus.NOT_FOUND, "Нет такого пути.")
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.MAX_BODY_SIZE:
+            self._send_error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Слишком большой файл."
+            )
+            return
+
+        try:
+            job = OrderJobInputSchema.model_validate_json(
+                self.rfile.read(length)
+            )
+            record = self.server.jobs.submit(job)
+        except (ValidationError, ServerValueFromUserError) as exc:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
+        except ServerQueueFullError as exc:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(exc))
+        else:
+            self._send(HTTPStatus.ACCEPTED, record)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Запись запросов в лог вместо stderr."""
+        logging.info(
+            f"{self.__class__.__name__}: {self.address_string()} "
+            + format % args
+        )
+
+    def _send(self, status: HTTPStatus, data: BaseModel | list[Any]) -> None:
+        if isinstance(data, BaseModel):
+            body = data.model_dump_json()
+        else:
+            body = json.dumps(
+                [
+                    item.model_dump(mode="json")
+                    if isinstance(item, BaseModel)
+                    else item
+                    for item in data
+                ],
+                ensure_ascii=False,
+            )
+        self._send_body(status, body.encode())
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        body = json.dumps({"error": message}, ensure_ascii=False)
+        self._send_body(status, body.encode())
+
+    def _send_body(self, status: HTTPStatus, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
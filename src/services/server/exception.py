@@ -0,0 +1,14 @@
+class ServerBaseError(Exception):
+    """Базовое исключение сервера заказов."""
+
+
+class ServerValueFromUserError(ServerBaseError):
+    """Ошибка значения от пользователя (запрос к серверу)."""
+
+
+class ServerQueueFullError(ServerBaseError):
+    """Очередь заданий заполнена."""
+
+
+class ServerNeverError(ServerBaseError):
+    """Ошибка в коде."""
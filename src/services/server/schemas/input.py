@@ -0,0 +1,27 @@
+from typing import Any, Self
+
+from pydantic import Base64Bytes, BaseModel, model_validator
+
+
+class OrderJobInputSchema(BaseModel):
+    """Задание обработки заказа: путь файла замеров или его содержимое."""
+
+    # путь файла замеров на машине сервера
+    path: str | None = None
+    # содержимое файла замеров (base64) и имя файла (по расширению
+    # выбирается сервис чтения)
+    content: Base64Bytes | None = None
+    file_name: str | None = None
+    # параметры обработки (OrderOptionsInputSchema), не указанные - сервера
+    options: dict[str, Any] = {}
+    # расчёт без черчения (OrderService.quote)
+    quote: bool = False
+
+    @model_validator(mode="after")
+    def check_source(self) -> Self:
+        """Проверяет, что задан ровно один источник файла замеров."""
+        if (self.path is None) == (self.content is None):
+            raise ValueError("Нужен path или content файла замеров.")
+        if self.content is not None and not self.file_name:
+            raise ValueError("Для content нужен file_name.")
+        return self
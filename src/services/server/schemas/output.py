@@ -0,0 +1,43 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+from services.order.schemas.output import (
+    OrderOutputSchema,
+    OrderQuoteOutputSchema,
+)
+
+
+class OrderJobStatusEnum(StrEnum):
+    """Статус задания обработки заказа."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class OrderJobOutputSchema(BaseModel):
+    """Задание обработки заказа."""
+
+    id: str
+    status: OrderJobStatusEnum
+    # файл замеров (для загруженных - временный файл сервера)
+    file: str
+    quote: bool = False
+    # время создания, начала и окончания обработки (unix time)
+    created: float
+    started: float | None = None
+    finished: float | None = None
+
+    result: OrderOutputSchema | OrderQuoteOutputSchema | None = None
+    error: str | None = None
+
+
+class OrderJobStatsOutputSchema(BaseModel):
+    """Состояние очереди заданий."""
+
+    workers: int
+    max_queue: int
+    # статус -> количество заданий
+    jobs: dict[OrderJobStatusEnum, int] = {}
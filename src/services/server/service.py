@@ -0,0 +1,244 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from time import time
+from types import TracebackType
+from typing import Any, Self
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from services.base.service import BaseService
+from services.frames.ezdxf import EzDxfService
+from services.order.schemas.input import OrderOptionsInputSchema
+from services.order.service import process_order, quote_order
+from services.server.exception import (
+    ServerNeverError,
+    ServerQueueFullError,
+    ServerValueFromUserError,
+)
+from services.server.schemas.input import OrderJobInputSchema
+from services.server.schemas.output import (
+    OrderJobOutputSchema,
+    OrderJobStatsOutputSchema,
+    OrderJobStatusEnum,
+)
+
+
+class OrderJobService(BaseService):
+    """
+    Очередь заданий обработки заказов в тёплом процессе.
+
+    Задания выполняются в пуле потоков: импорты, схемы, прототипы dxf
+    документов (в каждом потоке) и кэш геометрии деталей создаются один раз
+    на процесс. Заданий в очереди и в работе не больше max_queue, сверх -
+    ServerQueueFullError. Загруженные файлы замеров хранятся в upload_folder
+    до окончания обработки.
+
+    :param max_workers: Потоки обработки заказов.
+    :param max_queue: Максимум заданий в очереди и в работе.
+    :param options: Параметры обработки заказов по умолчанию.
+    :param upload_folder: Папка загруженных файлов замеров.
+    """
+
+    DEFAULT_WORKERS = 2
+    # завершённых заданий в истории статусов
+    MAX_HISTORY = 1000
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int = 64,
+        options: OrderOptionsInputSchema | None = None,
+        upload_folder: str = "uploads",
+    ) -> None:
+        self.max_workers = max_workers or self.DEFAULT_WORKERS
+        self.max_queue = max_queue
+        self.options = options or OrderOptionsInputSchema()
+        self.upload_folder = Path(upload_folder)
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._jobs: OrderedDict[str, OrderJobOutputSchema] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        """Контекстный менеджер вход: запуск пула обработки."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Контекстный менеджер выход: ожидание заданий очереди."""
+        self.close()
+
+    def start(self) -> None:
+        """Запускает пул обработки, потоки прогревают прототипы dxf."""
+        self.upload_folder.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="order_job",
+            initializer=self.warm_up,
+            initargs=(self.options.dxf_template,),
+        )
+
+    def close(self) -> None:
+        """Дожидается выполнения заданий очереди."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @staticmethod
+    def warm_up(dxf_template: str | None) -> None:
+        """Создаёт прототип dxf документа потока обработки."""
+        try:
+            EzDxfService.get_prototype(dxf_template)
+        except Exception as exc:
+            # ошибка шаблона вернётся в результате задания
+            logging.error("Не удалось создать прототип dxf.", exc_info=exc)
+
+    def submit(self, job: OrderJobInputSchema) -> OrderJobOutputSchema:
+        """
+        Ставит задание в очередь.
+
+        :raises ServerValueFromUserError: Некорректные параметры обработки.
+        :raises ServerQueueFullError: Очередь заполнена.
+        """
+        if self._executor is None:
+            raise ServerNeverError("Пул обработки заказов не запущен.")
+
+        try:
+            options = OrderOptionsInputSchema.model_validate(
+                self.options.model_dump() | job.options
+            )
+        except ValidationError as exc:
+            raise ServerValueFromUserError(
+                f"Некорректные параметры обработки: {exc}"
+            ) from exc
+
+        if not self._slots.acquire(blocking=False):
+            raise ServerQueueFullError(
+                f"Очередь заполнена ({self.max_queue} заданий)."
+            )
+
+        job_id = uuid4().hex
+        try:
+            file = job.path or self._save_upload(job_id, job)
+            record = OrderJobOutputSchema(
+                id=job_id,
+                status=OrderJobStatusEnum.QUEUED,
+                file=file,
+                quote=job.quote,
+                created=time(),
+            )
+            with self._lock:
+                self._jobs[job_id] = record
+
+            future = self._executor.submit(
+                self._run, job_id, file, options, job.quote, job.path is None
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(self._release)
+        return record.model_copy()
+
+    def get(self, job_id: str) -> OrderJobOutputSchema | None:
+        """Возвращает задание, None - если задания нет."""
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return record.model_copy() if record else None
+
+    def get_all(self) -> list[OrderJobOutputSchema]:
+        """Возвращает задания (без результатов) в порядке создания."""
+        with self._lock:
+            return [
+                record.model_copy(update={"result": None})
+                for record in self._jobs.values()
+            ]
+
+    def get_stats(self) -> OrderJobStatsOutputSchema:
+        """Возвращает состояние очереди."""
+        jobs: dict[OrderJobStatusEnum, int] = dict.fromkeys(
+            OrderJobStatusEnum, 0
+        )
+        with self._lock:
+            for record in self._jobs.values():
+                jobs[record.status] += 1
+
+        return OrderJobStatsOutputSchema(
+            workers=self.max_workers, max_queue=self.max_queue, jobs=jobs
+        )
+
+    def _save_upload(self, job_id: str, job: OrderJobInputSchema) -> str:
+        """Сохраняет загруженный файл замеров, возвращает путь."""
+        # из имени файла берётся только расширение: путь задаёт сервер
+        suffix = Path(str(job.file_name)).suffix.lower()
+        path = self.upload_folder / f"{job_id}{suffix}"
+        path.write_bytes(job.content or b"")
+        return self._get_absolute_path(str(path))
+
+    def _run(
+        self,
+        job_id: str,
+        file: str,
+        options: OrderOptionsInputSchema,
+        quote: bool,
+        uploaded: bool,
+    ) -> None:
+        self._update(job_id, status=OrderJobStatusEnum.RUNNING, started=time())
+        result: Any = None
+        try:
+            # ошибки заказа возвращаются в результате
+            if quote:
+                result = quote_order(file, options)
+            else:
+                result = process_order(file, options)
+            error = result.error
+        except Exception as exc:
+            logging.critical(
+                self._get_common_log_information(self._run)
+                + f"Ошибка задания {job_id}.",
+                exc_info=exc,
+            )
+            error = f"Ошибка в коде: {type(exc).__name__}: {exc}"
+        finally:
+            if uploaded:
+                Path(file).unlink(missing_ok=True)
+
+        self._update(
+            job_id,
+            status=(
+                OrderJobStatusEnum.FAILED if error else OrderJobStatusEnum.DONE
+            ),
+            finished=time(),
+            result=result,
+            error=error,
+        )
+
+    def _update(self, job_id: str, **update: Any) -> None:
+        with self._lock:
+            record = self._jobs[job_id]
+            self._jobs[job_id] = record.model_copy(update=update)
+            if update.get("finished") is not None:
+                self._trim_history()
+
+    def _trim_history(self) -> None:
+        """Удаляет старые завершённые задания сверх MAX_HISTORY."""
+        finished = [
+            job_id
+            for job_id, record in self._jobs.items()
+            if record.finished is not None
+        ]
+        for job_id in finished[: max(len(finished) - self.MAX_HISTORY, 0)]:
+            del self._jobs[job_id]
+
+    def _release(self, _: Future[None]) -> None:
+        self._slots.release()
@@ -0,0 +1,12 @@
+from typing import NamedTuple
+
+
+class StartupModuleInternal(NamedTuple):
+    """Время загрузки модуля при запуске."""
+
+    name: str
+    description: str
+    # время загрузки без уже загруженных зависимостей, сек
+    seconds: float
+    # модуль был загружен до замера
+    loaded: bool
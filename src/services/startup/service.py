@@ -0,0 +1,59 @@
+import importlib
+import sys
+from time import perf_counter
+
+from services.base.service import BaseService
+from services.startup.schemas.internal import StartupModuleInternal
+
+
+class StartupTimeService(BaseService):
+    """
+    Время запуска: загрузка тяжёлых модулей режимов обработки.
+
+    Модули загружаются по очереди в порядке MODULES, время модуля - без уже
+    загруженных зависимостей (общие зависимости учитываются у первого).
+    Замер выполняется в процессе, поэтому работает и в exe файле, где
+    python -X importtime недоступен. Замер достоверен только в новом
+    процессе, до загрузки сервисов заказа.
+    """
+
+    # (модуль, назначение) в порядке загрузки при обработке заказа
+    MODULES = (
+        ("pydantic", "схемы и валидация данных"),
+        ("numpy", "пакетный расчёт геометрии"),
+        ("ezdxf", "черчение dxf"),
+        ("openpyxl", "чтение xlsx (--xlsx-engine openpyxl)"),
+        ("services.order.service", "сервисы заказа"),
+        ("services.server.api", "сервер заказов (--serve)"),
+    )
+
+    def get_modules(self) -> list[StartupModuleInternal]:
+        """Загружает модули MODULES и возвращает время загрузки."""
+        modules = []
+        for name, description in self.MODULES:
+            loaded = name in sys.modules
+            start = perf_counter()
+            importlib.import_module(name)
+            modules.append(
+                StartupModuleInternal(
+                    name=name,
+                    description=description,
+                    seconds=perf_counter() - start,
+                    loaded=loaded,
+                )
+            )
+
+        return modules
+
+    @staticmethod
+    def get_report(modules: list[StartupModuleInternal]) -> str:
+        """Возвращает таблицу времени загрузки модулей."""
+        width = max(len(m.name) for m in modules)
+        lines = [f"{'Модуль':<{width}}  Время, мс  Назначение"]
+        for m in modules:
+            seconds = "загружен" if m.loaded else f"{m.seconds * 1000:.1f}"
+            lines.append(f"{m.name:<{width}}  {seconds:>9}  {m.description}")
+
+        total = sum(m.seconds for m in modules)
+        lines.append(f"{'Всего':<{width}}  {total * 1000:>9.1f}")
+        return "\n".join(lines)
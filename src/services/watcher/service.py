@@ -0,0 +1,216 @@
+import logging
+import threading
+from pathlib import Path
+from sys import stdout
+from time import monotonic
+
+from services.base.service import BaseService
+from services.order.service import BatchOrderService
+from services.server.exception import ServerQueueFullError
+from services.server.schemas.input import OrderJobInputSchema
+from services.server.schemas.output import (
+    OrderJobOutputSchema,
+    OrderJobStatusEnum,
+)
+from services.server.service import OrderJobService
+
+
+# размер и время изменения файла
+FileSignature = tuple[int, int]
+
+
+class OrderWatchService(BaseService):
+    """
+    Папка входящих заказов: файлы замеров обрабатываются автоматически.
+
+    Папка опрашивается раз в poll_interval секунд. Файл ставится в очередь,
+    когда его размер и время изменения не меняются debounce секунд (файл
+    дописан) и он не открыт в excel (нет файла блокировки ~$<имя>). Заказы
+    обрабатываются очередью заданий; при заполненной очереди файл остаётся
+    в папке до следующего опроса. Обработанный файл переносится в done
+    (или failed, рядом - <имя>.error.txt), изменённый во время обработки -
+    обрабатывается повторно.
+
+    :param jobs: Очередь заданий обработки заказов.
+    :param inbox: Папка входящих заказов.
+    :param done_folder: Папка обработанных файлов, по умолчанию inbox/done.
+    :param failed_folder: Папка файлов с ошибкой, по умолчанию inbox/failed.
+    :param debounce: Время без изменений файла до обработки, сек.
+    """
+
+    DONE_FOLDER = "done"
+    FAILED_FOLDER = "failed"
+    POLL_INTERVAL = 2.0
+    DEBOUNCE = 3.0
+
+    def __init__(
+        self,
+        jobs: OrderJobService,
+        inbox: str,
+        done_folder: str | None = None,
+        failed_folder: str | None = None,
+        debounce: float = DEBOUNCE,
+    ) -> None:
+        self.jobs = jobs
+        self.inbox = Path(inbox)
+        self.done_folder = Path(done_folder or self.inbox / self.DONE_FOLDER)
+        self.failed_folder = Path(
+            failed_folder or self.inbox / self.FAILED_FOLDER
+        )
+        self.debounce = debounce
+
+        # файл -> (подпись, время первого появления подписи)
+        self._seen: dict[Path, tuple[FileSignature, float]] = {}
+        # файл в обработке -> (задание, подпись при постановке в очередь)
+        self._pending: dict[Path, tuple[str, FileSignature]] = {}
+        # обработанный файл, который не удалось перенести -> подпись
+        self._processed: dict[Path, FileSignature] = {}
+
+    def run(
+        self,
+        poll_interval: float = POLL_INTERVAL,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """
+        Опрашивает папку до установки stop или прерывания (Ctrl+C).
+
+        При остановке дожидается заданий очереди и переносит их файлы.
+
+        :param poll_interval: Интервал опроса, сек.
+        :param stop: Событие остановки, None - до прерывания процесса.
+        """
+        stop = stop or threading.Event()
+        for folder in (self.inbox, self.done_folder, self.failed_folder):
+            folder.mkdir(parents=True, exist_ok=True)
+
+        try:
+            while not stop.is_set():
+                for record in self.poll():
+                    self._write_result(record)
+                stop.wait(poll_interval)
+        finally:
+            self.jobs.close()
+            for record in self._collect_finished():
+                self._write_result(record)
+
+    def poll(self) -> list[OrderJobOutputSchema]:
+        """
+        Один опрос папки: ставит в очередь готовые файлы.
+
+        :return: Задания, завершённые с прошлого опроса.
+        """
+        finished = self._collect_finished()
+        if not self.inbox.is_dir():
+            return finished
+
+        now = monotonic()
+        files = {
+            Path(f) for f in BatchOrderService.get_files([str(self.inbox)])
+        }
+        self._seen = {f: s for f, s in self._seen.items() if f in files}
+        self._processed = {
+            f: s for f, s in self._processed.items() if f in files
+        }
+
+        for file in sorted(files - self._pending.keys()):
+            signature = self._get_signature(file)
+            if signature is None or self._processed.get(file) == signature:
+                continue
+
+            seen = self._seen.get(file)
+            if seen is None or seen[0] != signature:
+                self._seen[file] = (signature, now)
+                seen = self._seen[file]
+
+            if now - seen[1] < self.debounce or self._is_locked(file):
+                continue
+
+            try:
+                record = self.jobs.submit(OrderJobInputSchema(path=str(file)))
+            except ServerQueueFullError:
+                # очередь заполнена: остальные файлы - в следующий опрос
+                break
+
+            self._pending[file] = (record.id, signature)
+            del self._seen[file]
+
+        return finished
+
+    def _collect_finished(self) -> list[OrderJobOutputSchema]:
+        """Переносит файлы завершённых заданий в done или failed."""
+        finished = []
+        for file, (job_id, signature) in list(self._pending.items()):
+            record = self.jobs.get(job_id)
+            if record is not None and record.finished is None:
+                continue
+
+            del self._pending[file]
+            if record is None:
+                continue
+            finished.append(record)
+
+            if self._get_signature(file) != signature:
+                # файл изменён во время обработки - повторная обработка
+                continue
+
+            failed = record.status == OrderJobStatusEnum.FAILED
+            target = self._move(
+                file, self.failed_folder if failed else self.done_folder
+            )
+            if target is None:
+                self._processed[file] = signature
+            elif failed:
+                target.with_name(f"{target.name}.error.txt").write_text(
+                    str(record.error), encoding="utf-8"
+                )
+
+        return finished
+
+    @staticmethod
+    def _write_result(record: OrderJobOutputSchema) -> None:
+        """Выводит результат обработки файла."""
+        if record.error or record.result is None:
+            stdout.write(f"{record.file} - ОШИБКА. {record.error}" + "\n")
+            return
+
+        stdout.write(
+            f"{record.file} - файлов: {len(record.result.results)}, "
+            f"время: {(record.finished or 0) - record.created:.1f} сек." + "\n"
+        )
+
+    def _move(self, file: Path, folder: Path) -> Path | None:
+        """
+        Переносит файл в папку, существующие файлы не перезаписываются.
+
+        :return: Новый путь файла, None - не удалось перенести.
+        """
+        folder.mkdir(parents=True, exist_ok=True)
+        target = folder / file.name
+        n = 1
+        while target.exists():
+            target = folder / f"{file.stem}_{n}{file.suffix}"
+            n += 1
+
+        try:
+            return file.replace(target)
+        except OSError as exc:
+            logging.error(
+                self._get_common_log_information(self._move)
+                + f"Не удалось перенести {file} в {folder}.",
+                exc_info=exc,
+            )
+            return None
+
+    @staticmethod
+    def _get_signature(file: Path) -> FileSignature | None:
+        """Возвращает подпись файла, None - файла нет."""
+        try:
+            stat = file.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _is_locked(file: Path) -> bool:
+        """Проверяет, что файл открыт в excel."""
+        return file.with_name(f"~${file.name}").exists()
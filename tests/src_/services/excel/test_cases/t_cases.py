@@ -0,0 +1,57 @@
+from datetime import datetime, time
+from typing import Any
+
+from pydantic import BaseModel, PositiveFloat
+
+
+class RowSchema(BaseModel):
+    """Схема строки для тестов."""
+
+    number: Any
+    depth: PositiveFloat
+
+
+class CellsSchema(BaseModel):
+    """Схема ячеек для тестов."""
+
+    name: str
+    doorway: PositiveFloat
+
+
+class WorkbookData:
+    """Данные тестового документа."""
+
+    CELLS = {"X2": "Заказ", "X9": 860}
+    # ячейки разных типов, только для xlsx
+    TYPED_CELLS = {
+        "Z1": datetime(2024, 10, 1, 12, 30),
+        "Z2": time(8, 15),
+        "Z3": True,
+        "Z4": 1.25,
+        "Z5": "20*40",
+        "Z6": -3,
+    }
+    ROWS = (
+        (1, 120),
+        (2, 150.5),
+        (3, "ошибка"),
+        (None, None),
+        (5, 120),
+    )
+    START_ROW = 3
+    # строки jsonl с вложенными значениями (нехэшируемыми)
+    NESTED_ROWS = (
+        ([1, 2], 120),
+        ({"part": 2}, 150),
+        ([1, 2], 120),
+        (4, [120]),
+    )
+    # одинаковые размеры с разными номерами
+    REPEATED_ROWS = (
+        (1, 120),
+        (2, 150),
+        (3, 120),
+        (4, 120),
+        (5, "ошибка"),
+        (6, 150),
+    )
@@ -0,0 +1,80 @@
+import csv
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.utils.cell import coordinate_to_tuple
+from src_.services.excel.test_cases.t_cases import WorkbookData
+
+
+@pytest.fixture
+def workbook_path(tmp_path: Path) -> str:
+    workbook = Workbook()
+    sheet = workbook.active
+    for cell, value in (
+        WorkbookData.CELLS | WorkbookData.TYPED_CELLS
+    ).items():
+        sheet[cell] = value
+    for n, row in enumerate(WorkbookData.ROWS, start=WorkbookData.START_ROW):
+        for column, value in enumerate(row, start=1):
+            sheet.cell(row=n, column=column, value=value)
+
+    path = tmp_path / "test.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+def _get_table() -> list[list[Any]]:
+    """Возвращает значения тестового документа построчно с первой ячейки."""
+    cells = {
+        coordinate_to_tuple(cell): value
+        for cell, value in WorkbookData.CELLS.items()
+    }
+    for n, row in enumerate(WorkbookData.ROWS, start=WorkbookData.START_ROW):
+        for column, value in enumerate(row, start=1):
+            cells[(n, column)] = value
+
+    table = [[] for _ in range(max(row for row, _ in cells))]
+    for (row, column), value in cells.items():
+        values = table[row - 1]
+        values.extend([None] * (column - len(values)))
+        values[column - 1] = value
+    return table
+
+
+@pytest.fixture(params=[".csv", ".jsonl", ".sqlite"])
+def source_path(request: pytest.FixtureRequest, tmp_path: Path) -> str:
+    path = tmp_path / f"test{request.param}"
+    table = _get_table()
+
+    if request.param == ".csv":
+        with path.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f, delimiter=";").writerows(
+                ["" if v is None else v for v in row] for row in table
+            )
+    elif request.param == ".jsonl":
+        path.write_text(
+            "\n".join(json.dumps(row, ensure_ascii=False) for row in table),
+            encoding="utf-8",
+        )
+    else:
+        connection = sqlite3.connect(path)
+        connection.execute(
+            'CREATE TABLE cells (sheet_index, "row", "column", value)'
+        )
+        connection.executemany(
+            "INSERT INTO cells VALUES (0, ?, ?, ?)",
+            [
+                (n, column, value)
+                for n, row in enumerate(table, start=1)
+                for column, value in enumerate(row, start=1)
+                if value is not None
+            ],
+        )
+        connection.commit()
+        connection.close()
+
+    return str(path)
@@ -0,0 +1,390 @@
+import importlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import load_workbook
+from src_.services.excel.test_cases.t_cases import (
+    CellsSchema,
+    RowSchema,
+    WorkbookData,
+)
+
+from services.excel.cache import ExcelCacheService
+from services.excel.schemas.input import (
+    CellsQueryInputSchema,
+    RangeCellInputSchema,
+    RowsQueryInputSchema,
+    SheetInputSchema,
+    SheetQueryInputSchema,
+)
+from services.excel.service import ExcelService
+from services.excel.sources import StreamExcelService, get_excel_service
+
+
+SHEET_PARAMS = SheetInputSchema(index=0)
+CELLS = {"name": "X2", "doorway": "X9"}
+RANGE_CELL_PARAMS = RangeCellInputSchema(
+    start_row=WorkbookData.START_ROW,
+    end_row=WorkbookData.START_ROW + len(WorkbookData.ROWS) - 1,
+    start_column=1,
+    end_column=2,
+)
+COLUMNS = {1: "number", 2: "depth"}
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_execute_query__same_as_single_requests(
+    workbook_path: str, read_only: bool
+):
+    query = SheetQueryInputSchema(
+        sheet_params=SHEET_PARAMS,
+        cells={
+            "cells": CellsQueryInputSchema(
+                cells=CELLS, validate_to_schema=CellsSchema
+            ),
+            "raw": CellsQueryInputSchema(cells=("X9", "A3")),
+        },
+        rows={
+            "rows": RowsQueryInputSchema(
+                range_cell_params=RANGE_CELL_PARAMS,
+                columns=COLUMNS,
+                validate_to_schema=RowSchema,
+            ),
+        },
+    )
+
+    with ExcelService(workbook_path) as excel_service:
+        expected_cells = excel_service.get_cell_values(
+            SHEET_PARAMS, cells=CELLS, validate_to_schema=CellsSchema
+        )
+        expected_raw = excel_service.get_cell_values(
+            SHEET_PARAMS, cells=("X9", "A3")
+        )
+        expected_rows = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=RANGE_CELL_PARAMS,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+        )
+
+    with ExcelService(workbook_path, read_only=read_only) as excel_service:
+        result = excel_service.execute_query(query)
+
+    assert result["cells"] == expected_cells
+    assert result["raw"] == expected_raw
+    assert result["rows"] == expected_rows
+    assert list(result["rows"][1]) == [5]
+
+
+def test_execute_query__cache(
+    workbook_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    query = SheetQueryInputSchema(
+        sheet_params=SHEET_PARAMS,
+        cells={
+            "cells": CellsQueryInputSchema(
+                cells=CELLS, validate_to_schema=CellsSchema
+            ),
+        },
+        rows={
+            "rows": RowsQueryInputSchema(
+                range_cell_params=RANGE_CELL_PARAMS,
+                columns=COLUMNS,
+                validate_to_schema=RowSchema,
+            ),
+        },
+    )
+    cache = ExcelCacheService(cache_dir=str(tmp_path / "cache"))
+
+    with ExcelService(workbook_path, cache=cache) as excel_service:
+        expected = excel_service.execute_query(query)
+
+    def read_query(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Документ не должен читаться.")
+
+    monkeypatch.setattr(ExcelService, "_get_workbook", read_query)
+    with ExcelService(workbook_path, cache=cache) as excel_service:
+        assert excel_service.execute_query(query) == expected
+
+    # изменение содержимого файла сбрасывает кэш
+    monkeypatch.undo()
+    workbook = load_workbook(workbook_path)
+    workbook.active["X9"] = 900
+    workbook.save(workbook_path)
+    with ExcelService(workbook_path, cache=cache) as excel_service:
+        assert excel_service.execute_query(query)["cells"].doorway == 900
+
+
+def test_cache__eviction(tmp_path: Path):
+    cache = ExcelCacheService(cache_dir=str(tmp_path), max_size=2500)
+
+    for key in ("a", "b", "c"):
+        cache.set(key, os.urandom(1000))
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+def test_cache__fingerprint_validator_code(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    module = tmp_path / "cache_schema.py"
+    source = (
+        "from pydantic import BaseModel, field_validator\n\n\n"
+        "class Schema(BaseModel):\n"
+        "    depth: float\n\n"
+        "    @field_validator('depth')\n"
+        "    @classmethod\n"
+        "    def round_depth(cls, v: float) -> float:\n"
+        "        return round(v, {})\n"
+    )
+    module.write_text(source.format(1), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def get_fingerprint() -> tuple[dict[str, Any], str | None]:
+        ExcelCacheService.get_module_fingerprint.cache_clear()
+        schema = importlib.import_module("cache_schema").Schema
+        return (
+            schema.model_json_schema(),
+            ExcelCacheService.get_schema_fingerprint(schema),
+        )
+
+    json_schema, fingerprint = get_fingerprint()
+    # изменение кода валидатора не меняет json схему
+    module.write_text(source.format(2), encoding="utf-8")
+    importlib.reload(sys.modules["cache_schema"])
+    changed_json_schema, changed_fingerprint = get_fingerprint()
+    del sys.modules["cache_schema"]
+
+    assert changed_json_schema == json_schema
+    assert changed_fingerprint != fingerprint
+
+
+def test_cache__concurrent_set_and_default_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    cache = ExcelCacheService()
+    values = [os.urandom(1000) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda v: cache.set("key", v), values))
+
+    assert cache.cache_dir == tmp_path / "frames" / "excel_cache"
+    assert cache.get("key") in values
+    assert [p.name for p in cache.cache_dir.iterdir()] == [
+        f"key{ExcelCacheService.SUFFIX}"
+    ]
+
+
+@pytest.mark.parametrize(
+    ("max_blank_rows", "expected_numbers"),
+    [(1, [1, 2]), (2, [1, 2, 5])],
+)
+@pytest.mark.parametrize("read_only", [False, True])
+def test_rows__open_ended_range(
+    workbook_path: str,
+    read_only: bool,
+    max_blank_rows: int,
+    expected_numbers: list[int],
+):
+    range_cell_params = RangeCellInputSchema(
+        start_row=WorkbookData.START_ROW,
+        start_column=1,
+        end_column=2,
+        max_blank_rows=max_blank_rows,
+    )
+    query = SheetQueryInputSchema(
+        sheet_params=SHEET_PARAMS,
+        rows={
+            "rows": RowsQueryInputSchema(
+                range_cell_params=range_cell_params,
+                columns=COLUMNS,
+                validate_to_schema=RowSchema,
+            ),
+        },
+    )
+
+    with ExcelService(workbook_path, read_only=read_only) as excel_service:
+        rows, _ = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=range_cell_params,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+        )
+        query_rows, _ = excel_service.execute_query(query)["rows"]
+
+    assert [r.number for r in rows] == expected_numbers
+    assert query_rows == rows
+
+
+def test_rows__batch_validation(workbook_path: str):
+    with ExcelService(workbook_path) as excel_service:
+        expected = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=RANGE_CELL_PARAMS,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+        )
+        result = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=RANGE_CELL_PARAMS,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+            batch_validation=True,
+        )
+
+    assert result == expected
+
+
+def test_rows__batch_validation_identity_columns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    path = tmp_path / "repeated.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(row) for row in WorkbookData.REPEATED_ROWS),
+        encoding="utf-8",
+    )
+    range_cell_params = RangeCellInputSchema(
+        start_row=1, start_column=1, end_column=2
+    )
+    validated_rows = []
+    validate_distinct_rows = ExcelService._validate_distinct_rows
+
+    def count_rows(
+        data: list[dict[str, Any]], validate_to_schema: type[RowSchema]
+    ) -> Any:
+        validated_rows.extend(data)
+        return validate_distinct_rows(data, validate_to_schema)
+
+    with get_excel_service(str(path)) as excel_service:
+        expected = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=range_cell_params,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+        )
+        monkeypatch.setattr(
+            ExcelService, "_validate_distinct_rows", count_rows
+        )
+        result = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=range_cell_params,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+            batch_validation=True,
+            identity_columns=(1,),
+        )
+
+    assert result == expected
+    assert [r.number for r in result[0]] == [1, 2, 3, 4, 6]
+    assert list(result[1]) == [5]
+    # по одной строке на уникальные размеры: 120, 150, "ошибка"
+    assert len(validated_rows) == 3
+
+
+def test_rows__batch_validation_nested_values(tmp_path: Path):
+    path = tmp_path / "nested.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(row) for row in WorkbookData.NESTED_ROWS),
+        encoding="utf-8",
+    )
+    range_cell_params = RangeCellInputSchema(
+        start_row=1, start_column=1, end_column=2
+    )
+
+    with get_excel_service(str(path)) as excel_service:
+        expected = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=range_cell_params,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+        )
+        result = excel_service.get_rows_data(
+            SHEET_PARAMS,
+            range_cell_params=range_cell_params,
+            columns=COLUMNS,
+            validate_to_schema=RowSchema,
+            batch_validation=True,
+        )
+
+    assert result == expected
+    assert [r.number for r in result[0]] == [[1, 2], {"part": 2}, [1, 2]]
+    assert result[1] == {4: [4, [120]]}
+
+
+def test_sources__same_as_xlsx(workbook_path: str, source_path: str):
+    query = SheetQueryInputSchema(
+        sheet_params=SHEET_PARAMS,
+        cells={
+            "cells": CellsQueryInputSchema(
+                cells=CELLS, validate_to_schema=CellsSchema
+            ),
+            "raw": CellsQueryInputSchema(cells=("X9", "A3", "B4")),
+        },
+        rows={
+            "rows": RowsQueryInputSchema(
+                range_cell_params=RANGE_CELL_PARAMS,
+                columns=COLUMNS,
+                validate_to_schema=RowSchema,
+            ),
+        },
+    )
+
+    with get_excel_service(workbook_path) as excel_service:
+        expected = excel_service.execute_query(query)
+        expected_raw = excel_service.get_cell_values(
+            SHEET_PARAMS, cells=("X2", "B4")
+        )
+
+    with get_excel_service(source_path) as excel_service:
+        assert excel_service.execute_query(query) == expected
+        assert (
+            excel_service.get_cell_values(SHEET_PARAMS, cells=("X2", "B4"))
+            == expected_raw
+        )
+
+
+def test_xlsx_stream__same_as_openpyxl(workbook_path: str):
+    cells = tuple(WorkbookData.CELLS | WorkbookData.TYPED_CELLS)
+    query = SheetQueryInputSchema(
+        sheet_params=SheetInputSchema(name="Sheet"),
+        cells={
+            "cells": CellsQueryInputSchema(
+                cells=CELLS, validate_to_schema=CellsSchema
+            ),
+            "raw": CellsQueryInputSchema(cells=cells),
+        },
+        rows={
+            "rows": RowsQueryInputSchema(
+                range_cell_params=RANGE_CELL_PARAMS,
+                columns=COLUMNS,
+                validate_to_schema=RowSchema,
+            ),
+        },
+    )
+
+    with get_excel_service(workbook_path) as excel_service:
+        expected = excel_service.execute_query(query)
+
+    with get_excel_service(
+        workbook_path, xlsx_engine="stream"
+    ) as excel_service:
+        result = excel_service.execute_query(query)
+        raw = excel_service.get_cell_values(SHEET_PARAMS, cells=cells)
+
+    assert result == expected
+    assert raw == expected["raw"]
+
+
+def test_stream_source__requires_iter_sheet_rows(tmp_path: Path):
+    class NoRowsExcelService(StreamExcelService):
+        """Наследник без _iter_sheet_rows."""
+
+    with pytest.raises(TypeError, match="_iter_sheet_rows"):
+        NoRowsExcelService(str(tmp_path / "test.csv"))
@@ -0,0 +1,46 @@
+from services.frames.schemas.frames_common.input import FramesBaseInputSchema
+from services.frames.schemas.frames_one_fold.input import (
+    FramesOneFoldInputSchema,
+    HolesInputSchema,
+)
+
+
+class FramesData:
+    """Данные заказа обрамлений."""
+
+    BASE_DATA = FramesBaseInputSchema(
+        thickness=1.0,
+        height_platband_stands=2100,
+        doorway=900,
+        number_order=1,
+        date_order=None,
+        name_client="Тест",
+        address_order=None,
+        path_folder=None,
+    )
+    HOLES_DATA = HolesInputSchema(
+        diameter=6,
+        top=150,
+        bottom=150,
+        middle=1050,
+        from_edge=20,
+        button_hole_x_center_coordinate=None,
+        button_hole_y_center_coordinate=None,
+    )
+    THICKNESS_FRAMES = 40
+
+    @staticmethod
+    def get_frames_data() -> tuple[FramesOneFoldInputSchema, ...]:
+        """Возвращает строки замеров (есть повторяющиеся детали)."""
+        return tuple(
+            FramesOneFoldInputSchema(
+                number=n,
+                depth=100 + n % 7 * 10,
+                width_left=50 + n % 3 * 5,
+                width_right=50 + n % 4 * 5,
+                height_top=120,
+                button_hole_left="60*30" if n % 5 == 0 else None,
+                button_hole_right=None,
+            )
+            for n in range(1, 31)
+        )
@@ -0,0 +1,23 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src_.services.frames.test_cases.t_cases import FramesData
+
+from services.frames.frames_one_fold import FramesOneFold
+
+
+@pytest.fixture
+def get_frames(tmp_path: Path) -> Callable[..., FramesOneFold]:
+    def get_frames(folder: str = "order", **kwargs: Any) -> FramesOneFold:
+        return FramesOneFold(
+            base_data=FramesData.BASE_DATA.model_copy(
+                update={"path_folder": str(tmp_path / folder)}
+            ),
+            thickness_frames=FramesData.THICKNESS_FRAMES,
+            holes_data=FramesData.HOLES_DATA,
+            **kwargs,
+        )
+
+    return get_frames
@@ -0,0 +1,331 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import ezdxf
+import pytest
+from ezdxf import DXF2000, bbox
+from ezdxf.lldxf.encoding import decode_dxf_unicode
+from src_.services.frames.test_cases.t_cases import FramesData
+
+from services.frames.combined import CombinedDxfService
+from services.frames.ezdxf import EzDxfPrototype
+from services.frames.frames_one_fold import FramesOneFold
+from services.frames.manifest import FramesManifestService
+from services.frames.schemas.frames_common.enums import SideEnum
+from services.frames.schemas.frames_one_fold.input import (
+    FramesOneFoldInputSchema,
+)
+from services.frames.schemas.frames_one_fold.internal import (
+    PlatbandPostInternal,
+)
+from services.frames.writer import DxfWriterService
+
+
+def test_prototype__keeps_template_entities(tmp_path: Path):
+    template = ezdxf.new(dxfversion=DXF2000)
+    template.layers.add("FRAME")
+    template.modelspace().add_line((0, 0), (100, 0), dxfattribs={"layer": "FRAME"})
+    template_path = tmp_path / "template.dxf"
+    template.saveas(template_path)
+
+    prototype = EzDxfPrototype(str(template_path))
+    for radius in (1, 2):
+        document, model_space = prototype.get_document_and_model_space()
+        model_space.add_circle(center=(0, 0), radius=radius)
+        path = tmp_path / f"{radius}.dxf"
+        document.saveas(path)
+
+        saved = ezdxf.readfile(path)
+        entities = [(e.dxftype(), e.dxf.layer) for e in saved.modelspace()]
+        assert entities == [("LINE", "FRAME"), ("CIRCLE", "0")]
+        assert saved.modelspace().query("CIRCLE")[0].dxf.radius == radius
+        assert "FRAME" in saved.layers
+
+
+def _read_folder(path: str) -> dict[str, list[Any]]:
+    """Возвращает геометрию dxf файлов папки (ezdxf reader, audit)."""
+    result = {}
+    for file in sorted(Path(path).rglob("*.dxf")):
+        document = ezdxf.readfile(file)
+        assert not document.audit().has_errors
+
+        entities = []
+        for e in document.modelspace():
+            attribs = e.dxfattribs(drop={"handle", "owner"})
+            if e.dxftype() == "POLYLINE":
+                attribs["vertices"] = [v.dxf.location for v in e.vertices]
+            entities.append((e.dxftype(), repr(sorted(attribs.items()))))
+        result[str(file.relative_to(path))] = sorted(entities)
+    return result
+
+
+def test_draw_frames__parallel_same_as_serial(
+    get_frames: Callable[..., FramesOneFold],
+):
+    serial = get_frames("serial")
+    parallel = get_frames("parallel", max_workers=2)
+
+    serial_result = serial.draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+    parallel_result = parallel.draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+
+    assert len(serial_result[0]) >= FramesOneFold.MIN_PARALLEL_JOBS
+    assert list(parallel_result[0].items()) == list(serial_result[0].items())
+    assert parallel_result[1] == serial_result[1]
+    assert _read_folder(parallel.path_folder) == _read_folder(
+        serial.path_folder
+    )
+
+
+def test_writer__atomic_and_errors(tmp_path: Path):
+    path = tmp_path / "part.dxf"
+    missing_path = tmp_path / "missing" / "part.dxf"
+
+    with DxfWriterService(max_workers=2, max_pending=1) as writer:
+        writer.submit(str(path), b"1")
+        writer.submit(str(path), b"2")
+        writer.submit(str(missing_path), b"3")
+
+    assert path.read_bytes() == b"2"
+    assert list(writer.errors) == [str(missing_path)]
+    assert [p.name for p in tmp_path.iterdir() if p.is_file()] == ["part.dxf"]
+
+
+def test_draw_frames__native_same_as_ezdxf(
+    get_frames: Callable[..., FramesOneFold],
+):
+    frames = get_frames("ezdxf")
+    native = get_frames("native", dxf_engine="native")
+
+    result = frames.draw_frames(
+        FramesData.get_frames_data(), need_identical=False
+    )
+    native_result = native.draw_frames(
+        FramesData.get_frames_data(), need_identical=False
+    )
+
+    assert native_result == result
+    assert _read_folder(native.path_folder) == _read_folder(frames.path_folder)
+
+
+def test_draw_frames__incremental(get_frames: Callable[..., FramesOneFold]):
+    def get_changed_data() -> tuple[FramesOneFoldInputSchema, ...]:
+        first_row, *rows = FramesData.get_frames_data()
+        return first_row.model_copy(update={"depth": 300}), *rows
+
+    first = get_frames()
+    first_result = first.draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+    assert first.drawn_count == len(first_result[0])
+
+    same = get_frames()
+    assert same.draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    ) == first_result
+    assert same.drawn_count == 0
+    assert same.deleted_files == []
+
+    changed = get_frames()
+    changed_result = changed.draw_frames(
+        get_changed_data(), need_identical=True
+    )
+    full = get_frames("full", incremental=False)
+    full_result = full.draw_frames(get_changed_data(), need_identical=True)
+
+    assert changed_result == full_result
+    assert 0 < changed.drawn_count < len(changed_result[0])
+    assert changed.deleted_files
+    assert _read_folder(changed.path_folder) == _read_folder(full.path_folder)
+
+
+def test_manifest__deletes_only_drawing_files(tmp_path: Path):
+    order = tmp_path / "order"
+    outside = tmp_path / "outside.dxf"
+    files = {
+        "Стойки/stale.dxf": True,
+        "Верхушки/stale.dxf": True,
+        "order.dxf": True,
+        "Стойки/notes.txt": False,
+        "other.dxf": False,
+        "Стойки/sub/part.dxf": False,
+    }
+    for key in files:
+        (order / key).parent.mkdir(parents=True, exist_ok=True)
+        (order / key).write_text("", encoding="utf-8")
+    outside.write_text("", encoding="utf-8")
+
+    # манифест папки заказа изменён не черчением
+    keys = [*files, "../outside.dxf", "Стойки/../../outside.dxf"]
+    keys.append(str(outside))
+    (order / FramesManifestService.FILE_NAME).write_text(
+        json.dumps(
+            {
+                "version": FramesManifestService.VERSION,
+                "files": {key: {"hash": "", "square": 0} for key in keys},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    manifest = FramesManifestService(str(order))
+    deleted = manifest.delete_stale(manifest.load(), set())
+
+    assert deleted == sorted(key for key, own in files.items() if own)
+    assert outside.exists()
+    for key, own in files.items():
+        assert (order / key).exists() is not own
+
+
+def test_draw_frames__geometry_cache(
+    get_frames: Callable[..., FramesOneFold],
+):
+    FramesOneFold.geometry_cache.clear()
+    frames_data = FramesData.get_frames_data()
+    depths = [f.depth for f in frames_data]
+
+    first = get_frames("first")
+    result = first.draw_frames(frames_data, need_identical=True)
+    # геометрия заказа считается пакетом до черчения
+    misses = FramesOneFold.geometry_cache.misses
+    assert misses == len(result[0])
+
+    # входные данные не изменяются, повторный заказ - из кэша
+    second = get_frames("second")
+    assert second.draw_frames(frames_data, need_identical=True) == result
+    assert [f.depth for f in frames_data] == depths
+    assert FramesOneFold.geometry_cache.misses == misses
+    assert _read_folder(second.path_folder) == _read_folder(first.path_folder)
+
+
+def test_draw_frames__combined(get_frames: Callable[..., FramesOneFold]):
+    frames = get_frames("files")
+    combined = get_frames("combined", combined_output=True)
+
+    result = frames.draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+    combined_result = combined.draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+    assert combined_result == result
+
+    document = ezdxf.readfile(combined.combined_file)
+    assert not document.audit().has_errors
+    inserts = document.modelspace().query("INSERT")
+    assert len(inserts) == sum(len(numbers) for numbers in result[0].values())
+
+    # блок детали совпадает с отдельным файлом детали
+    for block in document.blocks:
+        if not block.name.startswith(CombinedDxfService.PART_BLOCK_PREFIX):
+            continue
+        file_name = decode_dxf_unicode(block.block.dxf.description) + ".dxf"
+        part = next(Path(frames.path_folder).rglob(file_name))
+        part_extents = bbox.extents(ezdxf.readfile(part).modelspace())
+        block_extents = bbox.extents(block)
+        assert block_extents.extmin.isclose(part_extents.extmin, abs_tol=0.05)
+        assert block_extents.extmax.isclose(part_extents.extmax, abs_tol=0.05)
+
+
+@pytest.mark.parametrize(
+    ("name", "angles"),
+    [
+        ("first", (115, 80, 10, 335, False)),
+        ("second", (90 + 115, 90 + 80, 90 + 10, 65, False)),
+    ],
+)
+def test_top_notch_template__mirror(
+    name: str, angles: tuple[float, float, float, float, bool]
+):
+    line_angle_1, arc_angle_1, arc_angle_2, line_angle_2, clockwise = angles
+    line_length = FramesOneFold.TOP_NOTCH_LINE_LENGTH
+    arc_length = FramesOneFold.TOP_NOTCH_ARC_LENGTH
+
+    # правый вырез, посчитанный по своим углам
+    a1 = FramesOneFold.get_coordinates_angle_line(
+        FramesOneFold.ZERO_POINT, line_angle_1, line_length
+    )
+    a2 = FramesOneFold.get_coordinates_angle_line(a1, arc_angle_1, arc_length)
+    a3 = FramesOneFold.get_coordinates_angle_line(a2, arc_angle_2, arc_length)
+    end = FramesOneFold.get_coordinates_angle_line(a3, line_angle_2, line_length)
+    center, radius, start_angle, end_angle = (
+        FramesOneFold.get_drawing_arc_data(a1, a2, a3, clockwise=clockwise)
+    )
+
+    notch = FramesOneFold._get_top_notch_template(name, True)
+    assert notch.lines[0][1].isclose(a1)
+    assert notch.lines[1][0].isclose(a3)
+    assert notch.end.isclose(end)
+    assert notch.arc[0].isclose(center)
+    assert notch.arc[1] == pytest.approx(radius)
+    assert notch.arc[2] % 360 == pytest.approx(start_angle % 360)
+    assert notch.arc[3] % 360 == pytest.approx(end_angle % 360)
+
+
+def test_stand_file_name__parsed_button_hole():
+    stand = PlatbandPostInternal(
+        depth=140,
+        width=60,
+        button_hole=FramesOneFold._parse_button_hole("50*100"),
+    )
+
+    assert stand.button_hole == (50.0, 100.0)
+    file_name = FramesOneFold._get_stand_file_name(
+        stand, ["1", "2"], SideEnum.LEFT
+    )
+    assert file_name == f"2шт_{SideEnum.LEFT}_Г-140_Ш-60_Отв-50_100.dxf"
+    assert hash(stand) == hash(PlatbandPostInternal(140, 60, (50, 100)))
+
+
+def test_draw_frames__grid_step(get_frames: Callable[..., FramesOneFold]):
+    def get_measured_data() -> tuple[FramesOneFoldInputSchema, ...]:
+        first_row, *rows = FramesData.get_frames_data()
+        depth = first_row.depth + 0.04
+        return first_row.model_copy(update={"depth": depth}), *rows
+
+    result = get_frames("exact_data").draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+
+    # без сетки строка с другой глубиной - отдельные детали
+    exact = get_frames("exact")
+    exact.draw_frames(get_measured_data(), need_identical=True)
+    exact_jobs, _ = exact._get_jobs(get_measured_data(), need_identical=True)
+    jobs, _ = exact._get_jobs(FramesData.get_frames_data(), need_identical=True)
+    assert len(exact_jobs) > len(jobs)
+    assert exact.merged_rows == {}
+
+    grid = get_frames("grid", grid_step=0.5)
+    grid_result = grid.draw_frames(get_measured_data(), need_identical=True)
+    assert grid_result[0] == result[0]
+    assert grid.merged_rows
+    first_number = FramesData.get_frames_data()[0].number
+    for file_name, numbers in grid.merged_rows.items():
+        assert numbers == result[0][file_name]
+        assert any(str(n).startswith(str(first_number)) for n in numbers)
+
+
+def test_quote_frames__same_as_draw(
+    get_frames: Callable[..., FramesOneFold], tmp_path: Path
+):
+    quote = get_frames("quote", dry_run=True).quote_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+    # режим расчёта не создаёт папок и файлов
+    assert list(tmp_path.iterdir()) == []
+
+    results, average_weight = get_frames("draw").draw_frames(
+        FramesData.get_frames_data(), need_identical=True
+    )
+    assert {p.file_name: p.numbers for p in quote.parts} == results
+    assert quote.files_count == len(results)
+    assert quote.parts_count == sum(map(len, results.values()))
+    assert quote.average_weight == pytest.approx(average_weight)
+    assert quote.weight == pytest.approx(
+        sum(p.weight * p.count for p in quote.parts)
+    )
@@ -0,0 +1,16 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# файл замеров заказа - как у сервера заказов
+from src_.services.server.tests.conftest import order_path  # noqa: F401
+
+from services.metrics.service import MetricsService
+
+
+@pytest.fixture
+def metrics_file(tmp_path: Path) -> Iterator[str]:
+    path = str(tmp_path / "metrics.jsonl")
+    yield path
+    MetricsService.disable()
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+from services.metrics.service import MetricsService
+from services.order.schemas.input import OrderOptionsInputSchema
+from services.order.service import OrderService
+
+
+def test_span__disabled(metrics_file: str):
+    with MetricsService.span("test"):
+        pass
+    MetricsService.add_file("x.dxf", 1, 1)
+
+    assert not MetricsService.is_enabled()
+    assert not Path(metrics_file).exists()
+
+
+def test_span__records_and_summary(metrics_file: str):
+    run = MetricsService.enable(metrics_file)
+
+    with pytest.raises(ValueError):
+        with MetricsService.span("test.error", file="a.xlsx"):
+            raise ValueError
+    MetricsService.timed("test.func")(lambda: None)()
+    MetricsService.add_file("x.dxf", entities=3, size=2048)
+
+    # записи другого запуска в том же файле
+    MetricsService.enable(metrics_file)
+    with MetricsService.span("test.other"):
+        pass
+
+    records = MetricsService.read(metrics_file, run)
+    assert [r.get("name") for r in records] == [
+        "test.error",
+        "test.func",
+        None,
+    ]
+    assert records[0]["file"] == "a.xlsx"
+    assert records[0]["seconds"] >= 0
+
+    summary = MetricsService.get_summary(records).splitlines()
+    assert len(summary) == 4
+    assert summary[-1] == "Файлов: 1, сущностей: 3, записано: 2.0 КБ."
+
+
+def test_order__stages_and_files(metrics_file: str, order_path: str):
+    run = MetricsService.enable(metrics_file)
+
+    result = OrderService(
+        OrderOptionsInputSchema(use_cache=False)
+    ).process(order_path)
+
+    records = MetricsService.read(metrics_file, run)
+    names = {r["name"] for r in records if r["type"] == "span"}
+    assert {
+        "order.read",
+        "excel.execute_query",
+        "excel.read",
+        "excel.validate",
+        "frames.grouping",
+        "frames.geometry",
+        "frames.draw",
+        "frames.draw_stand",
+        "frames.draw_top",
+        "dxf.serialize",
+        "dxf.write",
+    } <= names
+
+    files = [r for r in records if r["type"] == "file"]
+    assert sorted(Path(f["path"]).name for f in files) == sorted(
+        result.results
+    )
+    for f in files:
+        assert f["entities"] > 0
+        assert f["bytes"] == Path(f["path"]).stat().st_size
+
+
+def test_order__combined_file(metrics_file: str, order_path: str):
+    run = MetricsService.enable(metrics_file)
+
+    result = OrderService(
+        OrderOptionsInputSchema(use_cache=False, combined_output=True)
+    ).process(order_path)
+
+    records = MetricsService.read(metrics_file, run)
+    assert "dxf.serialize" in {
+        r["name"] for r in records if r["type"] == "span"
+    }
+    files = [r for r in records if r["type"] == "file"]
+    assert [f["path"] for f in files] == [result.combined_file]
+    assert files[0]["entities"] > 0
+    assert files[0]["bytes"] == Path(files[0]["path"]).stat().st_size
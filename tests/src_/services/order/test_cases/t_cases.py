@@ -0,0 +1,33 @@
+class OrderData:
+    """Листы замеров заказов пакета (ячейки колонки X и строки замеров)."""
+
+    CELLS = {
+        2: 1,
+        3: "01.10.24",
+        4: "Пакет",
+        9: 900,
+        10: 1,
+        11: 40,
+        12: 2100,
+        14: 6,
+        16: 150,
+        17: 150,
+        18: 1050,
+        19: 20,
+        26: "+",
+    }
+    PATH_FOLDER_ROW = 6
+    # номер заказа -> строки замеров
+    ORDERS = {
+        1: (
+            (1, 120, 50, 60, 70, None, None),
+            (2, 150, 60, 60, 70, "20*40", None),
+            (3, 120, 50, 60, 70, None, None),
+        ),
+        2: (
+            (1, 200, 45, 45, 80, None, "20*40"),
+            (2, 90, 70, 55, 60, None, None),
+        ),
+    }
+    # некорректная толщина: ошибка заказа
+    BAD_CELLS = {10: "толщина"}
@@ -0,0 +1,61 @@
+import csv
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src_.services.order.test_cases.t_cases import OrderData
+
+
+# колонка параметров заказа (OrderService.COLUMN = "X")
+COLUMN_INDEX = 23
+
+
+def _write_order(
+    path: Path, cells: dict[int, Any], rows: tuple[tuple[Any, ...], ...]
+) -> None:
+    table = [[""] * (COLUMN_INDEX + 1) for _ in range(max(cells) + 1)]
+    for n, row in enumerate(rows, start=2):
+        table[n][: len(row)] = ["" if v is None else v for v in row]
+    for n, value in cells.items():
+        table[n - 1][COLUMN_INDEX] = value
+
+    with path.open("w", newline="", encoding="utf-8") as f:
+        csv.writer(f, delimiter=";").writerows(table)
+
+
+@pytest.fixture
+def make_orders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[str], Path]:
+    """
+    Создаёт папку заказов name: корректные заказы и заказ с ошибкой.
+
+    Заказы чертятся в папки out/<name>/<номер заказа>.
+    """
+    # кэш чтения заказов (папка данных пользователя) и app.log процессов
+    # пула - в папке теста
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    def make(name: str) -> Path:
+        folder = tmp_path / name
+        folder.mkdir()
+        for number, rows in OrderData.ORDERS.items():
+            cells = OrderData.CELLS | {
+                2: number,
+                OrderData.PATH_FOLDER_ROW: str(
+                    tmp_path / "out" / name / str(number)
+                ),
+            }
+            _write_order(folder / f"order_{number}.csv", cells, rows)
+        _write_order(
+            folder / "bad.csv",
+            OrderData.CELLS | OrderData.BAD_CELLS,
+            OrderData.ORDERS[1],
+        )
+        # временный файл excel: пропускается
+        (folder / "~$order_1.csv").write_text("", encoding="utf-8")
+        return folder
+
+    return make
@@ -0,0 +1,88 @@
+from collections.abc import Callable
+from pathlib import Path
+
+from services.order.schemas.input import OrderOptionsInputSchema
+from services.order.service import (
+    BatchOrderService,
+    process_order,
+    quote_order,
+)
+
+
+def _get_files(folder: Path) -> list[str]:
+    return sorted(
+        str(p.relative_to(folder)) for p in folder.rglob("*") if p.is_file()
+    )
+
+
+def test_batch__get_files(make_orders: Callable[[str], Path]):
+    folder = make_orders("batch")
+
+    files = BatchOrderService.get_files([str(folder)])
+
+    assert [Path(f).name for f in files] == [
+        "bad.csv",
+        "order_1.csv",
+        "order_2.csv",
+    ]
+
+
+def test_batch__same_as_single(
+    make_orders: Callable[[str], Path], tmp_path: Path
+):
+    single = [
+        process_order(file)
+        for file in BatchOrderService.get_files([str(make_orders("single"))])
+    ]
+    batch = BatchOrderService(max_workers=2).process(
+        BatchOrderService.get_files([str(make_orders("batch"))])
+    )
+
+    assert [Path(r.file).name for r in batch] == [
+        Path(r.file).name for r in single
+    ]
+    for single_result, batch_result in zip(single, batch, strict=True):
+        assert batch_result.error == single_result.error
+        assert batch_result.results == single_result.results
+        assert batch_result.frames_data_exc == single_result.frames_data_exc
+        assert batch_result.average_weight == single_result.average_weight
+    assert _get_files(tmp_path / "out" / "batch") == _get_files(
+        tmp_path / "out" / "single"
+    )
+
+
+def test_batch__order_error_isolated(
+    make_orders: Callable[[str], Path], tmp_path: Path
+):
+    files = BatchOrderService.get_files([str(make_orders("batch"))])
+
+    bad, *orders = BatchOrderService(max_workers=2).process(files)
+
+    assert bad.error is not None
+    assert bad.error.startswith("Пользовательская ошибка")
+    assert not bad.results
+    for result in orders:
+        assert result.error is None
+        assert result.results
+        assert Path(str(result.path_folder)).is_dir()
+
+
+def test_quote__cache_read_only(
+    make_orders: Callable[[str], Path], tmp_path: Path
+):
+    cache_dir = tmp_path / "cache"
+    options = OrderOptionsInputSchema(cache_dir=str(cache_dir))
+    file = str(make_orders("quote") / "order_1.csv")
+
+    quote = quote_order(file, options)
+
+    assert quote.error is None
+    assert not cache_dir.exists()
+
+    # записи кэша после черчения только читаются
+    process_order(file, options)
+    entries = {p: p.stat().st_mtime_ns for p in cache_dir.iterdir()}
+    assert entries
+
+    assert quote_order(file, options).quote == quote.quote
+    assert {p: p.stat().st_mtime_ns for p in cache_dir.iterdir()} == entries
@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from services.profiler.service import ProfilerService
+
+
+def _allocate() -> list[bytes]:
+    return [bytes(1024) for _ in range(2000)]
+
+
+def test_profiler__reports(tmp_path: Path):
+    with ProfilerService(folder=str(tmp_path), top=10) as profiler:
+        data = _allocate()
+
+    assert len(data) == 2000
+    assert sorted(Path(f).name for f in profiler.files) == [
+        f"{profiler.prefix}.pstats",
+        f"{profiler.prefix}.txt",
+        f"{profiler.prefix}_memory.txt",
+    ]
+
+    hotspots = (tmp_path / f"{profiler.prefix}.txt").read_text("utf-8")
+    assert "_allocate" in hotspots
+
+    memory = (tmp_path / f"{profiler.prefix}_memory.txt").read_text("utf-8")
+    assert memory.startswith("Пик памяти (tracemalloc):")
+    # выделения теста - в модуле тестов
+    assert "src_.services" in memory
+
+
+def test_profiler__enabled_by_env(monkeypatch: pytest.MonkeyPatch):
+    for value, expected in (("", False), ("0", False), ("1", True)):
+        monkeypatch.setenv(ProfilerService.ENV, value)
+        assert ProfilerService.is_enabled_by_env() is expected
+
+
+def test_profiler__module_name(monkeypatch: pytest.MonkeyPatch):
+    root = Path("/opt/app").resolve()
+    monkeypatch.setattr(sys, "path", [str(root), str(root / "lib")])
+
+    assert (
+        ProfilerService._get_module(str(root / "services/frames/ezdxf.py"))
+        == "services.frames"
+    )
+    assert (
+        ProfilerService._get_module(str(root / "lib/ezdxf/__init__.py"))
+        == "ezdxf"
+    )
+    assert ProfilerService._get_module("<unknown>") == "<unknown>"
@@ -0,0 +1,24 @@
+class OrderData:
+    """Лист замеров заказа (ячейки колонки X и строки замеров)."""
+
+    CELLS = {
+        2: 7,
+        3: "01.10.24",
+        4: "Сервер",
+        9: 900,
+        10: 1,
+        11: 40,
+        12: 2100,
+        14: 6,
+        16: 150,
+        17: 150,
+        18: 1050,
+        19: 20,
+        26: "+",
+    }
+    PATH_FOLDER_ROW = 6
+    ROWS = (
+        (1, 120, 50, 60, 70, None, None),
+        (2, 150, 60, 60, 70, "20*40", None),
+        (3, 120, 50, 60, 70, None, None),
+    )
@@ -0,0 +1,47 @@
+import csv
+from collections.abc import Iterator
+from pathlib import Path
+from threading import Thread
+
+import pytest
+from src_.services.server.test_cases.t_cases import OrderData
+
+from services.order.schemas.input import OrderOptionsInputSchema
+from services.server.api import OrderHttpServer
+from services.server.service import OrderJobService
+
+
+# колонка параметров заказа (OrderService.COLUMN = "X")
+COLUMN_INDEX = 23
+
+
+@pytest.fixture
+def order_path(tmp_path: Path) -> str:
+    cells = OrderData.CELLS | {
+        OrderData.PATH_FOLDER_ROW: str(tmp_path / "orders")
+    }
+    table = [[""] * (COLUMN_INDEX + 1) for _ in range(max(cells) + 1)]
+    for n, row in enumerate(OrderData.ROWS, start=2):
+        table[n][: len(row)] = ["" if v is None else v for v in row]
+    for n, value in cells.items():
+        table[n - 1][COLUMN_INDEX] = value
+
+    path = tmp_path / "order.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        csv.writer(f, delimiter=";").writerows(table)
+    return str(path)
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[OrderHttpServer]:
+    with OrderJobService(
+        max_workers=1,
+        options=OrderOptionsInputSchema(use_cache=False),
+        upload_folder=str(tmp_path / "uploads"),
+    ) as jobs:
+        server = OrderHttpServer(("127.0.0.1", 0), jobs)
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
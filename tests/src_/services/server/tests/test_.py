@@ -0,0 +1,119 @@
+import base64
+import json
+import threading
+from pathlib import Path
+from time import sleep
+from typing import Any
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from services.server.api import OrderHttpServer
+from services.server.exception import ServerQueueFullError
+from services.server.schemas.input import OrderJobInputSchema
+from services.server.service import OrderJobService
+
+
+def _request(
+    server: OrderHttpServer, path: str, data: dict[str, Any] | None = None
+) -> tuple[int, Any]:
+    url = f"http://127.0.0.1:{server.server_port}{path}"
+    body = None if data is None else json.dumps(data).encode()
+    try:
+        with urlopen(Request(url, data=body), timeout=10) as response:  # noqa: S310
+            return response.status, json.loads(response.read())
+    except HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def _wait_job(server: OrderHttpServer, job_id: str) -> dict[str, Any]:
+    for _ in range(200):
+        status, job = _request(server, f"/jobs/{job_id}")
+        assert status == 200
+        if job["finished"] is not None:
+            return job
+        sleep(0.05)
+    raise AssertionError("Задание не выполнено.")
+
+
+def test_server__path_and_upload_jobs(server: OrderHttpServer, order_path: str):
+    status, job = _request(server, "/jobs", {"path": order_path})
+    assert status == 202
+    assert job["status"] == "queued"
+
+    job = _wait_job(server, job["id"])
+    assert job["status"] == "done"
+    assert len(job["result"]["results"]) > 0
+    assert Path(job["result"]["path_folder"]).is_dir()
+
+    content = base64.b64encode(Path(order_path).read_bytes()).decode()
+    status, upload = _request(
+        server,
+        "/jobs",
+        {"content": content, "file_name": "order.csv", "quote": True},
+    )
+    assert status == 202
+
+    upload = _wait_job(server, upload["id"])
+    assert upload["status"] == "done"
+    assert upload["result"]["quote"]["files_count"] == len(
+        job["result"]["results"]
+    )
+    # загруженный файл удаляется после обработки
+    assert not Path(upload["file"]).exists()
+
+    status, stats = _request(server, "/health")
+    assert status == 200
+    assert stats["jobs"]["done"] == 2
+
+    status, jobs = _request(server, "/jobs")
+    assert [j["id"] for j in jobs] == [job["id"], upload["id"]]
+
+
+def test_server__errors(server: OrderHttpServer, tmp_path: Path):
+    status, error = _request(server, "/jobs", {"options": {}})
+    assert status == 400
+    assert "error" in error
+
+    status, _ = _request(
+        server, "/jobs", {"path": "x.xlsx", "options": {"draw_workers": 0}}
+    )
+    assert status == 400
+
+    status, _ = _request(server, "/jobs/unknown")
+    assert status == 404
+
+    status, job = _request(server, "/jobs", {"path": str(tmp_path / "no.xlsx")})
+    assert status == 202
+    job = _wait_job(server, job["id"])
+    assert job["status"] == "failed"
+    assert job["error"]
+
+
+def test_jobs__queue_full(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, order_path: str
+):
+    started = threading.Event()
+    release = threading.Event()
+
+    def process_order(*_: Any) -> Any:
+        started.set()
+        release.wait(10)
+        raise RuntimeError("test")
+
+    monkeypatch.setattr(
+        "services.server.service.process_order", process_order
+    )
+    with OrderJobService(
+        max_workers=1, max_queue=1, upload_folder=str(tmp_path)
+    ) as jobs:
+        record = jobs.submit(OrderJobInputSchema(path=order_path))
+        started.wait(10)
+        with pytest.raises(ServerQueueFullError):
+            jobs.submit(OrderJobInputSchema(path=order_path))
+        release.set()
+
+    record = jobs.get(record.id)
+    assert record.status == "failed"
+    assert "RuntimeError" in record.error
@@ -0,0 +1,20 @@
+class LazyImportsSuccess:
+    """Кейсы: код режима не загружает тяжёлые модули других режимов."""
+
+    ReturnType = tuple[str, tuple[str, ...]]
+
+    def case_main(self) -> ReturnType:
+        """Запуск exe: до разбора аргументов только stdlib."""
+        return "import main", ("pydantic", "numpy", "ezdxf", "openpyxl")
+
+    def case_convert(self) -> ReturnType:
+        """Скрипт конвертации dxf."""
+        return "import scripts.convert", ("openpyxl", "pydantic")
+
+    def case_order(self) -> ReturnType:
+        """Обработка заказа потоковым чтением xlsx."""
+        return "import services.order.service", ("openpyxl",)
+
+    def case_startup_report(self) -> ReturnType:
+        """Отчёт времени запуска до замера."""
+        return "import services.startup.service", ("pydantic", "ezdxf")
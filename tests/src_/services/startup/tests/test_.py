@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest_cases import parametrize_with_cases
+from src_.services.startup.test_cases.t_cases import LazyImportsSuccess
+
+from services.startup.schemas.internal import StartupModuleInternal
+from services.startup.service import StartupTimeService
+
+
+SRC = Path(__file__).parents[5] / "src"
+# бюджет загрузки main (холодный запуск exe до разбора аргументов), сек
+STARTUP_BUDGET = 0.3
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+
+
+@parametrize_with_cases(argnames=["code", "modules"], cases=LazyImportsSuccess)
+def test_lazy_imports(code: str, modules: tuple[str, ...]):
+    result = _run_python(
+        "-c", f"{code}; import sys; print(*sys.modules, sep='\\n')"
+    )
+    loaded = {name.split(".")[0] for name in result.stdout.split()}
+
+    assert loaded.isdisjoint(modules), loaded.intersection(modules)
+
+
+def test_cold_start__budget():
+    # -X importtime: "import time: self [us] | cumulative | module"
+    result = _run_python("-X", "importtime", "-c", "import main")
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "main"
+    )
+
+    assert cumulative / 1_000_000 < STARTUP_BUDGET
+
+
+def test_startup_report():
+    modules = StartupTimeService().get_modules()
+
+    assert [m.name for m in modules] == [
+        name for name, _ in StartupTimeService.MODULES
+    ]
+    report = StartupTimeService.get_report(
+        [*modules, StartupModuleInternal("x", "", 0.5, loaded=False)]
+    )
+    assert report.splitlines()[-2].split()[:2] == ["x", "500.0"]
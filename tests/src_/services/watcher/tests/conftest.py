@@ -0,0 +1,30 @@
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# файл замеров заказа - как у сервера заказов
+from src_.services.server.tests.conftest import order_path  # noqa: F401
+
+from services.order.schemas.input import OrderOptionsInputSchema
+from services.server.service import OrderJobService
+
+
+@pytest.fixture
+def inbox(tmp_path: Path, order_path: str) -> Path:  # noqa: F811
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    shutil.copy(order_path, inbox / "order.csv")
+    (inbox / "bad.csv").write_text("x;y\n", encoding="utf-8")
+    return inbox
+
+
+@pytest.fixture
+def jobs(tmp_path: Path) -> Iterator[OrderJobService]:
+    with OrderJobService(
+        max_workers=1,
+        options=OrderOptionsInputSchema(use_cache=False),
+        upload_folder=str(tmp_path / "uploads"),
+    ) as jobs:
+        yield jobs
@@ -0,0 +1,91 @@
+import threading
+from pathlib import Path
+from time import sleep
+from typing import Any
+
+import pytest
+
+from services.server.schemas.output import OrderJobOutputSchema
+from services.server.service import OrderJobService
+from services.watcher.service import OrderWatchService
+
+
+def _poll_until(
+    watcher: OrderWatchService, count: int
+) -> list[OrderJobOutputSchema]:
+    finished: list[OrderJobOutputSchema] = []
+    for _ in range(200):
+        finished += watcher.poll()
+        if len(finished) >= count:
+            return finished
+        sleep(0.05)
+    raise AssertionError("Файлы не обработаны.")
+
+
+def test_watch__done_and_failed(inbox: Path, jobs: OrderJobService):
+    watcher = OrderWatchService(jobs, str(inbox), debounce=0)
+
+    finished = _poll_until(watcher, 2)
+
+    assert {Path(r.file).name: r.status for r in finished} == {
+        "bad.csv": "failed",
+        "order.csv": "done",
+    }
+    assert sorted(p.name for p in inbox.iterdir()) == ["done", "failed"]
+    assert [p.name for p in (inbox / "done").iterdir()] == ["order.csv"]
+    assert sorted(p.name for p in (inbox / "failed").iterdir()) == [
+        "bad.csv",
+        "bad.csv.error.txt",
+    ]
+
+    # повторно положенный файл обрабатывается, имя в done не перезаписывается
+    (inbox / "done" / "order.csv").rename(inbox / "order.csv")
+    (inbox / "done" / "order.csv").touch()
+    _poll_until(watcher, 1)
+    assert sorted(p.name for p in (inbox / "done").iterdir()) == [
+        "order.csv",
+        "order_1.csv",
+    ]
+
+
+def test_watch__debounce_and_lock(inbox: Path, jobs: OrderJobService):
+    watcher = OrderWatchService(jobs, str(inbox), debounce=60)
+    watcher.poll()
+    assert jobs.get_all() == []
+
+    # файл открыт в excel
+    (inbox / "bad.csv").unlink()
+    (inbox / "~$order.csv").touch()
+    watcher.debounce = 0
+    watcher.poll()
+    assert jobs.get_all() == []
+
+
+def test_watch__queue_full(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, inbox: Path
+):
+    release = threading.Event()
+
+    def process_order(*_: Any) -> Any:
+        release.wait(10)
+        raise RuntimeError("test")
+
+    monkeypatch.setattr(
+        "services.server.service.process_order", process_order
+    )
+    with OrderJobService(
+        max_workers=1, max_queue=1, upload_folder=str(tmp_path)
+    ) as jobs:
+        watcher = OrderWatchService(jobs, str(inbox), debounce=0)
+        watcher.poll()
+        # очередь заполнена: второй файл ждёт в папке
+        assert len(jobs.get_all()) == 1
+        assert len(list(inbox.glob("*.csv"))) == 2
+
+        release.set()
+        _poll_until(watcher, 2)
+
+    assert sorted(p.name for p in (inbox / "failed").glob("*.csv")) == [
+        "bad.csv",
+        "order.csv",
+    ]